@@ -0,0 +1,81 @@
+"""
+Conditional GET for endpoints computed from versioned tables.
+
+An endpoint's ETag is derived from the data versions of the tables it reads (see
+database.db_utils_sqlite.VERSIONED_TABLES), and its Last-Modified is the latest
+time one of them changed. A request whose If-None-Match (or, without one,
+If-Modified-Since) still matches gets a 304 after reading only data_versions, so
+polling an unchanged dashboard costs one small query instead of recomputing and
+resending the payload.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Iterable, Optional, Tuple
+
+from fastapi import Request, Response
+
+from app.infrastructure.database.executor import run_blocking
+from database.db_utils_sqlite import get_data_version_stamps
+
+# Clients may store responses but must revalidate them on every use
+DEFAULT_CACHE_CONTROL = "no-cache"
+
+# Tables each dashboard panel reads; model_risk_current is maintained from risk_assessments
+DASHBOARD_TABLES = {
+    "metrics": ("policies", "risk_assessments", "compliance_monitors"),
+    "compliance_status": ("compliance_monitors",),
+    "risk_distribution": ("risk_assessments", "risk_category_scores"),
+    "activities": ("activities",)
+}
+DASHBOARD_TABLES["bootstrap"] = tuple(sorted({table for tables in DASHBOARD_TABLES.values() for table in tables}))
+
+def version_validators(stamps: Dict[str, Dict], tables: Iterable[str]) -> Tuple[str, datetime]:
+    """
+    Build the ETag and Last-Modified time for data read from the given tables.
+
+    The ETag is weak because compression changes the bytes sent, not the data.
+    Change times are part of it so versions restarting in a new database do not
+    reproduce an old tag.
+    """
+    tables = sorted(tables)
+    key = "|".join(f"{table}:{stamps[table]['version']}:{stamps[table]['updated_at']}" for table in tables)
+    etag = f'W/"{hashlib.sha1(key.encode()).hexdigest()[:20]}"'
+    last_modified = max(datetime.strptime(stamps[table]['updated_at'], "%Y-%m-%dT%H:%M:%SZ") for table in tables)
+    return etag, last_modified.replace(tzinfo=timezone.utc)
+
+def is_not_modified(request: Request, etag: str, last_modified: datetime) -> bool:
+    """Evaluate If-None-Match, or If-Modified-Since when no If-None-Match was sent."""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # Weak comparison: W/"x" and "x" match
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in candidates or etag.removeprefix("W/") in candidates
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since:
+        try:
+            return last_modified <= parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+    return False
+
+async def conditional_response(request: Request, response: Response, tables: Iterable[str],
+                               cache_control: str = DEFAULT_CACHE_CONTROL) -> Optional[Response]:
+    """
+    Check a GET against the current versions of the tables it reads.
+
+    Returns:
+        A 304 response to return as is if the client's copy is current; otherwise
+        None, after setting ETag, Last-Modified and Cache-Control on response
+    """
+    stamps = await run_blocking(get_data_version_stamps)
+    etag, last_modified = version_validators(stamps, tables)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": format_datetime(last_modified, usegmt=True),
+        "Cache-Control": cache_control
+    }
+    if is_not_modified(request, etag, last_modified):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+    return None
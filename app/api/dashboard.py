@@ -0,0 +1,104 @@
+"""
+Dashboard panels built from already-read rows.
+
+The per-panel endpoints and /api/dashboard/bootstrap build their panels with the
+same functions, so the combined response is identical to the separate ones; the
+bootstrap endpoint only reads the rows once, from one snapshot (see
+database.db_utils_sqlite.get_dashboard_snapshot).
+"""
+from typing import Any, Dict, List
+
+from utils.constants import RISK_ASSESSMENT_AGENT_CONFIG
+
+# Colors for each compliance alert level
+ALERT_LEVEL_COLORS = {
+    'Normal': '#4caf50',
+    'Warning': '#ff9800',
+    'Critical': '#f44336'
+}
+
+def build_metrics(policy_count: int, risk_summary: Dict[str, Any], monitors: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Build the summary metrics panel.
+
+    Args:
+        policy_count: Number of policies
+        risk_summary: Current model risk summary (see get_model_risk_summary)
+        monitors: Compliance monitors with at least alert_level and status
+    """
+    # Average of each model's latest risk score, and its change since the previous assessments
+    avg_risk_score = risk_summary['avg_risk_score'] or 0
+    delta_risk = round(avg_risk_score - (risk_summary['avg_previous_risk_score'] or 0), 2)
+
+    # Compliance rate calculation
+    compliant_monitors = [m for m in monitors if m['alert_level'] == 'Normal' and m['status'] == 'Active']
+    active_monitors = [m for m in monitors if m['status'] == 'Active']
+    compliance_rate = len(compliant_monitors) / len(active_monitors) if active_monitors else 1
+
+    # Calculate changes over time (dummy values for now)
+    delta_policy = 2  # Increase of 2 policies
+    delta_compliance = 0.03  # Increase in compliance rate (good)
+    delta_monitors = 1  # Added 1 new monitor
+
+    return {
+        "policy_count": policy_count,
+        "avg_risk_score": round(avg_risk_score, 2),
+        "compliance_rate": round(compliance_rate, 2),
+        "active_monitors": len(active_monitors),
+        "deltas": {
+            "policy_count": delta_policy,
+            "avg_risk_score": delta_risk,
+            "compliance_rate": delta_compliance,
+            "active_monitors": delta_monitors
+        }
+    }
+
+def build_compliance_status_chart(monitors: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the compliance status chart: monitors counted by alert level."""
+    alert_levels = {}
+    for monitor in monitors:
+        level = monitor['alert_level']
+        alert_levels[level] = alert_levels.get(level, 0) + 1
+
+    labels = list(alert_levels.keys())
+    return {
+        "labels": labels,
+        "datasets": [{
+            "data": list(alert_levels.values()),
+            "backgroundColor": [ALERT_LEVEL_COLORS.get(label, '#999') for label in labels]
+        }]
+    }
+
+def build_risk_distribution_chart(distribution: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the risk distribution radar chart from get_risk_category_distribution's result."""
+    # Keep the configured category order; values are scaled to 0-1 for the radar chart
+    present = {row['category']: row for row in distribution['categories']}
+    risk_categories = [c for c in RISK_ASSESSMENT_AGENT_CONFIG["risk_categories"] if c in present]
+    risk_categories += sorted(c for c in present if c not in risk_categories)
+
+    data = [{
+        "label": f"Average ({len(distribution['models'])} models)",
+        "data": [round(present[c]['average_score'] / 100.0, 4) for c in risk_categories],
+        "backgroundColor": "rgba(255, 99, 132, 0.2)",
+        "borderColor": "rgb(255, 99, 132)",
+        "pointBackgroundColor": "rgb(255, 99, 132)",
+        "pointBorderColor": "#fff",
+        "pointHoverBackgroundColor": "#fff",
+        "pointHoverBorderColor": "rgb(255, 99, 132)"
+    }]
+    for i, model in enumerate(distribution['models']):
+        data.append({
+            "label": model['model_name'],
+            "data": [round(model['scores'].get(c, 0.0) / 100.0, 4) for c in risk_categories],
+            "backgroundColor": f"rgba(54, 162, 235, {round(0.2 + (i % 5) * 0.15, 2)})",
+            "borderColor": f"rgb(54, 162, 235)",
+            "pointBackgroundColor": f"rgb(54, 162, 235)",
+            "pointBorderColor": "#fff",
+            "pointHoverBackgroundColor": "#fff",
+            "pointHoverBorderColor": f"rgb(54, 162, 235)"
+        })
+
+    return {
+        "labels": risk_categories,
+        "datasets": data
+    }
@@ -23,15 +23,61 @@ class PolicyResponse(BaseResponse):
     content: str
     updated_at: Optional[datetime] = None
 
+class PolicyRecommendationResponse(BaseModel):
+    category: str
+    title: str
+    description: str
+    priority: str
+
+class PolicyGapAnalysisResponse(BaseModel):
+    gaps: List[str]
+    category_counts: Dict[str, Dict[str, int]]
+    recommendations: List[PolicyRecommendationResponse]
+
+class NearDuplicatePolicyResponse(BaseModel):
+    id: int
+    title: str
+    category: Optional[str] = None
+    status: Optional[str] = None
+    updated_at: Optional[datetime] = None
+    similarity: float
+
+class PolicyPackRequest(BaseModel):
+    system_names: List[str]
+    # Defaults to every policy category
+    categories: Optional[List[str]] = None
+
 # Risk Assessment Models
 class RiskAssessmentRequest(BaseModel):
     title: str
     model_name: str
-    risk_score: float
+    # Scored from the findings by the risk scoring engine when omitted
+    risk_score: Optional[float] = None
     findings: str
     recommendations: str
     status: str = "Pending"
 
+class ModelRiskResponse(BaseModel):
+    model_name: str
+    assessment_id: int
+    title: str
+    risk_score: float
+    status: str
+    created_at: datetime
+    previous_assessment_id: Optional[int] = None
+    previous_risk_score: Optional[float] = None
+    risk_delta: Optional[float] = None
+    assessment_count: int
+
+class RiskWeightsRequest(BaseModel):
+    weights: Dict[str, float] = Field(default_factory=dict)
+
+class RiskRescoreResponse(BaseModel):
+    updated: int
+    weights: Dict[str, float]
+    average_risk_score: float
+    elapsed_ms: float
+
 class RiskAssessmentResponse(BaseResponse):
     title: str
     model_name: str
@@ -39,6 +85,15 @@ class RiskAssessmentResponse(BaseResponse):
     findings: str
     recommendations: str
     status: str
+    # "engine" if the score was computed (and follows weight changes), "manual" if entered
+    score_source: str = "manual"
+
+class HighRiskAssessmentsResponse(BaseModel):
+    items: List[RiskAssessmentResponse]
+    total: int
+    threshold: float
+    limit: int
+    offset: int
 
 # Compliance Monitor Models
 class ComplianceMonitorRequest(BaseModel):
@@ -80,6 +135,37 @@ class ReportResponse(BaseResponse):
     insights: str
     status: str
 
+class ReportScheduleRequest(BaseModel):
+    name: str = Field(..., min_length=1, max_length=100)
+    report_type: str
+    # "daily" or "weekly"
+    frequency: str = "daily"
+    # Days each run covers; defaults to the days between runs
+    period_days: Optional[int] = Field(None, ge=1, le=366)
+    # Local time of day, HH:MM
+    run_time: str = "06:00"
+    enabled: bool = True
+
+class ReportScheduleUpdate(BaseModel):
+    enabled: bool
+
+class ReportScheduleResponse(BaseResponse):
+    name: str
+    report_type: str
+    frequency: str
+    period_days: int
+    run_time: str
+    enabled: bool
+    next_run_at: datetime
+    last_run_at: Optional[datetime] = None
+    last_job_id: Optional[str] = None
+
+class DailyRollupsResponse(BaseModel):
+    start_day: str
+    end_day: str
+    compliance: List[Dict[str, Any]]
+    risk: List[Dict[str, Any]]
+
 # Activity Model
 class ActivityResponse(BaseResponse):
     activity_type: str
@@ -115,4 +201,34 @@ class DatasetResponse(BaseModel):
 
 class ChartDataResponse(BaseModel):
     labels: List[str]
-    datasets: List[Dict[str, Any]]
\ No newline at end of file
+    datasets: List[Dict[str, Any]]
+
+class DashboardBootstrapResponse(BaseModel):
+    metrics: DashboardMetricsResponse
+    compliance_status: ChartDataResponse
+    risk_distribution: ChartDataResponse
+    activities: List[ActivityResponse]
+
+# Export Models
+class ColumnarExportRequest(BaseModel):
+    # Defaults to every exportable table
+    tables: Optional[List[str]] = None
+    # Discard existing files and watermarks and export every row
+    full: bool = False
+    # "parquet" or "arrow"; defaults to each table's existing export format, else parquet
+    file_format: Optional[str] = None
+
+# Job Models
+class JobStatusResponse(BaseModel):
+    job_id: str
+    kind: str
+    status: str
+    total: int
+    completed: int
+    payload: Dict[str, Any] = {}
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    cancel_requested: bool = False
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
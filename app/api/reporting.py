@@ -1,22 +1,67 @@
-from fastapi import FastAPI, HTTPException
-from fastapi.routing import APIRoute
+from datetime import date
+from typing import Optional
+
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel, Field
 
-app = FastAPI()
+from app.infrastructure.container import container
+from app.infrastructure.database.executor import run_blocking
+
+# Mounted by main.py; used by the Streamlit reporting page
+router = APIRouter(prefix="/reporting")
 
 class ReportCreate(BaseModel):
     title: str = Field(..., min_length=1, max_length=100)
-    report_type: str = Field(..., regex="^(Comprehensive|Governance|Risk Assessment|Compliance)$")
+    # Any configured report type or a recognizable short name such as "Risk Assessment"
+    report_type: str = Field(..., min_length=1, max_length=100)
     description: str = Field(..., min_length=1, max_length=500)
+    status: str = "Draft"
+    # Period covered by period report types (e.g. "Compliance Trend Report"); defaults to the last 30 days
+    start_day: Optional[date] = None
+    end_day: Optional[date] = None
+    # Queue the report as a background job instead of building it within the request
+    background: bool = False
+
+@router.get("/reports")
+async def list_reports():
+    try:
+        return {"items": await run_blocking(container.get('reporting_agent').report_repository.get_all)}
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
 
-@app.post("/generate")
-async def generate_report(report: ReportCreate):
+@router.post("/generate")
+async def generate_report(report: ReportCreate, response: Response):
     # Validate input
-    if not report.title or not report.description:
-        raise HTTPException(status_code=400, message="Title and description are required")
+    if not report.title.strip() or not report.description.strip():
+        raise HTTPException(status_code=400, detail="Title and description are required")
 
+    reporting_agent = container.get('reporting_agent')
     try:
-        # Generate report logic here
-        return {"message": "Report generated", "report": report.dict()}
+        report_type = reporting_agent.resolve_report_type(report.report_type)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    start_day = report.start_day.isoformat() if report.start_day else None
+    end_day = report.end_day.isoformat() if report.end_day else None
+    if start_day and end_day and start_day > end_day:
+        raise HTTPException(status_code=400, detail="start_day must not be after end_day")
+
+    try:
+        if report.background:
+            response.status_code = 202
+            job = await run_blocking(container.get('job_queue').submit, "report", {
+                "title": report.title,
+                "description": report.description,
+                "report_type": report_type,
+                "status": report.status,
+                "start_day": start_day,
+                "end_day": end_day
+            }, total=len(reporting_agent.section_keys(report_type)))
+            return {"message": "Report generation queued", "job": job}
+
+        result = await run_blocking(
+            reporting_agent.create_report, report.title, report.description, report_type, report.status, start_day=start_day, end_day=end_day
+        )
+        return {"message": "Report generated", **result}
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        raise HTTPException(status_code=500, detail=str(e))
@@ -1,15 +1,64 @@
+import functools
 import random
-from typing import List, Dict, Any, Optional
+from typing import Callable, List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from app.domain.models import Policy
 from app.domain.repositories import PolicyRepository
+from app.infrastructure.ai.templates import TemplateRegistry
 from utils.ai_utils import AiUtils
 
+DEFAULT_POLICY_SCOPE = "all AI systems developed or used by the organization"
+
+# Policy text templates, compiled once at import
+POLICY_TEMPLATES = TemplateRegistry()
+POLICY_TEMPLATES.register("title", "{category} Policy for AI Systems")
+POLICY_TEMPLATES.register("system_title", "{category} Policy for {system_name}")
+POLICY_TEMPLATES.register("system_scope", "the {system_name} AI system")
+POLICY_TEMPLATES.register("prompt", "Policy for {category} in AI systems:")
+POLICY_TEMPLATES.register("document", """
+        # {title}
+        
+        ## Purpose
+        This policy establishes guidelines for {category_lower} in AI systems.
+        
+        ## Scope
+        This policy applies to {scope}.
+        
+        ## Requirements
+        1. All AI systems must be reviewed for {category_lower} concerns.
+        2. Documentation must include {category_lower} considerations.
+        3. Regular audits will be conducted to ensure compliance.
+        
+        ## Responsibilities
+        - Data Scientists: Implement technical controls
+        - AI Ethics Board: Review and approve AI systems
+        - Management: Ensure resources for compliance
+        
+        ## Compliance Measurement
+        Compliance will be measured through regular audits and assessments.
+        """)
+
+@functools.lru_cache(maxsize=1024)
+def render_policy_text(category: str, system_name: Optional[str] = None) -> Tuple[str, str, str]:
+    """Render the (title, generation prompt, policy document) of a category, memoized per category and system."""
+    if system_name:
+        title = POLICY_TEMPLATES.render("system_title", category=category, system_name=system_name)
+        scope = POLICY_TEMPLATES.render("system_scope", system_name=system_name)
+    else:
+        title = POLICY_TEMPLATES.render("title", category=category)
+        scope = DEFAULT_POLICY_SCOPE
+    prompt = POLICY_TEMPLATES.render("prompt", category=category)
+    document = POLICY_TEMPLATES.render("document", title=title, category_lower=category.lower(), scope=scope)
+    return title, prompt, document
+
 class GovernanceAgent:
-    def __init__(self, policy_repository: PolicyRepository):
+    def __init__(self, policy_repository: Optional[PolicyRepository] = None):
         """Initialize the Governance Agent with rule-based AI capabilities."""
         # Store the repository dependency
+        if policy_repository is None:
+            from app.infrastructure.database.sqlite_repositories import SQLitePolicyRepository
+            policy_repository = SQLitePolicyRepository()
         self.policy_repository = policy_repository
         
         # Initialize the text generation for policy creation
@@ -41,45 +90,20 @@ class GovernanceAgent:
             "Human Oversight": "This policy defines requirements for human supervision and intervention in automated AI decision-making processes."
         }
 
-    def generate_policy(self, category: Optional[str] = None) -> Policy:
-        """Generate a new governance policy using NLP, with optional category specification."""
+    def generate_policy(self, category: Optional[str] = None, system_name: Optional[str] = None) -> Policy:
+        """Generate a new governance policy using NLP, with optional category and AI system specification."""
         # Select a category if not provided
         if not category:
             category = random.choice(self.policy_categories)
         
-        # Create a title based on the category
-        title = f"{category} Policy for AI Systems"
+        # Render the title, prompt and document for the category and, when given, the system it governs
+        title, prompt, document = render_policy_text(category, system_name)
         
         # Get the template description for the category
         description = self.policy_templates.get(category, "")
         
-        # Generate policy content using AiUtils
-        prompt = f"Policy for {category} in AI systems:"
-        fallback_content = f"""
-        # {title}
-        
-        ## Purpose
-        This policy establishes guidelines for {category.lower()} in AI systems.
-        
-        ## Scope
-        This policy applies to all AI systems developed or used by the organization.
-        
-        ## Requirements
-        1. All AI systems must be reviewed for {category.lower()} concerns.
-        2. Documentation must include {category.lower()} considerations.
-        3. Regular audits will be conducted to ensure compliance.
-        
-        ## Responsibilities
-        - Data Scientists: Implement technical controls
-        - AI Ethics Board: Review and approve AI systems
-        - Management: Ensure resources for compliance
-        
-        ## Compliance Measurement
-        Compliance will be measured through regular audits and assessments.
-        """
-        
-        # Use our rule-based text generation through AiUtils
-        content = AiUtils.generate_text(prompt, self.text_generator, fallback_content)
+        # Use our rule-based text generation through AiUtils, keeping the rendered document when no prompt template matches
+        content = AiUtils.generate_text(prompt, self.text_generator) or document
         
         # Create the policy object
         policy = Policy(
@@ -98,12 +122,69 @@ class GovernanceAgent:
         """Save a policy to the database."""
         return self.policy_repository.create(policy)
     
+    def generate_policy_pack(self, system_names: List[str], categories: Optional[List[str]] = None,
+                             progress: Optional[Callable[[int], None]] = None) -> List[Policy]:
+        """
+        Generate one policy per category for each AI system.
+        
+        Rendering is CPU-bound Python (and render_policy_text is memoized), so the
+        policies are generated in a plain loop; threads would only contend for the GIL.
+        
+        Args:
+            system_names: The AI systems to cover
+            categories: Policy categories to generate (defaults to all policy categories)
+            progress: Optional callback receiving the number of policies generated so far
+            
+        Returns:
+            The generated policies, ordered by system and then category
+            
+        Raises:
+            ValueError: If a category is unknown
+        """
+        categories = categories or self.policy_categories
+        unknown = [c for c in categories if c not in self.policy_categories]
+        if unknown:
+            raise ValueError(f"Unknown policy categories: {unknown}")
+        
+        policies = []
+        for system_name in system_names:
+            for category in categories:
+                policies.append(self.generate_policy(category, system_name))
+                if progress:
+                    progress(len(policies))
+        return policies
+    
+    def save_policy_pack(self, policies: List[Policy], system_names: List[str]) -> List[int]:
+        """Save a generated policy pack in one transaction with a single aggregated activity."""
+        description = f"Generated policy pack: {len(policies)} policies for {len(system_names)} AI systems"
+        return self.policy_repository.create_many(policies, description)
+    
+    def create_policy_pack(self, system_names: List[str], categories: Optional[List[str]] = None,
+                           progress: Optional[Callable[[int], None]] = None) -> Dict[str, Any]:
+        """Generate and save a policy pack, returning the new policy IDs."""
+        policies = self.generate_policy_pack(system_names, categories, progress=progress)
+        policy_ids = self.save_policy_pack(policies, system_names)
+        return {
+            "policy_ids": policy_ids,
+            "systems": list(system_names),
+            "categories": list(categories or self.policy_categories)
+        }
+    
     def update_policy(self, policy: Policy) -> bool:
         """Update an existing policy in the database."""
         return self.policy_repository.update(policy)
     
-    def analyze_policy_gaps(self, existing_policies: List[Dict[str, Any]]) -> List[str]:
-        """Analyze existing policies to identify governance gaps."""
+    def analyze_policy_gaps(self, existing_policies: Optional[List[Dict[str, Any]]] = None) -> List[str]:
+        """
+        Analyze existing policies to identify governance gaps.
+        
+        Without a policy list, the repository's per-category active-policy counters are
+        read instead, so the analysis is O(categories) and never scans the policies.
+        """
+        if existing_policies is None:
+            counts = self.policy_repository.get_category_counts()
+            return [c for c in self.policy_categories if counts.get(c, {}).get('active', 0) == 0]
+        
         # Extract categories from existing policies
         existing_categories = set([p.get('category', '') for p in existing_policies])
         
@@ -112,7 +193,7 @@ class GovernanceAgent:
         
         return missing_categories
     
-    def generate_policy_recommendations(self, existing_policies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    def generate_policy_recommendations(self, existing_policies: Optional[List[Dict[str, Any]]] = None) -> List[Dict[str, Any]]:
         """Generate policy recommendations based on gap analysis."""
         missing_categories = self.analyze_policy_gaps(existing_policies)
         
@@ -125,4 +206,4 @@ class GovernanceAgent:
                 "priority": "High" if category in ["Data Privacy", "Ethical AI", "Bias Mitigation"] else "Medium"
             })
         
-        return recommendations
\ No newline at end of file
+        return recommendations
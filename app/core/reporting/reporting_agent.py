@@ -0,0 +1,274 @@
+import logging
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.core.reporting.sections import PERIOD_SECTION_BUILDERS, SECTION_BUILDERS, SECTION_TABLES
+from app.domain.models import Activity, Report
+from app.domain.repositories import ActivityRepository, ReportRepository
+from utils.constants import REPORTING_AGENT_CONFIG
+
+logger = logging.getLogger('aigovernance.reporting')
+
+# Keywords that map the report type names used by the UI and older records to a configured type
+REPORT_TYPE_KEYWORDS = [
+    ("trend", "Compliance Trend Report"),
+    ("comprehensive", "Comprehensive Governance Report"),
+    ("risk", "Risk Assessment Overview"),
+    ("compliance", "Compliance Status"),
+    ("governance", "Governance Summary")
+]
+
+class SectionCache:
+    """
+    Thread-safe LRU cache of built report sections.
+    
+    Entries are keyed by section and the data versions of the tables the section
+    reads, so a write to any of those tables makes the cached section unreachable
+    rather than needing an explicit invalidation.
+    """
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._entries: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(section_key: str, versions: Dict[str, int]) -> Tuple:
+        return (section_key,) + tuple(versions.get(table, 0) for table in SECTION_TABLES[section_key])
+
+    def get(self, section_key: str, versions: Dict[str, int]) -> Optional[Dict[str, Any]]:
+        key = self.key(section_key, versions)
+        with self._lock:
+            section = self._entries.get(key)
+            if section is not None:
+                self._entries.move_to_end(key)
+            return section
+
+    def put(self, section_key: str, versions: Dict[str, int], section: Dict[str, Any]) -> None:
+        with self._lock:
+            self._entries[self.key(section_key, versions)] = section
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+class ReportingAgent:
+    def __init__(self, report_repository: Optional[ReportRepository] = None,
+                 activity_repository: Optional[ActivityRepository] = None,
+                 max_workers: Optional[int] = None):
+        """Initialize the Reporting Agent with the section builder pipeline."""
+        if report_repository is None or activity_repository is None:
+            from app.infrastructure.database.sqlite_repositories import (
+                SQLiteReportRepository, SQLiteActivityRepository
+            )
+            report_repository = report_repository or SQLiteReportRepository()
+            activity_repository = activity_repository or SQLiteActivityRepository()
+        self.report_repository = report_repository
+        self.activity_repository = activity_repository
+        self.section_builders = dict(SECTION_BUILDERS)
+        self.report_sections = REPORTING_AGENT_CONFIG["report_sections"]
+        self.period_report_sections = REPORTING_AGENT_CONFIG["period_report_sections"]
+        self.max_workers = max_workers or len(self.section_builders)
+        self.section_cache = SectionCache(REPORTING_AGENT_CONFIG["section_cache_size"])
+
+    def resolve_report_type(self, report_type: str) -> str:
+        """
+        Map a report type name (e.g. "Risk Assessment" or "governance_summary") to a configured report type.
+
+        Raises:
+            ValueError: If the name matches no report type
+        """
+        if report_type in self.report_sections or report_type in self.period_report_sections:
+            return report_type
+        normalized = report_type.lower().replace("_", " ")
+        for keyword, canonical in REPORT_TYPE_KEYWORDS:
+            if keyword in normalized:
+                return canonical
+        raise ValueError(f"Unknown report type: {report_type}")
+
+    def section_keys(self, report_type: str) -> List[str]:
+        """Sections built for a configured report type, in report order."""
+        return self.report_sections.get(report_type) or self.period_report_sections[report_type]
+
+    def build_sections(self, snapshot: Dict[str, Any], section_keys: List[str],
+                       progress: Optional[Callable[[int], None]] = None,
+                       builders: Optional[Dict[str, Callable]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Run section builders concurrently against one snapshot.
+
+        A builder that raises is logged and replaced by a placeholder section
+        marked with "error", so one broken section does not sink the report.
+
+        Args:
+            snapshot: Report data read in one transaction
+            section_keys: Builders to run
+            progress: Optional callback receiving the number of sections built so far
+            builders: Builders by section key (defaults to the snapshot section builders)
+
+        Returns:
+            Section key -> built section (with its build time in "elapsed_ms"), in the requested order
+        """
+        builders = builders or self.section_builders
+
+        def timed(key):
+            start = time.perf_counter()
+            try:
+                section = builders[key](snapshot)
+            except Exception as e:
+                logger.exception("Report section %s failed", key)
+                title = key.replace("_", " ").title()
+                section = {"title": title, "content": f"## {title}\n\n_This section could not be built: {e}_",
+                           "insights": [], "error": str(e)}
+            section["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+            return section
+
+        sections = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(self.max_workers, len(section_keys)))) as pool:
+            futures = [(key, pool.submit(timed, key)) for key in section_keys]
+            for done, (key, future) in enumerate(futures, 1):
+                sections[key] = future.result()
+                if progress:
+                    progress(done)
+        return sections
+
+    def generate_report(self, title: str, description: str, report_type: str, status: str = "Draft",
+                        progress: Optional[Callable[[int], None]] = None) -> Dict[str, Any]:
+        """
+        Build an unsaved report from a fresh snapshot.
+        
+        Sections whose input tables are unchanged since they were last built are
+        reused from the section cache; only the snapshot parts needed by the other
+        sections are read, and only those sections are rebuilt.
+
+        Returns:
+            {"report": Report, "sections": [...], "cached_sections": [...],
+             "timings": {"snapshot": ms, rebuilt section: ms, ...}, "snapshot_taken_at": str}
+        """
+        report_type = self.resolve_report_type(report_type)
+        section_keys = self.report_sections[report_type]
+        cached = {}
+
+        def select_tables(versions):
+            # Runs inside the snapshot transaction, so hits are checked against the versions being read
+            tables = set()
+            for key in section_keys:
+                section = self.section_cache.get(key, versions)
+                if section is None:
+                    tables.update(SECTION_TABLES[key])
+                else:
+                    cached[key] = section
+            return tables
+
+        start = time.perf_counter()
+        snapshot = self.report_repository.get_snapshot(select_tables)
+        timings = {"snapshot": round((time.perf_counter() - start) * 1000, 3)}
+
+        stale_keys = [key for key in section_keys if key not in cached]
+        built = self.build_sections(
+            snapshot, stale_keys, progress and (lambda done: progress(len(cached) + done))
+        )
+        for key, section in built.items():
+            if "error" not in section:
+                self.section_cache.put(key, snapshot['data_versions'], section)
+            timings[key] = section["elapsed_ms"]
+        if progress and not stale_keys:
+            progress(len(cached))
+        sections = [cached.get(key) or built[key] for key in section_keys]
+        report = self._assemble_report(
+            title, description, report_type, status, sections,
+            f"Data as of {snapshot['taken_at'][:19].replace('T', ' ')}"
+        )
+        return {
+            "report": report,
+            "sections": list(section_keys),
+            "cached_sections": list(cached),
+            "timings": timings,
+            "snapshot_taken_at": snapshot['taken_at']
+        }
+
+    def generate_period_report(self, title: str, description: str, report_type: str, start_day: str, end_day: str,
+                               status: str = "Draft", progress: Optional[Callable[[int], None]] = None) -> Dict[str, Any]:
+        """
+        Build an unsaved report of a period type from the daily rollups of start_day..end_day (ISO days).
+
+        Returns:
+            The same shape as generate_report, with nothing cached
+        """
+        report_type = self.resolve_report_type(report_type)
+        start = time.perf_counter()
+        rollups = self.report_repository.get_daily_rollups(start_day, end_day)
+        timings = {"snapshot": round((time.perf_counter() - start) * 1000, 3)}
+
+        section_keys = self.period_report_sections[report_type]
+        built = self.build_sections(rollups, section_keys, progress, PERIOD_SECTION_BUILDERS)
+        timings.update({key: section["elapsed_ms"] for key, section in built.items()})
+        report = self._assemble_report(
+            title, description, report_type, status, list(built.values()), f"Period {start_day} to {end_day}"
+        )
+        return {
+            "report": report,
+            "sections": list(section_keys),
+            "cached_sections": [],
+            "timings": timings,
+            "snapshot_taken_at": datetime.now().isoformat()
+        }
+
+    def _assemble_report(self, title: str, description: str, report_type: str, status: str,
+                         sections: List[Dict[str, Any]], subtitle: str) -> Report:
+        header = [f"# {title}", "", description, "", f"_{subtitle}_"]
+        content = "\n\n".join(["\n".join(header)] + [section["content"] for section in sections])
+        insights = [text for section in sections for text in section["insights"]]
+        return Report(
+            title=title,
+            description=description,
+            report_type=report_type,
+            created_at=datetime.now(),
+            content=content,
+            insights="\n".join(["## Key Insights", ""] + [f"- {text}" for text in insights]),
+            status=status
+        )
+
+    def create_report(self, title: str, description: str, report_type: str, status: str = "Draft",
+                      progress: Optional[Callable[[int], None]] = None, start_day: Optional[str] = None,
+                      end_day: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Generate and save a report, recording its section timings, and return a summary.
+
+        Period report types cover start_day..end_day, by default the configured
+        number of days up to today; other types ignore the period.
+        """
+        start = time.perf_counter()
+        report_type = self.resolve_report_type(report_type)
+        if report_type in self.period_report_sections:
+            end_day = end_day or date.today().isoformat()
+            start_day = start_day or (
+                date.fromisoformat(end_day) - timedelta(days=REPORTING_AGENT_CONFIG["default_period_days"] - 1)
+            ).isoformat()
+            generated = self.generate_period_report(title, description, report_type, start_day, end_day, status, progress)
+        else:
+            generated = self.generate_report(title, description, report_type, status, progress)
+        report = generated["report"]
+        report_id = self.report_repository.create(report)
+        self.report_repository.save_section_timings(report_id, generated["timings"])
+        self.activity_repository.log(Activity(
+            activity_type="create_report",
+            description=f"Generated report: {report.title}",
+            created_at=datetime.now(),
+            actor="Reporting Agent",
+            related_entity_id=report_id,
+            related_entity_type="report"
+        ))
+        return {
+            "report_id": report_id,
+            "report_type": report.report_type,
+            "sections": generated["sections"],
+            "cached_sections": generated["cached_sections"],
+            "timings_ms": generated["timings"],
+            "total_ms": round((time.perf_counter() - start) * 1000, 3),
+            "snapshot_taken_at": generated["snapshot_taken_at"]
+        }
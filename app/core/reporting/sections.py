@@ -0,0 +1,262 @@
+"""
+Report section builders.
+
+Each builder turns a report snapshot (see ReportRepository.get_snapshot) into one
+section: a markdown block for reports.content and a list of insight sentences for
+reports.insights. Builders only read the snapshot and never each other's output,
+so the reporting agent can run them concurrently.
+
+Period builders do the same from the daily rollups of a date range
+(ReportRepository.get_daily_rollups), so a report over N days reads N rollup
+rows per table rather than the raw history.
+"""
+from collections import Counter
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.constants import GOVERNANCE_AGENT_CONFIG, RISK_ASSESSMENT_AGENT_CONFIG
+
+# Risk score at or above which a model is called out as high risk
+HIGH_RISK_THRESHOLD = 75.0
+
+def _governance_gaps(snapshot: Dict[str, Any]) -> List[str]:
+    active = {row['category']: row['active_count'] for row in snapshot['policy_category_counts']}
+    return [c for c in GOVERNANCE_AGENT_CONFIG["policy_categories"] if not active.get(c)]
+
+def _attention_monitors(snapshot: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [m for m in snapshot['compliance_monitors'] if m['status'] == 'Active' and m['alert_level'] != 'Normal']
+
+def build_governance_summary(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """Policy counts, coverage of the governance categories and recent policy changes."""
+    policies = snapshot['policies']
+    statuses = Counter(p['status'] for p in policies)
+    categories = sorted({p['category'] for p in policies if p['category']})
+    gaps = _governance_gaps(snapshot)
+
+    lines = [
+        "## Governance Summary", "",
+        f"- **Total Policies**: {len(policies)}",
+        f"- **Active Policies**: {statuses.get('Active', 0)}",
+        f"- **Draft Policies**: {statuses.get('Draft', 0)}",
+        f"- **Policy Categories**: {', '.join(categories) if categories else 'None'}",
+        f"- **Categories Without an Active Policy**: {', '.join(gaps) if gaps else 'None'}",
+        "", "### Recent Policy Updates"
+    ]
+    lines += [f"- {p['title']} ({p['status']}, updated {(p['updated_at'] or '')[:10]})" for p in policies[:5]] or ["- None"]
+
+    insights = []
+    if gaps:
+        insights.append(f"{len(gaps)} of {len(GOVERNANCE_AGENT_CONFIG['policy_categories'])} governance categories "
+                        f"lack an active policy: {', '.join(gaps)}.")
+    if statuses.get('Draft'):
+        insights.append(f"Draft policies awaiting review: {statuses['Draft']}.")
+    return {"title": "Governance Summary", "content": "\n".join(lines), "insights": insights}
+
+def build_risk_overview(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """Risk distribution over each model's latest assessment, top risks and trends."""
+    models = snapshot['model_risk']
+    scores = [m['risk_score'] for m in models if m['risk_score'] is not None]
+    average = sum(scores) / len(scores) if scores else 0.0
+    levels = Counter(m['status'] for m in models)
+
+    lines = [
+        "## Risk Overview", "",
+        f"- **Models Assessed**: {len(models)}",
+        f"- **Average Risk Score**: {average:.1f}",
+        "- **Risk Distribution**:"
+    ]
+    lines += [f"  - {level}: {levels.get(level, 0)} models" for level, _ in RISK_ASSESSMENT_AGENT_CONFIG["risk_levels"]]
+    lines += ["", "### Highest Risk Models"]
+    for m in models[:5]:
+        trend = f", {m['risk_delta']:+.1f} since previous" if m['risk_delta'] is not None else ""
+        lines.append(f"- {m['model_name']}: {m['risk_score']:.1f} ({m['status']}{trend})")
+    if not models:
+        lines.append("- None")
+    if snapshot['risk_categories']:
+        lines += ["", "### Risk Categories"]
+        lines += [f"- {c['category']}: average {c['average_score']:.1f}, max {c['max_score']:.1f}"
+                  for c in snapshot['risk_categories']]
+
+    insights = []
+    high_risk = [m for m in models if m['risk_score'] is not None and m['risk_score'] >= HIGH_RISK_THRESHOLD]
+    if high_risk:
+        insights.append(f"{len(high_risk)} models are at or above a risk score of {HIGH_RISK_THRESHOLD:.0f}; "
+                        f"highest is {high_risk[0]['model_name']} at {high_risk[0]['risk_score']:.1f}.")
+    rising = [m for m in models if (m['risk_delta'] or 0) > 0]
+    if rising:
+        insights.append(f"Risk increased since the previous assessment for {', '.join(m['model_name'] for m in rising)}.")
+    if snapshot['risk_categories']:
+        top = snapshot['risk_categories'][0]
+        insights.append(f"{top['category']} is the highest average risk category ({top['average_score']:.1f}).")
+    return {"title": "Risk Overview", "content": "\n".join(lines), "insights": insights}
+
+def build_compliance_status(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """Monitor coverage, compliance rate and monitors needing attention."""
+    monitors = snapshot['compliance_monitors']
+    active = [m for m in monitors if m['status'] == 'Active']
+    attention = _attention_monitors(snapshot)
+    rate = (len(active) - len(attention)) / len(active) if active else 1.0
+
+    lines = [
+        "## Compliance Status", "",
+        f"- **Active Monitors**: {len(active)}",
+        f"- **Compliance Rate**: {rate:.0%}",
+        f"- **Alerts**: {sum(m['alert_level'] == 'Critical' for m in attention)} critical, "
+        f"{sum(m['alert_level'] == 'Warning' for m in attention)} warning",
+        "", "### Monitors Requiring Attention"
+    ]
+    lines += [
+        f"- {m['name']} ({m['model_or_system']}): {m['alert_level']}, current {m['current_value']} vs threshold {m['threshold_value']}"
+        for m in attention
+    ] or ["- None"]
+
+    insights = []
+    critical = [m for m in attention if m['alert_level'] == 'Critical']
+    if critical:
+        insights.append(f"Critical compliance alerts on {', '.join(m['model_or_system'] for m in critical)}.")
+    if active:
+        insights.append(f"{len(active) - len(attention)} of {len(active)} active monitors are within thresholds ({rate:.0%}).")
+    return {"title": "Compliance Status", "content": "\n".join(lines), "insights": insights}
+
+def build_insights(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """Cross-cutting recommendations drawn from governance gaps, high risks and compliance alerts."""
+    recommendations = [f"Adopt an active {category} policy." for category in _governance_gaps(snapshot)]
+    recommendations += [
+        f"Prioritize mitigation for {m['model_name']} ({m['status']}, score {m['risk_score']:.1f})."
+        for m in snapshot['model_risk']
+        if m['risk_score'] is not None and m['risk_score'] >= HIGH_RISK_THRESHOLD
+    ]
+    recommendations += [
+        f"Investigate {m['name']} on {m['model_or_system']} ({m['alert_level']} alert)."
+        for m in _attention_monitors(snapshot)
+    ]
+
+    lines = ["## Key Insights and Recommendations", ""]
+    lines += [f"{i}. {text}" for i, text in enumerate(recommendations, 1)] or ["No outstanding governance actions were identified."]
+    return {"title": "Key Insights and Recommendations", "content": "\n".join(lines), "insights": []}
+
+# Tables each section's snapshot inputs are read from; a built section stays valid
+# while the data versions of these tables are unchanged
+SECTION_TABLES: Dict[str, Tuple[str, ...]] = {
+    "governance_summary": ("policies",),
+    "risk_overview": ("risk_assessments", "risk_category_scores"),
+    "compliance_status": ("compliance_monitors",),
+    "insights": ("policies", "risk_assessments", "compliance_monitors")
+}
+
+# Builders by section key, in report order
+SECTION_BUILDERS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "governance_summary": build_governance_summary,
+    "risk_overview": build_risk_overview,
+    "compliance_status": build_compliance_status,
+    "insights": build_insights
+}
+
+# Periods longer than this are tabulated by week instead of by day
+MAX_DAILY_ROWS = 31
+
+def _period_days(rollups: Dict[str, Any]) -> List[date]:
+    start, end = date.fromisoformat(rollups['start_day']), date.fromisoformat(rollups['end_day'])
+    return [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+
+def _bucket_label(day: date, weekly: bool) -> str:
+    return f"Week of {(day - timedelta(days=day.weekday())).isoformat()}" if weekly else day.isoformat()
+
+def _format_rate(rate: Optional[float]) -> str:
+    return "n/a" if rate is None else f"{rate:.0%}"
+
+def build_compliance_trend(rollups: Dict[str, Any]) -> Dict[str, Any]:
+    """Daily compliance rate and alerts over the period, carrying each day's monitor state forward."""
+    days = _period_days(rollups)
+    weekly = len(days) > MAX_DAILY_ROWS
+    by_day = {row['day']: row for row in rollups['compliance']}
+    # The state on a day without monitor writes is the last recorded state before it
+    state = next((row for row in reversed(rollups['compliance']) if row['day'] < rollups['start_day']), None)
+    buckets: Dict[str, Dict[str, Any]] = {}
+    daily_rates = []
+    alerts_raised = critical_days = 0
+    for day in days:
+        row = by_day.get(day.isoformat())
+        if row:
+            state = row
+            alerts_raised += row['alerts_raised']
+        rate = state['compliant_monitors'] / state['active_monitors'] if state and state['active_monitors'] else None
+        if rate is not None:
+            daily_rates.append((day, rate))
+        critical_days += bool(state and state['critical_monitors'])
+        bucket = buckets.setdefault(_bucket_label(day, weekly), {"rates": [], "alerts": 0, "critical": 0})
+        if rate is not None:
+            bucket["rates"].append(rate)
+        bucket["alerts"] += row['alerts_raised'] if row else 0
+        bucket["critical"] = max(bucket["critical"], state['critical_monitors'] if state else 0)
+
+    average = sum(rate for _, rate in daily_rates) / len(daily_rates) if daily_rates else None
+    lowest = min(daily_rates, key=lambda item: item[1]) if daily_rates else None
+    lines = [
+        "## Compliance Trend", "",
+        f"- **Period**: {rollups['start_day']} to {rollups['end_day']} ({len(days)} days)",
+        f"- **Average Compliance Rate**: {_format_rate(average)}",
+        f"- **Lowest Compliance Rate**: {_format_rate(lowest[1]) + ' on ' + lowest[0].isoformat() if lowest else 'n/a'}",
+        f"- **Alerts Raised**: {alerts_raised}",
+        f"- **Days With Critical Monitors**: {critical_days}",
+        "", f"| {'Week' if weekly else 'Day'} | Compliance Rate | Alerts Raised | Critical Monitors |",
+        "| --- | --- | --- | --- |"
+    ]
+    lines += [
+        f"| {label} | {_format_rate(sum(b['rates']) / len(b['rates']) if b['rates'] else None)} | {b['alerts']} | {b['critical']} |"
+        for label, b in buckets.items()
+    ]
+
+    insights = []
+    if average is None:
+        insights.append(f"No compliance monitor data was recorded between {rollups['start_day']} and {rollups['end_day']}.")
+    else:
+        insights.append(f"Compliance averaged {average:.0%} over the period, lowest {lowest[1]:.0%} on {lowest[0].isoformat()}.")
+    if alerts_raised or critical_days:
+        insights.append(f"Monitor alerts raised: {alerts_raised}; critical monitors were open on {critical_days} of {len(days)} days.")
+    return {"title": "Compliance Trend", "content": "\n".join(lines), "insights": insights}
+
+def build_risk_trend(rollups: Dict[str, Any]) -> Dict[str, Any]:
+    """Assessments, average risk score and high-risk assessments per day (or week) over the period."""
+    weekly = len(_period_days(rollups)) > MAX_DAILY_ROWS
+    buckets: Dict[str, Dict[str, float]] = {}
+    for row in rollups['risk']:
+        bucket = buckets.setdefault(_bucket_label(date.fromisoformat(row['day']), weekly),
+                                    {"assessments": 0, "score_sum": 0.0, "high_risk": 0})
+        bucket["assessments"] += row['assessments']
+        bucket["score_sum"] += row['risk_score_sum']
+        bucket["high_risk"] += row['high_risk_assessments']
+    assessments = sum(b["assessments"] for b in buckets.values())
+    high_risk = sum(b["high_risk"] for b in buckets.values())
+    average = sum(b["score_sum"] for b in buckets.values()) / assessments if assessments else 0.0
+
+    lines = [
+        "## Risk Trend", "",
+        f"- **Assessments**: {assessments}",
+        f"- **Average Risk Score**: {average:.1f}",
+        f"- **High Risk Assessments**: {high_risk} (score {HIGH_RISK_THRESHOLD:.0f} or more)",
+        "", f"| {'Week' if weekly else 'Day'} | Assessments | Average Risk Score | High Risk |",
+        "| --- | --- | --- | --- |"
+    ]
+    lines += [
+        f"| {label} | {b['assessments']} | {b['score_sum'] / b['assessments']:.1f} | {b['high_risk']} |"
+        for label, b in buckets.items() if b["assessments"]
+    ] or ["| None | 0 | - | 0 |"]
+
+    insights = []
+    if assessments:
+        insights.append(f"{assessments} assessments averaged a risk score of {average:.1f}; {high_risk} were high risk.")
+        active = [b for b in buckets.values() if b["assessments"]]
+        if len(active) > 1:
+            first, last = (b["score_sum"] / b["assessments"] for b in (active[0], active[-1]))
+            if last == first:
+                insights.append(f"Average risk held at {first:.1f} across the period.")
+            else:
+                insights.append(f"Average risk {'rose' if last > first else 'fell'} from {first:.1f} to {last:.1f} across the period.")
+    return {"title": "Risk Trend", "content": "\n".join(lines), "insights": insights}
+
+# Period builders by section key, run on ReportRepository.get_daily_rollups output
+PERIOD_SECTION_BUILDERS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "compliance_trend": build_compliance_trend,
+    "risk_trend": build_risk_trend
+}
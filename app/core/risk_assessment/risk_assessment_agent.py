@@ -0,0 +1,159 @@
+import time
+from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+from app.core.risk_assessment.risk_scoring import RiskScoringEngine, risk_level
+from app.domain.models import RiskAssessment
+from app.domain.repositories import RiskAssessmentRepository
+
+class RiskAssessmentAgent:
+    def __init__(self, risk_repository: Optional[RiskAssessmentRepository] = None,
+                 scoring_engine: Optional[RiskScoringEngine] = None):
+        """Initialize the Risk Assessment Agent with the vectorized scoring engine."""
+        if risk_repository is None:
+            from app.infrastructure.database.sqlite_repositories import SQLiteRiskAssessmentRepository
+            risk_repository = SQLiteRiskAssessmentRepository()
+        self.risk_repository = risk_repository
+        self.scoring_engine = scoring_engine or RiskScoringEngine()
+        self.risk_categories = list(self.scoring_engine.categories)
+
+        self.recommendation_templates = {
+            "Privacy Risk": "Minimize personal data use, document consent and apply privacy-preserving techniques.",
+            "Bias Risk": "Evaluate performance across demographic groups and apply fairness interventions.",
+            "Security Risk": "Harden model endpoints with authentication, threat modeling and adversarial testing.",
+            "Transparency Risk": "Provide model documentation and explanations for individual decisions.",
+            "Accountability Risk": "Assign clear ownership, audit trails and human review for high-impact decisions.",
+            "Robustness Risk": "Test against distribution shift and edge cases and monitor for drift in production.",
+            "Safety Risk": "Define harm scenarios, add safeguards against misuse and establish incident response.",
+            "Compliance Risk": "Map applicable regulations and standards and verify licensing of data and models."
+        }
+
+    def load_weights(self) -> Dict[str, float]:
+        """
+        Apply the saved category weights to the scoring engine.
+
+        Weights are saved with every re-score and read back before each scoring
+        operation, so every process scores with the weights last saved by any of them.
+        """
+        saved = self.risk_repository.get_category_weights()
+        known = {category: weight for category, weight in saved.items() if category in self.risk_categories}
+        if known:
+            self.scoring_engine.set_weights(known)
+        return self.scoring_engine.weights
+
+    def assess_documentation(self, title: str, model_name: str, documentation: str) -> RiskAssessment:
+        """Assess a single model from its documentation and return an unsaved RiskAssessment."""
+        self.load_weights()
+        evidence = self.scoring_engine.evidence_from_texts([documentation])
+        # Rounded before the level is taken, as rescore_all does, so a stored score always matches its level
+        score = round(float(self.scoring_engine.score(evidence)[0]), 1)
+        contributions = dict(zip(self.risk_categories, self.scoring_engine.contributions(evidence)[0]))
+        category_evidence = dict(zip(self.risk_categories, evidence[0]))
+
+        # Report the categories with evidence, strongest contribution first
+        ranked = sorted((c for c in self.risk_categories if category_evidence[c] > 0),
+                        key=lambda c: contributions[c], reverse=True)
+        findings = ["## Key Findings", ""]
+        recommendations = ["## Recommendations", ""]
+        for i, category in enumerate(ranked, 1):
+            findings.append(f"{i}. **{category}**: evidence {category_evidence[category]:.2f}, "
+                            f"contributes {contributions[category]:.1f} points to the risk score.")
+            recommendations.append(f"{i}. **{category}**: {self.recommendation_templates.get(category, 'Review this risk area.')}")
+        if not ranked:
+            findings.append("No risk indicators were found in the provided documentation.")
+            recommendations.append("Provide more detailed documentation to enable a complete assessment.")
+
+        return RiskAssessment(
+            title=title,
+            model_name=model_name,
+            risk_score=score,
+            findings="\n".join(findings),
+            recommendations="\n".join(recommendations),
+            status=risk_level(score),
+            score_source="engine"
+        )
+
+    def category_scores(self, text: str) -> Dict[str, float]:
+        """Per-category risk scores (0-100) for one document, as stored in risk_category_scores."""
+        evidence = self.scoring_engine.evidence_from_texts([text])[0]
+        return {category: round(float(value) * 100.0, 1) for category, value in zip(self.risk_categories, evidence)}
+
+    def score_from_categories(self, category_scores: Dict[str, float]) -> float:
+        """Overall 0-100 risk score for one set of per-category scores under the saved weights."""
+        self.load_weights()
+        evidence = self.scoring_engine.evidence_from_dicts(
+            [{category: score / 100.0 for category, score in category_scores.items()}]
+        )
+        return round(float(self.scoring_engine.score(evidence)[0]), 1)
+
+    def backfill_category_scores(self) -> int:
+        """Store category scores for assessments that were created without them."""
+        stored = self.risk_repository.get_category_scores()
+        missing = [a for a in self.risk_repository.get_all() if a['id'] not in stored]
+        if not missing:
+            return 0
+        evidence = self.scoring_engine.evidence_from_texts(a.get('findings') or "" for a in missing)
+        rows = [
+            (a['id'], a['model_name'], category, round(float(value) * 100.0, 1))
+            for a, model_evidence in zip(missing, evidence)
+            for category, value in zip(self.risk_categories, model_evidence)
+        ]
+        self.risk_repository.save_category_scores(rows)
+        return len(missing)
+
+    def score_portfolio(self, assessments: List[Dict[str, Any]],
+                        category_scores: Optional[Dict[int, Dict[str, float]]] = None) -> np.ndarray:
+        """
+        Score many assessments at once.
+
+        Stored category scores are used where available; other assessments are scored from their findings.
+        """
+        category_scores = category_scores or {}
+        evidence = np.zeros((len(assessments), len(self.risk_categories)))
+        stored = [i for i, a in enumerate(assessments) if a.get('id') in category_scores]
+        unscored = [i for i, a in enumerate(assessments) if a.get('id') not in category_scores]
+        if stored:
+            evidence[stored] = self.scoring_engine.evidence_from_dicts(
+                {category: score / 100.0 for category, score in category_scores[assessments[i]['id']].items()}
+                for i in stored
+            )
+        if unscored:
+            evidence[unscored] = self.scoring_engine.evidence_from_texts(
+                assessments[i].get('findings') or "" for i in unscored
+            )
+        return self.scoring_engine.score(evidence)
+
+    def rescore_all(self, weights: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """
+        Re-score every assessment the scoring engine scored, optionally after changing category weights.
+
+        Assessments whose score was entered by an analyst or client keep it. New weights
+        are saved together with the new scores.
+
+        Args:
+            weights: Relative weights for some or all risk categories
+
+        Returns:
+            Summary with the weights applied and the number of assessments updated
+        """
+        self.load_weights()
+        if weights:
+            self.scoring_engine.set_weights(weights)
+
+        start = time.perf_counter()
+        assessments = [a for a in self.risk_repository.get_all() if a.get('score_source') == 'engine']
+        scores = self.score_portfolio(assessments, self.risk_repository.get_category_scores())
+        rounded = np.round(scores, 1)
+        levels = self.scoring_engine.levels(rounded)
+        updated = self.risk_repository.update_scores(
+            [(a['id'], float(score), level) for a, score, level in zip(assessments, rounded, levels)],
+            self.scoring_engine.weights if weights else None
+        )
+
+        return {
+            "updated": updated,
+            "weights": self.scoring_engine.weights,
+            "average_risk_score": round(float(scores.mean()), 2) if len(scores) else 0.0,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 2)
+        }
@@ -0,0 +1,172 @@
+"""
+Vectorized risk scoring for portfolios of AI models.
+
+Each model is described by an evidence vector with one entry in [0, 1] per risk
+category (how strongly its documentation or findings point at that risk). A whole
+portfolio is scored at once as evidence matrix x normalized category weights, so
+scoring and re-scoring after a weight change are single NumPy operations rather
+than per-model Python loops. Evidence itself is extracted from text with a
+keyword/category membership matrix in the same way.
+"""
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from app.infrastructure.ai.analysis_engine import MULTI_LABEL_KEYWORDS
+from utils.constants import RISK_ASSESSMENT_AGENT_CONFIG
+
+# Phrases that count as evidence for each risk category
+RISK_CATEGORY_KEYWORDS = {
+    "Privacy Risk": MULTI_LABEL_KEYWORDS["privacy"] + ["surveillance", "re-identification"],
+    "Bias Risk": MULTI_LABEL_KEYWORDS["bias"] + ["demographic", "disparit", "underrepresented"],
+    "Security Risk": MULTI_LABEL_KEYWORDS["security"] + ["unauthorized", "authentication", "adversarial"],
+    "Transparency Risk": MULTI_LABEL_KEYWORDS["transparency"] + ["explainability", "black-box", "undocumented"],
+    "Accountability Risk": ["accountab", "oversight", "audit", "responsib", "human review", "liability"],
+    "Robustness Risk": ["robust", "degrad", "drift", "reliab", "edge case", "out-of-distribution", "hallucinat"],
+    "Safety Risk": ["safety", "harm", "unsafe", "hazard", "danger", "injur", "misuse"],
+    "Compliance Risk": MULTI_LABEL_KEYWORDS["compliance"] + ["legal", "licens", "gdpr", "hipaa"]
+}
+
+# Number of distinct keyword hits at which a category's evidence saturates at 1.0
+EVIDENCE_SATURATION = 2
+
+def risk_level(score: float, levels: Optional[Sequence] = None) -> str:
+    """
+    Map a 0-100 risk score to an assessment status such as "High Risk".
+
+    Args:
+        score: The risk score
+        levels: (status, minimum score) pairs, highest first
+
+    Returns:
+        The status of the first level whose minimum the score reaches
+    """
+    levels = levels or RISK_ASSESSMENT_AGENT_CONFIG["risk_levels"]
+    for status, minimum in levels:
+        if score >= minimum:
+            return status
+    return levels[-1][0]
+
+class RiskScoringEngine:
+    """Scores many models across the configured risk categories in one matrix product."""
+
+    def __init__(self, categories: Optional[List[str]] = None, weights: Optional[Dict[str, float]] = None):
+        """
+        Initialize the engine.
+
+        Args:
+            categories: Risk categories, in column order (defaults to the agent configuration)
+            weights: Relative category weights (defaults to the agent configuration)
+        """
+        self.categories = list(categories or RISK_ASSESSMENT_AGENT_CONFIG["risk_categories"])
+        self._raw_weights = np.ones(len(self.categories))
+        self._weights = self._raw_weights / self._raw_weights.sum()
+        self.set_weights(weights or RISK_ASSESSMENT_AGENT_CONFIG.get("category_weights", {}))
+
+        # Keyword x category membership matrix used to turn keyword hits into category counts
+        self.keywords = sorted({
+            keyword
+            for category in self.categories
+            for keyword in RISK_CATEGORY_KEYWORDS.get(category, [category.lower()])
+        })
+        keyword_index = {keyword: i for i, keyword in enumerate(self.keywords)}
+        self._membership = np.zeros((len(self.keywords), len(self.categories)))
+        for column, category in enumerate(self.categories):
+            for keyword in RISK_CATEGORY_KEYWORDS.get(category, [category.lower()]):
+                self._membership[keyword_index[keyword], column] = 1.0
+
+    @property
+    def weights(self) -> Dict[str, float]:
+        """The normalized category weights."""
+        return {category: float(weight) for category, weight in zip(self.categories, self._weights)}
+
+    def set_weights(self, weights: Dict[str, float]) -> Dict[str, float]:
+        """
+        Change category weights; categories not mentioned keep their current weight.
+
+        Args:
+            weights: Mapping of category to a non-negative relative weight
+
+        Returns:
+            The normalized weights now in effect
+
+        Raises:
+            ValueError: If a category is unknown, a weight is negative or all weights are zero
+        """
+        unknown = [category for category in weights if category not in self.categories]
+        if unknown:
+            raise ValueError(f"Unknown risk categories: {unknown}")
+        updated = self._raw_weights.copy()
+        for column, category in enumerate(self.categories):
+            if category in weights:
+                updated[column] = float(weights[category])
+        if (updated < 0).any() or updated.sum() <= 0:
+            raise ValueError("Category weights must be non-negative and not all zero")
+        self._raw_weights = updated
+        self._weights = updated / updated.sum()
+        return self.weights
+
+    def evidence_from_texts(self, texts: Iterable[str]) -> np.ndarray:
+        """
+        Extract an evidence matrix from documentation or findings.
+
+        Args:
+            texts: One document per model
+
+        Returns:
+            Array of shape (models, categories) with values in [0, 1]
+        """
+        lowered = [text.lower() if text else "" for text in texts]
+        hits = np.array(
+            [[keyword in text for keyword in self.keywords] for text in lowered],
+            dtype=np.float64
+        ).reshape(len(lowered), len(self.keywords))
+        return np.minimum(hits @ self._membership / EVIDENCE_SATURATION, 1.0)
+
+    def evidence_from_dicts(self, rows: Iterable[Dict[str, float]]) -> np.ndarray:
+        """
+        Build an evidence matrix from per-model {category: evidence} mappings.
+
+        Args:
+            rows: One mapping per model; missing categories count as no evidence
+
+        Returns:
+            Array of shape (models, categories) with values clipped to [0, 1]
+        """
+        matrix = np.array(
+            [[row.get(category, 0.0) for category in self.categories] for row in rows],
+            dtype=np.float64
+        ).reshape(-1, len(self.categories))
+        return np.clip(matrix, 0.0, 1.0)
+
+    def score(self, evidence: np.ndarray) -> np.ndarray:
+        """
+        Score a portfolio.
+
+        Args:
+            evidence: Array of shape (models, categories)
+
+        Returns:
+            Array of 0-100 risk scores, one per model
+        """
+        return np.asarray(evidence, dtype=np.float64) @ self._weights * 100.0
+
+    def contributions(self, evidence: np.ndarray) -> np.ndarray:
+        """
+        Split each model's score into per-category contributions.
+
+        Args:
+            evidence: Array of shape (models, categories)
+
+        Returns:
+            Array of shape (models, categories); each row sums to the model's score
+        """
+        return np.asarray(evidence, dtype=np.float64) * self._weights * 100.0
+
+    def levels(self, scores: np.ndarray) -> List[str]:
+        """Map an array of scores to assessment statuses."""
+        levels = RISK_ASSESSMENT_AGENT_CONFIG["risk_levels"]
+        minimums = np.array([minimum for _, minimum in levels])
+        # Levels are ordered highest first, so count how many minimums each score fails to reach
+        index = np.minimum((np.asarray(scores)[:, None] < minimums).sum(axis=1), len(levels) - 1)
+        return [levels[i][0] for i in index]
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple, Callable, Iterable
 from datetime import datetime
 
 from app.domain.models import Policy, RiskAssessment, ComplianceMonitor, Report, Activity
@@ -24,6 +24,21 @@ class PolicyRepository(ABC):
     def update(self, policy: Policy) -> bool:
         """Update an existing policy."""
         pass
+    
+    @abstractmethod
+    def create_many(self, policies: List[Policy], activity_description: Optional[str] = None) -> List[int]:
+        """Create many policies in one transaction, logging one aggregated activity, and return their IDs."""
+        pass
+    
+    @abstractmethod
+    def get_category_counts(self) -> Dict[str, Dict[str, int]]:
+        """Retrieve the active and total policy counts per category."""
+        pass
+    
+    @abstractmethod
+    def find_near_duplicates(self, policy_id: int, threshold: float = 0.8, limit: int = 20) -> List[Dict[str, Any]]:
+        """Find policies whose content is estimated to be at least threshold-similar to a policy."""
+        pass
 
 class RiskAssessmentRepository(ABC):
     @abstractmethod
@@ -40,6 +55,26 @@ class RiskAssessmentRepository(ABC):
     def create(self, assessment: RiskAssessment) -> int:
         """Create a new risk assessment and return its ID."""
         pass
+    
+    @abstractmethod
+    def update_scores(self, scores: List[Tuple[int, float, str]], weights: Optional[Dict[str, float]] = None) -> int:
+        """Update (id, risk score, risk level) of many engine-scored assessments, saving any new weights, and return the number updated."""
+        pass
+    
+    @abstractmethod
+    def get_category_weights(self) -> Dict[str, float]:
+        """Retrieve the saved category weights of the risk scoring engine."""
+        pass
+    
+    @abstractmethod
+    def get_category_scores(self) -> Dict[int, Dict[str, float]]:
+        """Retrieve the per-category risk scores of every assessment, keyed by assessment ID."""
+        pass
+    
+    @abstractmethod
+    def save_category_scores(self, rows: List[Tuple[int, str, str, float]]) -> int:
+        """Insert or replace (assessment id, model name, category, score) rows."""
+        pass
 
 class ComplianceMonitorRepository(ABC):
     @abstractmethod
@@ -77,6 +112,25 @@ class ReportRepository(ABC):
     def create(self, report: Report) -> int:
         """Create a new report and return its ID."""
         pass
+    
+    @abstractmethod
+    def get_snapshot(self, select_tables: Optional[Callable[[Dict[str, int]], Iterable[str]]] = None) -> Dict[str, Any]:
+        """
+        Read the data a report is built from, with the data versions it was read at,
+        in one consistent read transaction. select_tables receives those versions and
+        returns the tables whose data is needed; everything is read when it is omitted.
+        """
+        pass
+    
+    @abstractmethod
+    def get_daily_rollups(self, start_day: str, end_day: str) -> Dict[str, Any]:
+        """Read the daily compliance and risk rollups of a date range (ISO days, inclusive)."""
+        pass
+    
+    @abstractmethod
+    def save_section_timings(self, report_id: int, timings: Dict[str, float]) -> None:
+        """Record how long each section of a report took to build, in milliseconds."""
+        pass
 
 class ActivityRepository(ABC):
     @abstractmethod
@@ -0,0 +1,326 @@
+"""
+Shared rule-based text analysis engine.
+
+A single AnalysisEngine is built by utils.ai_utils.get_engine, registered in the
+application Container and shared by every agent. It owns the keyword
+vocabularies (built once at import instead of on every call), memoized
+label-to-category resolution, the generation templates and the
+content-addressed result cache, and hands out shared capability handles, so
+calls no longer rebuild any of that state. utils.ai_utils.AiUtils and
+app.infrastructure.ai.ai_utils.AiUtils are thin static facades over it.
+"""
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from app.infrastructure.ai.templates import TemplateRegistry
+from utils.analysis_cache import AnalysisCache, get_analysis_cache
+from utils.summarizer import split_sentences, summarize
+
+logger = logging.getLogger('aigovernance.analysis_engine')
+
+# Batches smaller than this are analyzed in-process; spawning workers costs more than it saves
+PARALLEL_BATCH_THRESHOLD = 256
+
+# Number of documents sent to a worker process per task
+DEFAULT_BATCH_CHUNK_SIZE = 64
+
+# Distinct labels whose resolved category an engine remembers per keyword map
+DEFAULT_CATEGORY_MEMO_SIZE = 1024
+
+# Keywords associated with common governance categories, used by classify_text
+CLASSIFICATION_KEYWORDS = {
+    "privacy": ["privacy", "personal data", "confidential", "consent", "gdpr", "ccpa", "data protection"],
+    "security": ["security", "breach", "attack", "vulnerability", "threat", "encryption", "safeguard"],
+    "ethics": ["ethics", "moral", "fairness", "bias", "discrimination", "equity", "transparency", "explainable"],
+    "compliance": ["compliance", "regulation", "law", "requirement", "standard", "policy", "governance"],
+    "risk": ["risk", "hazard", "danger", "threat", "vulnerability", "exposure", "impact", "severity"],
+    "performance": ["performance", "accuracy", "precision", "recall", "efficiency", "effectiveness", "reliability"],
+    "transparency": ["transparency", "explainable", "interpretable", "understandable", "black box", "opaque"]
+}
+
+# multi_label_classify additionally recognises bias-related labels
+MULTI_LABEL_KEYWORDS = {
+    **CLASSIFICATION_KEYWORDS,
+    "bias": ["bias", "fairness", "discrimination", "equity", "diversity", "inclusion", "representation"]
+}
+
+# Positive and negative keywords for governance context, used by analyze_sentiment
+POSITIVE_KEYWORDS = [
+    "compliant", "secure", "protected", "ethical", "transparent", "responsible",
+    "trustworthy", "reliable", "fair", "unbiased", "robust", "accountable",
+    "verified", "validated", "safe", "beneficial", "effective", "improved",
+    "enhancement", "success", "strength", "advantage", "opportunity"
+]
+
+NEGATIVE_KEYWORDS = [
+    "non-compliant", "insecure", "unprotected", "unethical", "opaque", "irresponsible",
+    "untrustworthy", "unreliable", "unfair", "biased", "weak", "unaccountable",
+    "unverified", "unvalidated", "unsafe", "harmful", "ineffective", "degraded",
+    "violation", "fail", "failure", "risk", "threat", "vulnerability", "issue", "concern"
+]
+
+# Tie-breakers that tip an even keyword count towards NEGATIVE
+STRONG_NEGATIVE_KEYWORDS = ["risk", "violation", "fail", "threat"]
+
+# Deterministic rule-based text generation templates
+GOVERNANCE_TEMPLATES = {
+    "AI governance policies should include:":
+        "Data privacy protection, ethical guidelines, transparency requirements, compliance with regulations, risk assessment protocols, bias mitigation strategies, and regular audit mechanisms.",
+
+    "Key principles for responsible AI:":
+        "Transparency, fairness, accountability, data privacy, human oversight, safety, and societal benefit.",
+
+    "AI risk assessment framework:":
+        "Identify AI systems, assess potential risks, evaluate impact severity, determine likelihood, implement controls, monitor continuously, and review periodically.",
+
+    "Compliance requirements for AI systems:":
+        "Data protection regulations, industry standards, ethical guidelines, transparency requirements, fairness assessments, and security protocols.",
+
+    "AI monitoring best practices:":
+        "Real-time performance tracking, bias detection, explainability verification, data quality assessment, security monitoring, and compliance validation."
+}
+
+# Every phrase any rule may test for
+PHRASE_UNIVERSE = tuple(sorted(
+    {phrase for keywords in MULTI_LABEL_KEYWORDS.values() for phrase in keywords}
+    | set(POSITIVE_KEYWORDS) | set(NEGATIVE_KEYWORDS) | set(STRONG_NEGATIVE_KEYWORDS)
+))
+
+def label_category(label_lower: str, keyword_map: Dict[str, List[str]]) -> Optional[str]:
+    """Return the first category of keyword_map named in a lowercase label, or None."""
+    return next((key for key in keyword_map if key in label_lower), None)
+
+def score_labels(labels: List[str], keyword_map: Dict[str, List[str]], contains: Callable[[str], bool],
+                 resolve_category: Optional[Callable[[str], Optional[str]]] = None) -> List[Tuple[str, float]]:
+    """
+    Score each label by how many keywords of its category appear in the text.
+
+    Args:
+        labels: List of possible labels
+        keyword_map: Category keyword lists to match labels against
+        contains: Predicate telling whether a lowercase phrase appears in the text
+        resolve_category: Optional memoized label_category for keyword_map
+
+    Returns:
+        A list of (label, confidence) tuples in label order
+    """
+    scores = []
+    for label in labels:
+        label_lower = label.lower()
+        # Extract the base category from the label
+        if resolve_category is not None:
+            category = resolve_category(label_lower)
+        else:
+            category = label_category(label_lower, keyword_map)
+
+        if category:
+            # Count keyword matches
+            matches = sum(1 for keyword in keyword_map[category] if contains(keyword))
+            # Calculate a confidence score based on matches
+            confidence = min(0.5 + (matches * 0.1), 0.95)  # Cap at 0.95
+        else:
+            # For labels without a keyword map, check for direct label appearances
+            confidence = 0.8 if contains(label_lower) else 0.3
+
+        scores.append((label, confidence))
+
+    return scores
+
+def best_label(scores: List[Tuple[str, float]]) -> Tuple[str, float]:
+    """Return the highest-confidence (label, confidence) pair, first label winning ties."""
+    return sorted(scores, key=lambda x: x[1], reverse=True)[0]
+
+def labels_above(scores: List[Tuple[str, float]], threshold: float) -> List[Tuple[str, float]]:
+    """Return the (label, confidence) pairs at or above the threshold, best first."""
+    result = [item for item in scores if item[1] >= threshold]
+    result.sort(key=lambda x: x[1], reverse=True)
+    return result
+
+def score_sentiment(contains: Callable[[str], bool]) -> Tuple[str, float]:
+    """
+    Score sentiment from the governance keywords present in the text.
+
+    Args:
+        contains: Predicate telling whether a lowercase phrase appears in the text
+
+    Returns:
+        A tuple of (sentiment, confidence)
+    """
+    positive_count = sum(1 for keyword in POSITIVE_KEYWORDS if contains(keyword))
+    negative_count = sum(1 for keyword in NEGATIVE_KEYWORDS if contains(keyword))
+
+    # Determine sentiment based on counts
+    if positive_count > negative_count:
+        score = min(0.5 + ((positive_count - negative_count) * 0.05), 0.95)
+        return ("POSITIVE", score)
+    elif negative_count > positive_count:
+        score = min(0.5 + ((negative_count - positive_count) * 0.05), 0.95)
+        return ("NEGATIVE", score)
+    else:
+        # If counts are equal, check for strong negative indicators
+        if any(contains(neg) for neg in STRONG_NEGATIVE_KEYWORDS):
+            return ("NEGATIVE", 0.6)
+        # Otherwise neutral
+        return ("NEUTRAL", 0.5)
+
+class _Document:
+    """Lowercased text with memoized phrase lookups, so no phrase is searched for twice."""
+    __slots__ = ('text_lower', '_found')
+
+    def __init__(self, text: str):
+        self.text_lower = text.lower()
+        self._found: Dict[str, bool] = {}
+
+    def contains(self, phrase: str) -> bool:
+        found = self._found.get(phrase)
+        if found is None:
+            found = self._found[phrase] = phrase in self.text_lower
+        return found
+
+class AnalysisEngine:
+    """Rule-based text generation, classification, sentiment and summarization with warm shared state."""
+
+    def __init__(self, cache: Optional[AnalysisCache] = None, model_name: str = "rule-based"):
+        """
+        Initialize the engine.
+
+        Args:
+            cache: Result cache to use (defaults to the process-wide analysis cache)
+            model_name: Identifier reported by the capability handles
+        """
+        self.cache = cache if cache is not None else get_analysis_cache()
+        self.model_name = model_name
+        self.templates = TemplateRegistry(GOVERNANCE_TEMPLATES)
+        # Bounded, as labels come from callers and the engine lives as long as the process
+        self._classification_category = lru_cache(maxsize=DEFAULT_CATEGORY_MEMO_SIZE)(
+            lambda label_lower: label_category(label_lower, CLASSIFICATION_KEYWORDS))
+        self._multi_label_category = lru_cache(maxsize=DEFAULT_CATEGORY_MEMO_SIZE)(
+            lambda label_lower: label_category(label_lower, MULTI_LABEL_KEYWORDS))
+        self._handles: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        logger.debug(f"Analysis engine initialized with {len(PHRASE_UNIVERSE)} vocabulary phrases")
+
+    def handle(self, capability: str, model_name: Optional[str] = None) -> Dict[str, Any]:
+        """Return the (shared) capability handle for a named model."""
+        key = (capability, model_name or self.model_name)
+        if key not in self._handles:
+            self._handles[key] = {"model": key[1], "capability": capability, "initialized": True}
+        return self._handles[key]
+
+    def generate_text(self, prompt: str, fallback: str = "") -> str:
+        """Generate text for a prompt from the governance templates, or return the fallback."""
+        text = self.templates.match_prompt(prompt)
+        return text if text is not None else fallback
+
+    def classify_text(self, text: str, labels: List[str]) -> Tuple[str, float]:
+        """Classify text into the best matching label."""
+        if not labels:
+            return ("Unknown", 0.0)
+        return self.cache.get_or_compute(
+            "classify_text", text,
+            lambda: best_label(score_labels(labels, CLASSIFICATION_KEYWORDS, _Document(text).contains,
+                                            self._classification_category)),
+            labels=labels, decode=tuple
+        )
+
+    def multi_label_classify(self, text: str, labels: List[str], threshold: float = 0.5) -> List[Tuple[str, float]]:
+        """Classify text against every label, keeping those at or above the threshold."""
+        if not labels:
+            return []
+        return self.cache.get_or_compute(
+            "multi_label_classify", text,
+            lambda: labels_above(score_labels(labels, MULTI_LABEL_KEYWORDS, _Document(text).contains,
+                                              self._multi_label_category), threshold),
+            labels=labels, params=(threshold,),
+            decode=lambda value: [tuple(item) for item in value]
+        )
+
+    def analyze_sentiment(self, text: str) -> Tuple[str, float]:
+        """Analyze the sentiment of text."""
+        return self.cache.get_or_compute(
+            "analyze_sentiment", text,
+            lambda: score_sentiment(_Document(text).contains),
+            decode=tuple
+        )
+
+    def extract_key_points(self, text: str, num_points: int = 3) -> List[str]:
+        """Extract the most central sentences (TextRank) in document order."""
+        return self.cache.get_or_compute(
+            "extract_key_points", text,
+            lambda: summarize(split_sentences(text), num_points),
+            params=(num_points,)
+        )
+
+    def map_batch(self, method_name: str, texts: Iterable[str], args: Tuple = (),
+                  max_workers: Optional[int] = None, chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE) -> List[Any]:
+        """
+        Apply a single-text engine method to many documents, fanning out to worker processes for large inputs.
+
+        Args:
+            method_name: Name of the engine method to apply to each document
+            texts: Iterable of documents
+            args: Extra positional arguments passed after the text
+            max_workers: Maximum number of worker processes (defaults to the CPU count)
+            chunk_size: Number of documents per worker task
+
+        Returns:
+            Results in the same order as the input documents
+        """
+        texts = list(texts)
+        if len(texts) < PARALLEL_BATCH_THRESHOLD or max_workers == 1:
+            return self._map_in_process(method_name, texts, args)
+
+        chunk_size = max(1, chunk_size)
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers) as pool:
+                chunk_results = list(pool.map(_run_batch_chunk, repeat(method_name), chunks, repeat(args)))
+        except Exception as e:
+            # Process pools are unavailable in some sandboxes; the in-process path gives identical results
+            logger.warning(f"Error running batch in worker processes, falling back to in-process: {str(e)}")
+            return self._map_in_process(method_name, texts, args)
+
+        # Workers hand back what they computed and counted; it is stored here in one transaction
+        results, entries = [], []
+        for chunk, chunk_entries, counters in chunk_results:
+            results.extend(chunk)
+            entries.extend(chunk_entries)
+            self.cache.add_stats(counters)
+        self.cache.set_many(entries)
+        return results
+
+    def _map_in_process(self, method_name: str, texts: List[str], args: Tuple) -> List[Any]:
+        method = getattr(self, method_name)
+        with self.cache.batch_writes():
+            return [method(text, *args) for text in texts]
+
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit rates of the result cache."""
+        return self.cache.stats()
+
+
+# Worker processes build their own engine once and reuse it for every chunk they receive
+_worker_engine = None
+
+def _run_batch_chunk(method_name: str, chunk: List[str], args: Tuple) -> Tuple[List[Any], List[Tuple[str, str, Any]], Dict[str, int]]:
+    """
+    Apply an engine method to every document in a chunk (runs in a worker process).
+
+    Returns:
+        The results, the cache entries computed for them and the chunk's cache hit/miss
+        counters, for the parent process to store and report
+    """
+    global _worker_engine
+    if _worker_engine is None:
+        _worker_engine = AnalysisEngine()
+    cache = _worker_engine.cache
+    before = cache.stats()
+    method = getattr(_worker_engine, method_name)
+    with cache.batch_writes(write=False) as entries:
+        results = [method(text, *args) for text in chunk]
+    after = cache.stats()
+    counters = {name: after[name] - before[name] for name in ("memory_hits", "disk_hits", "misses")}
+    return results, list(entries), counters
@@ -0,0 +1,154 @@
+"""
+Compiled text templates and prompt lookup for rule-based generation.
+
+Templates are parsed once when registered and compiled into a Python function
+whose body is a single f-string expression, so rendering costs the same as a
+hand-written f-string and no format string is parsed per call. Prompt keys are
+kept in a character trie; a prompt is resolved once (walking the trie from each
+starting position when there are enough keys for that to beat a linear scan) and
+the result is memoized.
+"""
+import keyword
+import string
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+# Resolved prompts remembered by a registry before the memo is reset
+DEFAULT_PROMPT_MEMO_SIZE = 4096
+
+# Below this many prompt keys a linear scan of C-level substring tests is faster than walking the trie
+TRIE_MIN_KEYS = 256
+
+class CompiledTemplate:
+    """A format-style template ("{field}" placeholders) compiled into a rendering function."""
+
+    __slots__ = ('source', 'fields', '_render')
+
+    def __init__(self, source: str):
+        """
+        Parse and compile a template.
+
+        Args:
+            source: Template text with str.format-style named placeholders
+
+        Raises:
+            ValueError: If a placeholder is not an identifier or uses a format spec or conversion
+        """
+        self.source = source
+        pieces = []
+        for literal, field, spec, conversion in string.Formatter().parse(source):
+            if literal:
+                pieces.append(repr(literal))
+            if field is not None:
+                if not field.isidentifier() or keyword.iskeyword(field) or spec or conversion:
+                    raise ValueError(f"Unsupported placeholder in template: {{{field}}}")
+                pieces.append(f"f'{{{field}!s}}'")
+        self.fields = frozenset(field for _, field, _, _ in string.Formatter().parse(source) if field)
+
+        # Adjacent literals and f-strings compile to one f-string expression
+        arguments = ", ".join(sorted(self.fields))
+        code = f"def render(*, {arguments}):\n    return ({' '.join(pieces) or repr('')})\n" if arguments \
+            else f"def render():\n    return {' '.join(pieces) or repr('')}\n"
+        namespace: Dict[str, Any] = {}
+        exec(compile(code, "<template>", "exec"), namespace)
+        self._render = namespace["render"]
+
+    def render(self, **fields: Any) -> str:
+        """Render the template; every placeholder must be given."""
+        return self._render(**fields)
+
+class TemplateRegistry:
+    """Named compiled templates plus prompt templates matched by a trie."""
+
+    def __init__(self, prompt_templates: Optional[Dict[str, str]] = None, memo_size: int = DEFAULT_PROMPT_MEMO_SIZE):
+        """
+        Initialize the registry.
+
+        Args:
+            prompt_templates: Mapping of prompt key to generated text, in match-priority order
+            memo_size: Number of resolved prompts to remember
+        """
+        self._templates: Dict[str, CompiledTemplate] = {}
+        self._prompt_keys: List[str] = []
+        self._prompt_texts: List[str] = []
+        self._trie: Dict[str, Any] = {}
+        self._longest_key = 0
+        self._memo: Dict[str, Optional[int]] = {}
+        self._memo_size = memo_size
+        self._lock = threading.Lock()
+        for key, text in (prompt_templates or {}).items():
+            self.register_prompt(key, text)
+
+    def register(self, name: str, source: str) -> CompiledTemplate:
+        """Compile and register a named template."""
+        template = CompiledTemplate(source)
+        self._templates[name] = template
+        return template
+
+    def get(self, name: str) -> CompiledTemplate:
+        """Return a registered template; raises KeyError if it is unknown."""
+        return self._templates[name]
+
+    def render(self, name: str, **fields: Any) -> str:
+        """Render a registered template by name."""
+        return self._templates[name].render(**fields)
+
+    def register_prompt(self, key: str, text: str) -> None:
+        """Register generated text for prompts containing (or contained in) key; earlier keys take priority."""
+        with self._lock:
+            if key in self._prompt_keys:
+                self._prompt_texts[self._prompt_keys.index(key)] = text
+                return
+            node = self._trie
+            for char in key:
+                node = node.setdefault(char, {})
+            node[None] = len(self._prompt_keys)
+            self._prompt_keys.append(key)
+            self._prompt_texts.append(text)
+            self._longest_key = max(self._longest_key, len(key))
+            self._memo.clear()
+
+    def match_prompt(self, prompt: str) -> Optional[str]:
+        """
+        Return the text of the first-registered key that occurs in the prompt or contains it.
+
+        Same result as testing `key in prompt or prompt in key` for each key in order.
+        """
+        index = self._memo.get(prompt, -1)
+        if index == -1:
+            index = self._resolve(prompt)
+            with self._lock:
+                if len(self._memo) >= self._memo_size:
+                    self._memo.clear()
+                self._memo[prompt] = index
+        return self._prompt_texts[index] if index is not None else None
+
+    def _resolve(self, prompt: str) -> Optional[int]:
+        if len(self._prompt_keys) < TRIE_MIN_KEYS:
+            for index, key in enumerate(self._prompt_keys):
+                if key in prompt or prompt in key:
+                    return index
+            return None
+
+        # An empty key occurs in every prompt
+        best = self._trie.get(None)
+        # Keys occurring in the prompt: walk the trie from each starting position
+        for start in range(len(prompt)):
+            node = self._trie
+            for char in prompt[start:start + self._longest_key]:
+                node = node.get(char)
+                if node is None:
+                    break
+                if None in node and (best is None or node[None] < best):
+                    best = node[None]
+        # A prompt no longer than some key may instead be contained in a key
+        if len(prompt) <= self._longest_key:
+            for index, key in enumerate(self._prompt_keys[:best]):
+                if prompt in key:
+                    return index
+        return best
+
+    @property
+    def prompt_keys(self) -> List[str]:
+        """Registered prompt keys in priority order."""
+        return list(self._prompt_keys)
@@ -23,6 +23,9 @@ DEFAULT_CONFIG = {
     'ENABLE_SMS_NOTIFICATIONS': False,
     'ENABLE_EMAIL_NOTIFICATIONS': False,
     
+    # Messaging settings
+    'EVENT_BUS_BRIDGE': '',  # '' (single process) or 'sqlite'
+    
     # API settings
     'API_PREFIX': '/api/v1',
     
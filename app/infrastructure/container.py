@@ -1,5 +1,6 @@
 from typing import Dict, Any, Type
 import logging
+import threading
 from app.infrastructure.config.app_config import config
 from app.infrastructure.messaging.notification_service import NotificationService
 
@@ -11,6 +12,8 @@ class Container:
     def __init__(self):
         """Initialize the container with services."""
         self._services = {}
+        # Reentrant because factories get the services they depend on
+        self._lock = threading.RLock()
         self._initialize_core_services()
     
     def _initialize_core_services(self):
@@ -19,10 +22,21 @@ class Container:
         self.register_singleton('notification_service', NotificationService())
         
         # Services to be instantiated on first use
+        self.register_factory('analysis_engine', self._create_analysis_engine)
         self.register_factory('governance_agent', self._create_governance_agent)
         self.register_factory('risk_assessment_agent', self._create_risk_assessment_agent)
         self.register_factory('monitoring_agent', self._create_monitoring_agent)
         self.register_factory('reporting_agent', self._create_reporting_agent)
+        self.register_factory('job_queue', self._create_job_queue)
+        self.register_factory('report_scheduler', self._create_report_scheduler)
+        self.register_factory('columnar_exporter', self._create_columnar_exporter)
+        self.register_factory('event_bus', self._create_event_bus)
+        self.register_factory('dashboard_stream', self._create_dashboard_stream)
+    
+    def _create_analysis_engine(self):
+        """Return the shared text analysis engine used by all agents and the AiUtils facade."""
+        from utils.ai_utils import get_engine
+        return get_engine()
     
     def _create_governance_agent(self):
         """Create a new governance agent instance."""
@@ -64,6 +78,61 @@ class Container:
             from app.core.reporting.reporting_agent import ReportingAgent
             return ReportingAgent()
     
+    def _create_job_queue(self):
+        """Create the background job queue with a handler for each agent job kind."""
+        from app.infrastructure.jobs.queue import JobQueue
+        job_queue = JobQueue()
+        job_queue.register('policy_pack', lambda job: self.get('governance_agent').create_policy_pack(
+            job.payload['system_names'], job.payload.get('categories'), job.progress
+        ))
+        job_queue.register('report', lambda job: self.get('reporting_agent').create_report(
+            job.payload['title'], job.payload['description'], job.payload['report_type'],
+            job.payload.get('status', 'Draft'), job.progress,
+            job.payload.get('start_day'), job.payload.get('end_day')
+        ))
+        job_queue.register('risk_rescore', lambda job: self.get('risk_assessment_agent').rescore_all(
+            job.payload.get('weights')
+        ))
+        job_queue.register('columnar_export', lambda job: self.get('columnar_exporter').export(
+            job.payload.get('tables'), job.payload.get('full', False),
+            job.payload.get('file_format'), job.progress
+        ))
+        return job_queue
+    
+    def _create_report_scheduler(self):
+        """Create the scheduler that submits due report schedules as "report" jobs."""
+        from app.infrastructure.jobs.scheduler import ReportScheduler
+        reporting_agent = self.get('reporting_agent')
+        return ReportScheduler(
+            self.get('job_queue'),
+            section_count=lambda report_type: len(reporting_agent.section_keys(report_type))
+        )
+    
+    def _create_columnar_exporter(self):
+        """Create the Parquet / Arrow exporter of the governance tables."""
+        from app.infrastructure.export.columnar import ColumnarExporter
+        return ColumnarExporter()
+    
+    def _create_event_bus(self):
+        """Create the event bus fed by database writes, bridged to other processes if configured."""
+        from app.infrastructure.messaging.event_bus import EventBus
+        from database.db_utils_sqlite import add_write_listener
+        event_bus = EventBus()
+        add_write_listener(event_bus.publish)
+        if config.get('EVENT_BUS_BRIDGE') == 'sqlite':
+            from app.infrastructure.messaging.sqlite_bridge import SQLiteEventBridge
+            bridge = SQLiteEventBridge(event_bus)
+            bridge.start()
+            self.register_singleton('event_bridge', bridge)
+        return event_bus
+    
+    def _create_dashboard_stream(self):
+        """Create the fan-out of live dashboard updates to SSE and WebSocket clients."""
+        from app.infrastructure.messaging.dashboard_stream import DashboardStream
+        stream = DashboardStream()
+        stream.attach(self.get('event_bus'))
+        return stream
+    
     def register_singleton(self, name: str, instance: Any):
         """
         Register a singleton service instance.
@@ -121,11 +190,13 @@ class Container:
         
         # Create new instance using factory
         if service['factory'] is not None:
-            instance = service['factory']()
-            # Store instance if singleton
-            if service['singleton']:
-                service['instance'] = instance
-            return instance
+            if not service['singleton']:
+                return service['factory']()
+            # Concurrent first requests (e.g. from executor threads) must share one instance
+            with self._lock:
+                if service['instance'] is None:
+                    service['instance'] = service['factory']()
+                return service['instance']
         
         # Return existing instance
         return service['instance']
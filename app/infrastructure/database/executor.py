@@ -0,0 +1,45 @@
+"""
+Bounded thread pool for blocking work called from async request handlers.
+
+sqlite3 calls (and agent methods built on them) block the calling thread. Made
+directly from an async handler they block the event loop, so one slow query
+stalls every concurrent request. Handlers await run_blocking instead, which runs
+the call on a dedicated pool of DB_EXECUTOR_WORKERS threads. The pool is separate
+from Starlette's threadpool (streamed response bodies) so long exports cannot
+starve API queries, and small because SQLite serializes writers: past a few
+threads, more only adds lock contention. Calls beyond the pool size wait in its
+queue without holding a thread.
+"""
+import asyncio
+import functools
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Optional
+
+DEFAULT_DB_EXECUTOR_WORKERS = int(os.environ.get('DB_EXECUTOR_WORKERS', 8))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+def get_db_executor() -> ThreadPoolExecutor:
+    """Return the shared executor, creating it on first use."""
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=DEFAULT_DB_EXECUTOR_WORKERS, thread_name_prefix="db")
+    return _executor
+
+async def run_blocking(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking call on the database executor and await its result."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_db_executor(), functools.partial(fn, *args, **kwargs))
+
+def shutdown_db_executor(wait: bool = True) -> None:
+    """Shut the executor down; a later run_blocking creates a new one."""
+    global _executor
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
@@ -1,9 +1,12 @@
 import sqlite3
 import os
 import datetime
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Tuple, Union, Callable, Iterable
 
 from app.domain.models import Policy, RiskAssessment, ComplianceMonitor, Report, Activity
+from utils.constants import RISK_ASSESSMENT_AGENT_CONFIG
+from utils.policy_index import index_policy, index_policies, find_near_duplicates, DEFAULT_SIMILARITY_THRESHOLD
+from database.db_utils_sqlite import notify_write, insert_activity, policy_event_payload, monitor_event_payload
 from app.domain.repositories import (
     PolicyRepository, RiskAssessmentRepository, 
     ComplianceMonitorRepository, ReportRepository, ActivityRepository
@@ -54,11 +57,50 @@ class SQLitePolicyRepository(PolicyRepository):
             (policy.title, policy.description, policy.category, policy.status, now, now, policy.content)
         )
         policy_id = cursor.lastrowid
+        index_policy(cursor, policy_id, policy.content)
         conn.commit()
         cursor.close()
         conn.close()
+        notify_write('policy.created', policy_event_payload(policy_id, policy, now))
         return policy_id
     
+    def create_many(self, policies: List[Policy], activity_description: Optional[str] = None) -> List[int]:
+        """
+        Create many policies in one transaction and return their IDs.
+        
+        The near-duplicate index is built for the whole batch at once and a single
+        aggregated activity is logged instead of one per policy.
+        """
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        now = datetime.datetime.now().isoformat()
+        try:
+            policy_ids = []
+            for policy in policies:
+                cursor.execute(
+                    'INSERT INTO policies (title, description, category, status, created_at, updated_at, content) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (policy.title, policy.description, policy.category, policy.status, now, now, policy.content)
+                )
+                policy_ids.append(cursor.lastrowid)
+            index_policies(cursor, [(policy_id, policy.content) for policy_id, policy in zip(policy_ids, policies)])
+            
+            activity = None
+            if policy_ids:
+                activity = insert_activity(cursor, 'create_policy_pack', activity_description or f'Created {len(policy_ids)} policies',
+                                           now, 'Governance Agent', policy_ids[0], 'policy')
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+            conn.close()
+        for policy_id, policy in zip(policy_ids, policies):
+            notify_write('policy.created', policy_event_payload(policy_id, policy, now))
+        if activity:
+            notify_write('activity.created', activity)
+        return policy_ids
+    
     def update(self, policy: Policy) -> bool:
         """Update an existing policy."""
         if not policy.id:
@@ -71,11 +113,35 @@ class SQLitePolicyRepository(PolicyRepository):
             'UPDATE policies SET title = ?, description = ?, category = ?, status = ?, updated_at = ?, content = ? WHERE id = ?',
             (policy.title, policy.description, policy.category, policy.status, now, policy.content, policy.id)
         )
-        conn.commit()
         success = cursor.rowcount > 0
+        if success:
+            index_policy(cursor, policy.id, policy.content)
+        conn.commit()
         cursor.close()
         conn.close()
+        if success:
+            notify_write('policy.updated', policy_event_payload(policy.id, policy, now))
         return success
+    
+    def get_category_counts(self) -> Dict[str, Dict[str, int]]:
+        """Retrieve the active and total policy counts per category (maintained by triggers)."""
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT category, active_count, total_count FROM policy_category_counts')
+        counts = {row['category']: {'active': row['active_count'], 'total': row['total_count']} for row in cursor.fetchall()}
+        cursor.close()
+        conn.close()
+        return counts
+    
+    def find_near_duplicates(self, policy_id: int, threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+                             limit: int = 20) -> List[Dict[str, Any]]:
+        """Find policies with near-duplicate content using the LSH bucket index."""
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        matches = find_near_duplicates(cursor, policy_id, threshold, limit)
+        cursor.close()
+        conn.close()
+        return matches
 
 class SQLiteRiskAssessmentRepository(RiskAssessmentRepository):
     def get_all(self) -> List[Dict[str, Any]]:
@@ -104,14 +170,82 @@ class SQLiteRiskAssessmentRepository(RiskAssessmentRepository):
         cursor = conn.cursor()
         now = datetime.datetime.now().isoformat()
         cursor.execute(
-            'INSERT INTO risk_assessments (title, model_name, risk_score, findings, recommendations, created_at, status) VALUES (?, ?, ?, ?, ?, ?, ?)',
-            (assessment.title, assessment.model_name, assessment.risk_score, assessment.findings, assessment.recommendations, now, assessment.status)
+            'INSERT INTO risk_assessments (title, model_name, risk_score, findings, recommendations, created_at, status, score_source) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+            (assessment.title, assessment.model_name, assessment.risk_score, assessment.findings, assessment.recommendations, now,
+             assessment.status, assessment.score_source)
         )
         assessment_id = cursor.lastrowid
         conn.commit()
         cursor.close()
         conn.close()
+        notify_write('risk_assessment.created', {
+            "id": assessment_id, "title": assessment.title, "model_name": assessment.model_name,
+            "risk_score": assessment.risk_score, "status": assessment.status, "created_at": now
+        })
         return assessment_id
+    
+    def update_scores(self, scores: List[Tuple[int, float, str]], weights: Optional[Dict[str, float]] = None) -> int:
+        """
+        Update (id, risk score, risk level) of many engine-scored assessments in one transaction.
+        
+        Assessments whose score was entered rather than computed are left unchanged. When
+        weights are given they are saved as the category weights in the same transaction.
+        """
+        # Only statuses that are themselves risk levels follow the score; workflow statuses are kept
+        level_names = [status for status, _ in RISK_ASSESSMENT_AGENT_CONFIG["risk_levels"]]
+        placeholders = ', '.join('?' for _ in level_names)
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.executemany(
+            f"UPDATE risk_assessments SET risk_score = ?, status = CASE WHEN status IN ({placeholders}) THEN ? ELSE status END "
+            f"WHERE id = ? AND score_source = 'engine'",
+            [(score, *level_names, level, assessment_id) for assessment_id, score, level in scores]
+        )
+        updated = cursor.rowcount
+        if weights:
+            cursor.executemany(
+                'INSERT OR REPLACE INTO risk_category_weights (category, weight) VALUES (?, ?)',
+                list(weights.items())
+            )
+        conn.commit()
+        cursor.close()
+        conn.close()
+        return updated
+    
+    def get_category_weights(self) -> Dict[str, float]:
+        """Retrieve the saved category weights of the risk scoring engine (empty if never changed)."""
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT category, weight FROM risk_category_weights')
+        weights = {row['category']: row['weight'] for row in cursor.fetchall()}
+        cursor.close()
+        conn.close()
+        return weights
+    
+    def get_category_scores(self) -> Dict[int, Dict[str, float]]:
+        """Retrieve the per-category risk scores of every assessment, keyed by assessment ID."""
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.execute('SELECT assessment_id, category, score FROM risk_category_scores')
+        scores = {}
+        for row in cursor.fetchall():
+            scores.setdefault(row['assessment_id'], {})[row['category']] = row['score']
+        cursor.close()
+        conn.close()
+        return scores
+    
+    def save_category_scores(self, rows: List[Tuple[int, str, str, float]]) -> int:
+        """Insert or replace (assessment id, model name, category, score) rows in one transaction."""
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.executemany(
+            'INSERT OR REPLACE INTO risk_category_scores (assessment_id, model_name, category, score) VALUES (?, ?, ?, ?)',
+            rows
+        )
+        conn.commit()
+        cursor.close()
+        conn.close()
+        return len(rows)
 
 class SQLiteComplianceMonitorRepository(ComplianceMonitorRepository):
     def get_all(self) -> List[Dict[str, Any]]:
@@ -147,6 +281,7 @@ class SQLiteComplianceMonitorRepository(ComplianceMonitorRepository):
         conn.commit()
         cursor.close()
         conn.close()
+        notify_write('monitor.created', monitor_event_payload(monitor_id, monitor, now))
         return monitor_id
     
     def update(self, monitor: ComplianceMonitor) -> bool:
@@ -165,8 +300,28 @@ class SQLiteComplianceMonitorRepository(ComplianceMonitorRepository):
         success = cursor.rowcount > 0
         cursor.close()
         conn.close()
+        if success:
+            notify_write('monitor.updated', monitor_event_payload(monitor.id, monitor, now))
         return success
 
+# Report snapshot parts: (key, tables the part is read from, query)
+SNAPSHOT_QUERIES = [
+    ('policies', ('policies',),
+     'SELECT id, title, category, status, created_at, updated_at FROM policies ORDER BY updated_at DESC'),
+    ('policy_category_counts', ('policies',),
+     'SELECT category, active_count, total_count FROM policy_category_counts'),
+    ('model_risk', ('risk_assessments',),
+     'SELECT * FROM model_risk_current ORDER BY risk_score DESC, model_name'),
+    ('risk_categories', ('risk_assessments', 'risk_category_scores'),
+     """SELECT rcs.category, AVG(rcs.score) AS average_score, MAX(rcs.score) AS max_score
+     FROM risk_category_scores rcs JOIN model_risk_current mrc ON mrc.assessment_id = rcs.assessment_id
+     GROUP BY rcs.category ORDER BY average_score DESC"""),
+    ('compliance_monitors', ('compliance_monitors',),
+     'SELECT * FROM compliance_monitors ORDER BY id'),
+    ('recent_activities', ('activities',),
+     'SELECT * FROM activities ORDER BY created_at DESC LIMIT 20')
+]
+
 class SQLiteReportRepository(ReportRepository):
     def get_all(self) -> List[Dict[str, Any]]:
         """Retrieve all reports from the database."""
@@ -201,7 +356,76 @@ class SQLiteReportRepository(ReportRepository):
         conn.commit()
         cursor.close()
         conn.close()
+        notify_write('report.created', {
+            "id": report_id, "title": report.title, "report_type": report.report_type, "status": report.status, "created_at": now
+        })
         return report_id
+    
+    def get_snapshot(self, select_tables: Optional[Callable[[Dict[str, int]], Iterable[str]]] = None) -> Dict[str, Any]:
+        """
+        Read the data a report is built from in one consistent read transaction.
+        
+        Every query runs inside the same transaction, so writes committed while the
+        snapshot is being read never produce sections that disagree with each other,
+        and the data versions returned under "data_versions" describe exactly the
+        data read. When select_tables is given it is called with those versions and
+        only the parts of the snapshot read from the tables it returns are loaded.
+        """
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute('BEGIN')
+            cursor.execute('SELECT table_name, version FROM data_versions')
+            versions = {row['table_name']: row['version'] for row in cursor.fetchall()}
+            tables = set(select_tables(versions)) if select_tables else None
+            snapshot = {'taken_at': datetime.datetime.now().isoformat(), 'data_versions': versions}
+            for part, part_tables, query in SNAPSHOT_QUERIES:
+                if tables is None or tables.intersection(part_tables):
+                    cursor.execute(query)
+                    snapshot[part] = cursor.fetchall()
+            conn.commit()
+        finally:
+            cursor.close()
+            conn.close()
+        return snapshot
+    
+    def get_daily_rollups(self, start_day: str, end_day: str) -> Dict[str, Any]:
+        """
+        Read the daily compliance and risk rollups of a date range (ISO days, inclusive).
+        
+        Compliance rows start at the last recorded day on or before start_day, since a
+        day's monitor state carries forward until the next monitor write.
+        """
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        try:
+            cursor.execute('BEGIN')
+            cursor.execute(
+                """SELECT * FROM daily_compliance_rollup
+                WHERE day >= COALESCE((SELECT MAX(day) FROM daily_compliance_rollup WHERE day <= ?), ?) AND day <= ?
+                ORDER BY day""",
+                (start_day, start_day, end_day)
+            )
+            compliance = cursor.fetchall()
+            cursor.execute('SELECT * FROM daily_risk_rollup WHERE day BETWEEN ? AND ? ORDER BY day', (start_day, end_day))
+            risk = cursor.fetchall()
+            conn.commit()
+        finally:
+            cursor.close()
+            conn.close()
+        return {"start_day": start_day, "end_day": end_day, "compliance": compliance, "risk": risk}
+    
+    def save_section_timings(self, report_id: int, timings: Dict[str, float]) -> None:
+        """Record how long each section of a report took to build, in milliseconds."""
+        conn = get_db_connection()
+        cursor = conn.cursor()
+        cursor.executemany(
+            'INSERT OR REPLACE INTO report_section_timings (report_id, section, position, elapsed_ms) VALUES (?, ?, ?, ?)',
+            [(report_id, section, position, elapsed_ms) for position, (section, elapsed_ms) in enumerate(timings.items())]
+        )
+        conn.commit()
+        cursor.close()
+        conn.close()
 
 class SQLiteActivityRepository(ActivityRepository):
     def get_recent(self, limit: int = 10) -> List[Dict[str, Any]]:
@@ -219,12 +443,10 @@ class SQLiteActivityRepository(ActivityRepository):
         conn = get_db_connection()
         cursor = conn.cursor()
         now = datetime.datetime.now().isoformat()
-        cursor.execute(
-            'INSERT INTO activities (activity_type, description, created_at, actor, related_entity_id, related_entity_type) VALUES (?, ?, ?, ?, ?, ?)',
-            (activity.activity_type, activity.description, now, activity.actor, activity.related_entity_id, activity.related_entity_type)
-        )
-        activity_id = cursor.lastrowid
+        row = insert_activity(cursor, activity.activity_type, activity.description, now, activity.actor,
+                              activity.related_entity_id, activity.related_entity_type)
         conn.commit()
         cursor.close()
         conn.close()
-        return activity_id
\ No newline at end of file
+        notify_write('activity.created', row)
+        return row['id']
\ No newline at end of file
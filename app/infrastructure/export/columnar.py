@@ -0,0 +1,353 @@
+"""
+Columnar (Parquet / Arrow IPC) export of governance tables for analytics.
+
+Each table is written as a hive-partitioned dataset under the export directory,
+one directory per calendar date of the table's date column:
+
+    database/data/exports/risk_assessments/date=2025-03-28/part-<run>-0.parquet
+
+Files are zstd-compressed. Exports are incremental: a watermark per table,
+kept in _watermarks.json next to the datasets, records the last exported
+position, and each run appends new part files holding only the rows past it.
+Append-only tables are tracked by rowid. Policies and compliance monitors are
+tracked by their update / check time, so every export appends the rows changed
+since the previous one and the dataset accumulates their history. Updates that
+keep a row's rowid and timestamp (assessment re-scoring) need a full export.
+
+The datasets can be read with pandas, polars or duckdb directly
+(e.g. read_parquet('database/data/exports/activities/*/*.parquet')) or with
+read_table below, which memory-maps the files.
+
+pyarrow is optional; without it exports raise RuntimeError.
+"""
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import threading
+import uuid
+from collections import OrderedDict, defaultdict
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional
+
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.fs as pafs
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+logger = logging.getLogger('aigovernance.export')
+
+DEFAULT_EXPORT_DB_PATH = 'database/data/aigovernance.db'
+DEFAULT_EXPORT_DIR = os.environ.get('COLUMNAR_EXPORT_DIR', 'database/data/exports')
+
+WATERMARK_FILE = '_watermarks.json'
+
+# File format -> (pyarrow dataset format, file extension)
+COLUMNAR_FORMATS = {
+    'parquet': ('parquet', 'parquet'),
+    'arrow': ('ipc', 'arrow')
+}
+
+# Exported tables. columns: (name, type, SQL expression when not the column itself);
+# watermark: ordering expression rows are exported past, starting after
+# watermark_start; partition_date: column whose date names the partition.
+COLUMNAR_TABLES: Dict[str, Dict[str, Any]] = {
+    'policies': {
+        'source': 'policies',
+        'columns': [('id', 'int64'), ('title', 'string'), ('description', 'string'), ('category', 'string'),
+                    ('status', 'string'), ('created_at', 'timestamp'), ('updated_at', 'timestamp'),
+                    ('content', 'string')],
+        'watermark': "COALESCE(updated_at, '')",
+        'watermark_start': '',
+        'partition_date': 'updated_at'
+    },
+    'risk_assessments': {
+        'source': 'risk_assessments',
+        'columns': [('id', 'int64'), ('title', 'string'), ('model_name', 'string'), ('risk_score', 'float64'),
+                    ('findings', 'string'), ('recommendations', 'string'), ('created_at', 'timestamp'),
+                    ('status', 'string')],
+        'watermark': 'risk_assessments.rowid',
+        'watermark_start': 0,
+        'partition_date': 'created_at'
+    },
+    'risk_category_scores': {
+        # Re-scoring replaces rows, which assigns new rowids, so each re-score is appended
+        'source': 'risk_category_scores JOIN risk_assessments ra ON ra.id = risk_category_scores.assessment_id',
+        'columns': [('assessment_id', 'int64'), ('model_name', 'string', 'risk_category_scores.model_name'),
+                    ('category', 'string'), ('score', 'float64'), ('assessed_at', 'timestamp', 'ra.created_at')],
+        'watermark': 'risk_category_scores.rowid',
+        'watermark_start': 0,
+        'partition_date': 'ra.created_at'
+    },
+    'compliance_monitors': {
+        'source': 'compliance_monitors',
+        'columns': [('id', 'int64'), ('name', 'string'), ('description', 'string'), ('model_or_system', 'string'),
+                    ('threshold_value', 'float64'), ('current_value', 'float64'), ('status', 'string'),
+                    ('last_checked', 'timestamp'), ('alert_level', 'string')],
+        'watermark': "COALESCE(last_checked, '')",
+        'watermark_start': '',
+        'partition_date': 'last_checked'
+    },
+    'reports': {
+        'source': 'reports',
+        'columns': [('id', 'int64'), ('title', 'string'), ('description', 'string'), ('report_type', 'string'),
+                    ('created_at', 'timestamp'), ('content', 'string'), ('insights', 'string'), ('status', 'string')],
+        'watermark': 'reports.rowid',
+        'watermark_start': 0,
+        'partition_date': 'created_at'
+    },
+    'activities': {
+        'source': 'activities',
+        'columns': [('id', 'int64'), ('activity_type', 'string'), ('description', 'string'),
+                    ('created_at', 'timestamp'), ('actor', 'string'), ('related_entity_id', 'int64'),
+                    ('related_entity_type', 'string')],
+        'watermark': 'activities.rowid',
+        'watermark_start': 0,
+        'partition_date': 'created_at'
+    }
+}
+
+def columnar_available() -> bool:
+    """Whether pyarrow is installed."""
+    return pa is not None
+
+def _require_pyarrow():
+    if pa is None:
+        raise RuntimeError("pyarrow is not installed; install it to use columnar exports")
+
+def _arrow_type(type_name: str):
+    return {
+        'int64': pa.int64(),
+        'float64': pa.float64(),
+        'string': pa.string(),
+        'timestamp': pa.timestamp('us')
+    }[type_name]
+
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+def _rowid_column(config: Dict[str, Any]) -> str:
+    return f"{config['source'].split()[0]}.rowid"
+
+class _PartitionWriters:
+    """Open file writers per date partition, at most max_open at once (least recently used closed first)."""
+
+    def __init__(self, table_dir: str, schema, file_format: str, run_id: str, max_open: int):
+        self.table_dir = table_dir
+        self.schema = schema
+        self.file_format = file_format
+        self.run_id = run_id
+        self.max_open = max_open
+        self.paths: List[str] = []
+        self._open: "OrderedDict[str, Any]" = OrderedDict()
+
+    def write(self, date: str, table) -> None:
+        writer = self._open.get(date)
+        if writer is None:
+            if len(self._open) >= self.max_open:
+                self._open.popitem(last=False)[1].close()
+            writer = self._open[date] = self._new_writer(date)
+        else:
+            self._open.move_to_end(date)
+        writer.write_table(table)
+
+    def _new_writer(self, date: str):
+        partition_dir = os.path.join(self.table_dir, f"date={date}")
+        os.makedirs(partition_dir, exist_ok=True)
+        path = os.path.join(partition_dir, f"part-{self.run_id}-{len(self.paths)}.{COLUMNAR_FORMATS[self.file_format][1]}")
+        self.paths.append(path)
+        if self.file_format == 'parquet':
+            return pq.ParquetWriter(path, self.schema, compression='zstd')
+        return _ArrowFileWriter(path, self.schema)
+
+    def close(self) -> None:
+        while self._open:
+            self._open.popitem(last=False)[1].close()
+
+class _ArrowFileWriter:
+    """Arrow IPC file writer that also closes its output file."""
+
+    def __init__(self, path: str, schema):
+        self._sink = pa.OSFile(path, 'wb')
+        self._writer = pa.ipc.new_file(self._sink, schema, options=pa.ipc.IpcWriteOptions(compression='zstd'))
+
+    def write_table(self, table) -> None:
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        self._writer.close()
+        self._sink.close()
+
+class ColumnarExporter:
+    """Writes incremental, date-partitioned columnar exports of the governance tables."""
+
+    def __init__(self, db_path: str = DEFAULT_EXPORT_DB_PATH, export_dir: str = DEFAULT_EXPORT_DIR,
+                 batch_size: int = 50000, max_open_partitions: int = 128):
+        self.db_path = db_path
+        self.export_dir = export_dir
+        self.batch_size = batch_size
+        self.max_open_partitions = max_open_partitions
+        # Runs over the same export directory must not interleave their watermark updates
+        self._lock = threading.Lock()
+
+    def watermarks(self) -> Dict[str, Dict[str, Any]]:
+        """Export state per table: format, watermark position, rows and files written, last export time."""
+        path = os.path.join(self.export_dir, WATERMARK_FILE)
+        if not os.path.exists(path):
+            return {}
+        with open(path) as f:
+            return json.load(f)
+
+    def _save_watermarks(self, watermarks: Dict[str, Dict[str, Any]]) -> None:
+        os.makedirs(self.export_dir, exist_ok=True)
+        path = os.path.join(self.export_dir, WATERMARK_FILE)
+        with open(path + '.tmp', 'w') as f:
+            json.dump(watermarks, f, indent=2)
+        os.replace(path + '.tmp', path)
+
+    def export(self, tables: Optional[List[str]] = None, full: bool = False, file_format: Optional[str] = None,
+               progress: Optional[Callable[[int], None]] = None) -> Dict[str, Any]:
+        """
+        Export tables, appending the rows past each table's watermark.
+
+        Args:
+            tables: Tables to export (defaults to every table in COLUMNAR_TABLES)
+            full: Discard the existing dataset and watermark and export every row
+            file_format: 'parquet' or 'arrow'; defaults to each dataset's existing format, else parquet
+            progress: Optional callback receiving the number of tables exported so far
+
+        Returns:
+            {"export_dir": str, "tables": {table: {"rows": int, "files": int, "watermark": ...}}}
+
+        Raises:
+            RuntimeError: If pyarrow is not installed
+            ValueError: If a table or the format is unknown, or the format differs from an existing dataset's
+        """
+        _require_pyarrow()
+        tables = tables or list(COLUMNAR_TABLES)
+        unknown = [table for table in tables if table not in COLUMNAR_TABLES]
+        if unknown:
+            raise ValueError(f"Unknown tables: {', '.join(unknown)}")
+        if file_format is not None and file_format not in COLUMNAR_FORMATS:
+            raise ValueError(f"Unsupported columnar format: {file_format}")
+
+        results = {}
+        with self._lock:
+            watermarks = self.watermarks()
+            for done, table in enumerate(tables, 1):
+                results[table] = self._export_table(table, watermarks, full, file_format)
+                self._save_watermarks(watermarks)
+                if progress:
+                    progress(done)
+        return {"export_dir": self.export_dir, "tables": results}
+
+    def _export_table(self, table: str, watermarks: Dict[str, Dict[str, Any]], full: bool,
+                      file_format: Optional[str]) -> Dict[str, Any]:
+        config = COLUMNAR_TABLES[table]
+        table_dir = os.path.join(self.export_dir, table)
+        state = watermarks.get(table)
+        file_format = file_format or (state["format"] if state and not full else 'parquet')
+        if full or state is None:
+            shutil.rmtree(table_dir, ignore_errors=True)
+            state = {"format": file_format, "watermark": config['watermark_start'], "rowid": 0, "rows": 0, "files": 0}
+        elif state["format"] != file_format:
+            raise ValueError(f"{table} is exported as {state['format']}; run a full export to switch to {file_format}")
+
+        names = [column[0] for column in config['columns']]
+        types = [column[1] for column in config['columns']]
+        schema = pa.schema([(name, _arrow_type(type_name)) for name, type_name in zip(names, types)])
+        expressions = ', '.join(column[2] if len(column) > 2 else f"{config['source'].split()[0]}.{column[0]}"
+                                for column in config['columns'])
+        rowid = _rowid_column(config)
+        query = (f"SELECT {expressions}, {config['watermark']}, {rowid}, "
+                 f"COALESCE(substr({config['partition_date']}, 1, 10), 'unknown') "
+                 f"FROM {config['source']} "
+                 f"WHERE ({config['watermark']}, {rowid}) > (?, ?) "
+                 f"ORDER BY {config['watermark']}, {rowid} LIMIT ?")
+
+        run_id = f"{datetime.now().strftime('%Y%m%dT%H%M%S')}-{uuid.uuid4().hex[:6]}"
+        writers = _PartitionWriters(table_dir, schema, file_format, run_id, self.max_open_partitions)
+        position = (state["watermark"], state["rowid"])
+        exported = 0
+        conn = sqlite3.connect(self.db_path)
+        try:
+            while True:
+                # Each page is its own short read, so writers are never blocked for the whole export
+                rows = conn.execute(query, (*position, self.batch_size)).fetchall()
+                if not rows:
+                    break
+                columns = list(zip(*rows))
+                arrays = [
+                    pa.array([_parse_timestamp(v) for v in values] if type_name == 'timestamp' else values,
+                             type=_arrow_type(type_name))
+                    for values, type_name in zip(columns, types)
+                ]
+                batch = pa.Table.from_arrays(arrays, schema=schema)
+                by_date = defaultdict(list)
+                for index, date in enumerate(columns[-1]):
+                    by_date[date].append(index)
+                for date, indices in by_date.items():
+                    part = batch if len(indices) == len(rows) else batch.take(pa.array(indices))
+                    writers.write(date, part)
+                exported += len(rows)
+                position = (rows[-1][-3], rows[-1][-2])
+                if len(rows) < self.batch_size:
+                    break
+            writers.close()
+        except BaseException:
+            # Leave the dataset as the watermark describes it: drop this run's partial files
+            writers.close()
+            for path in writers.paths:
+                if os.path.exists(path):
+                    os.remove(path)
+            raise
+        finally:
+            conn.close()
+
+        state.update({
+            "format": file_format,
+            "watermark": position[0],
+            "rowid": position[1],
+            "rows": state["rows"] + exported,
+            "files": state["files"] + len(writers.paths),
+            "exported_at": datetime.now().isoformat()
+        })
+        watermarks[table] = state
+        logger.info(f"Exported {exported} {table} rows to {len(writers.paths)} {file_format} files")
+        return {"rows": exported, "files": len(writers.paths), "watermark": state["watermark"]}
+
+def open_dataset(table: str, export_dir: str = DEFAULT_EXPORT_DIR, memory_map: bool = True):
+    """
+    Open an exported table as a pyarrow dataset with its "date" partition column.
+
+    Files are memory-mapped by default, so scans read pages on demand instead of
+    copying whole files; uncompressed Arrow files would be read with no copy at all.
+    """
+    _require_pyarrow()
+    state = ColumnarExporter(export_dir=export_dir).watermarks().get(table)
+    if state is None:
+        raise ValueError(f"{table} has not been exported to {export_dir}")
+    return ds.dataset(
+        os.path.join(export_dir, table),
+        format=COLUMNAR_FORMATS[state["format"]][0],
+        partitioning=ds.partitioning(pa.schema([("date", pa.string())]), flavor="hive"),
+        filesystem=pafs.LocalFileSystem(use_mmap=memory_map)
+    )
+
+def read_table(table: str, export_dir: str = DEFAULT_EXPORT_DIR, columns: Optional[List[str]] = None,
+               filter=None, memory_map: bool = True):
+    """
+    Read an exported table (optionally a column subset and a row filter) into a pyarrow Table.
+
+    Example:
+        read_table("risk_assessments", columns=["model_name", "risk_score"],
+                   filter=ds.field("date") >= "2025-03-01").to_pandas()
+    """
+    return open_dataset(table, export_dir, memory_map).to_table(columns=columns, filter=filter)
@@ -0,0 +1,425 @@
+"""
+SQLite-backed background job queue.
+
+Long-running agent work (policy packs, portfolio re-scoring, report generation)
+is submitted as a job of a registered kind with a JSON payload. Jobs are
+persisted in the jobs table, executed by a small pool of worker threads and
+report progress, so request handlers return a job id immediately and clients
+poll (or stream) its status. CPU-heavy handlers can still fan out to worker
+processes through AnalysisEngine.map_batch.
+
+Cancellation is cooperative: a cancelled pending job never starts, and a
+running job's next progress report raises JobCancelled inside its handler.
+Finished jobs are retained for a configurable time, then pruned.
+
+Several processes may share the jobs table. A running job records the queue
+that claimed it and a heartbeat the queue renews; only jobs whose heartbeat is
+older than the lease (their process died) are failed as interrupted.
+"""
+import json
+import logging
+import os
+import queue
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from database import db_utils_sqlite
+
+logger = logging.getLogger('aigovernance.jobs')
+
+DEFAULT_NUM_WORKERS = int(os.environ.get('JOB_QUEUE_WORKERS', 2))
+
+# A running job whose heartbeat is older than this is taken to have lost its process
+DEFAULT_LEASE_SECONDS = 60.0
+
+# Finished jobs are kept this long, and at most this many, for status polling
+DEFAULT_RETENTION_HOURS = 24
+DEFAULT_MAX_FINISHED_JOBS = 500
+
+# Minimum interval between progress writes of a running job
+PROGRESS_WRITE_INTERVAL = 0.25
+
+# Minimum interval between retention sweeps
+PRUNE_INTERVAL = 60.0
+
+FINISHED_STATUSES = ("completed", "failed", "cancelled")
+
+class JobCancelled(Exception):
+    """Raised inside a job handler when its job has been cancelled."""
+
+class JobContext:
+    """Handed to a job handler: the job's payload plus progress reporting."""
+
+    def __init__(self, job_queue: 'JobQueue', job_id: str, payload: Dict[str, Any], total: int):
+        self.job_queue = job_queue
+        self.job_id = job_id
+        self.payload = payload
+        self.total = total
+        self._last_write = 0.0
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancellation of this job has been requested."""
+        return self.job_queue.cancel_requested(self.job_id)
+
+    def progress(self, completed: int, total: Optional[int] = None) -> None:
+        """
+        Report progress; writes are throttled.
+
+        Raises:
+            JobCancelled: If the job has been cancelled
+        """
+        if total is not None:
+            self.total = total
+        now = time.monotonic()
+        if now - self._last_write >= PROGRESS_WRITE_INTERVAL or completed >= self.total:
+            self._last_write = now
+            self.job_queue._write_progress(self.job_id, completed, self.total)
+        if self.cancelled:
+            raise JobCancelled(self.job_id)
+
+class JobQueue:
+    """Persists, runs and reports on background jobs."""
+
+    def __init__(self, db_path: Optional[str] = None, num_workers: int = DEFAULT_NUM_WORKERS,
+                 retention_hours: float = DEFAULT_RETENTION_HOURS, max_finished: int = DEFAULT_MAX_FINISHED_JOBS,
+                 lease_seconds: float = DEFAULT_LEASE_SECONDS):
+        """
+        Initialize the queue; workers start on start() or the first submission.
+
+        Args:
+            db_path: SQLite database holding the jobs table (defaults to the application database)
+            num_workers: Number of worker threads
+            retention_hours: How long finished jobs remain available
+            max_finished: Maximum number of finished jobs retained
+            lease_seconds: Heartbeat age after which another process's running job counts as interrupted
+        """
+        self.db_path = db_path or db_utils_sqlite.DB_PATH
+        self.num_workers = max(1, num_workers)
+        self.retention = timedelta(hours=retention_hours)
+        self.max_finished = max_finished
+        self.lease = timedelta(seconds=lease_seconds)
+        self.owner = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._handlers: Dict[str, Callable[[JobContext], Any]] = {}
+        self._pending: 'queue.Queue[Optional[str]]' = queue.Queue()
+        self._workers: List[threading.Thread] = []
+        self._heartbeat: Optional[threading.Thread] = None
+        self._stopping = threading.Event()
+        # Jobs running here whose cancellation was requested; discarded when they finish
+        self._cancelled = set()
+        self._lock = threading.Lock()
+        self._last_prune = 0.0
+        self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = lambda cursor, row: {col[0]: row[idx] for idx, col in enumerate(cursor.description)}
+        return conn
+
+    def _ensure_schema(self) -> None:
+        os.makedirs(os.path.dirname(self.db_path) or '.', exist_ok=True)
+        conn = self._connect()
+        conn.executescript('''
+        CREATE TABLE IF NOT EXISTS jobs (
+            id TEXT PRIMARY KEY,
+            kind TEXT NOT NULL,
+            status TEXT NOT NULL,
+            payload TEXT,
+            total INTEGER NOT NULL DEFAULT 0,
+            completed INTEGER NOT NULL DEFAULT 0,
+            result TEXT,
+            error TEXT,
+            cancel_requested INTEGER NOT NULL DEFAULT 0,
+            created_at TEXT NOT NULL,
+            started_at TEXT,
+            finished_at TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_jobs_status_created_at ON jobs (status, created_at);
+        CREATE INDEX IF NOT EXISTS idx_jobs_finished_at ON jobs (finished_at);
+        ''')
+        # Jobs tables created before leases were recorded get the owner and heartbeat columns
+        columns = {row['name'] for row in conn.execute('PRAGMA table_info(jobs)')}
+        if 'owner' not in columns:
+            conn.execute('ALTER TABLE jobs ADD COLUMN owner TEXT')
+        if 'heartbeat_at' not in columns:
+            conn.execute('ALTER TABLE jobs ADD COLUMN heartbeat_at TEXT')
+        conn.commit()
+        conn.close()
+
+    def register(self, kind: str, handler: Callable[[JobContext], Any]) -> None:
+        """
+        Register the handler that runs jobs of a kind.
+
+        Args:
+            kind: Job kind, e.g. "policy_pack"
+            handler: Callable taking a JobContext and returning a JSON-serializable result
+        """
+        self._handlers[kind] = handler
+
+    @property
+    def kinds(self) -> List[str]:
+        """Registered job kinds."""
+        return sorted(self._handlers)
+
+    def start(self) -> None:
+        """Start the worker and heartbeat threads and re-queue pending jobs, e.g. left by a previous process."""
+        with self._lock:
+            if self._workers:
+                return
+            self._recover()
+            self._stopping.clear()
+            for i in range(self.num_workers):
+                worker = threading.Thread(target=self._work, name=f"job-worker-{i}", daemon=True)
+                worker.start()
+                self._workers.append(worker)
+            self._heartbeat = threading.Thread(target=self._beat, name="job-heartbeat", daemon=True)
+            self._heartbeat.start()
+        logger.info(f"Job queue {self.owner} started with {self.num_workers} workers")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the worker threads after their current jobs."""
+        with self._lock:
+            workers, self._workers = self._workers, []
+            heartbeat, self._heartbeat = self._heartbeat, None
+        for _ in workers:
+            self._pending.put(None)
+        for worker in workers:
+            worker.join(timeout)
+        self._stopping.set()
+        if heartbeat:
+            heartbeat.join(timeout)
+
+    def submit(self, kind: str, payload: Optional[Dict[str, Any]] = None, total: int = 0,
+               run_inline: bool = False) -> Dict[str, Any]:
+        """
+        Submit a job.
+
+        Args:
+            kind: A registered job kind
+            payload: JSON-serializable arguments for the handler
+            total: Number of units of work, for progress reporting
+            run_inline: Run the job in the calling thread instead of a worker
+
+        Returns:
+            A snapshot of the job (finished when run inline)
+
+        Raises:
+            ValueError: If no handler is registered for the kind
+        """
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+        if not run_inline:
+            self.start()
+        job_id = uuid.uuid4().hex
+        conn = self._connect()
+        conn.execute(
+            'INSERT INTO jobs (id, kind, status, payload, total, created_at) VALUES (?, ?, ?, ?, ?, ?)',
+            (job_id, kind, 'pending', json.dumps(payload or {}), total, datetime.now().isoformat())
+        )
+        conn.commit()
+        conn.close()
+        self._maybe_prune()
+
+        if run_inline:
+            self._run(job_id)
+        else:
+            self._pending.put(job_id)
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return a snapshot of a job, or None if it is unknown or was pruned."""
+        conn = self._connect()
+        row = conn.execute('SELECT * FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        conn.close()
+        return self._snapshot(row) if row else None
+
+    def list(self, kind: Optional[str] = None, status: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """Snapshots of retained jobs, newest first, optionally filtered by kind and status."""
+        conditions, params = [], []
+        if kind:
+            conditions.append('kind = ?')
+            params.append(kind)
+        if status:
+            conditions.append('status = ?')
+            params.append(status)
+        where = f'WHERE {" AND ".join(conditions)}' if conditions else ''
+        conn = self._connect()
+        rows = conn.execute(f'SELECT * FROM jobs {where} ORDER BY created_at DESC LIMIT ?', params + [limit]).fetchall()
+        conn.close()
+        return [self._snapshot(row) for row in rows]
+
+    def cancel(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Cancel a job: pending jobs are cancelled at once, running jobs at their next progress report.
+
+        Returns:
+            A snapshot of the job, or None if it is unknown
+        """
+        now = datetime.now().isoformat()
+        conn = self._connect()
+        cursor = conn.execute(
+            "UPDATE jobs SET status = 'cancelled', cancel_requested = 1, finished_at = ? WHERE id = ? AND status = 'pending'",
+            (now, job_id)
+        )
+        running_here = False
+        if cursor.rowcount == 0:
+            row = conn.execute(
+                "UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = 'running' RETURNING owner", (job_id,)
+            ).fetchone()
+            # A job running in another process sees the flag at its next progress report
+            running_here = row is not None and row['owner'] == self.owner
+        conn.commit()
+        conn.close()
+        if running_here:
+            with self._lock:
+                self._cancelled.add(job_id)
+        job = self.get(job_id)
+        if job is None or job['status'] != 'running':
+            # The job finished while being cancelled; its worker no longer discards the id
+            with self._lock:
+                self._cancelled.discard(job_id)
+        return job
+
+    def cancel_requested(self, job_id: str) -> bool:
+        """Whether cancellation of a job running in this process has been requested."""
+        return job_id in self._cancelled
+
+    def _snapshot(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        return {
+            "job_id": row['id'],
+            "kind": row['kind'],
+            "status": row['status'],
+            "total": row['total'],
+            "completed": row['completed'],
+            "payload": json.loads(row['payload']) if row['payload'] else {},
+            "result": json.loads(row['result']) if row['result'] else None,
+            "error": row['error'],
+            "cancel_requested": bool(row['cancel_requested']),
+            "created_at": row['created_at'],
+            "started_at": row['started_at'],
+            "finished_at": row['finished_at']
+        }
+
+    def _work(self) -> None:
+        while True:
+            job_id = self._pending.get()
+            if job_id is None:
+                return
+            try:
+                self._run(job_id)
+            except Exception as e:
+                logger.error(f"Job worker error on {job_id}: {str(e)}")
+
+    def _run(self, job_id: str) -> None:
+        conn = self._connect()
+        now = datetime.now().isoformat()
+        claimed = conn.execute(
+            "UPDATE jobs SET status = 'running', started_at = ?, owner = ?, heartbeat_at = ? WHERE id = ? AND status = 'pending'",
+            (now, self.owner, now, job_id)
+        ).rowcount
+        conn.commit()
+        row = conn.execute('SELECT kind, payload, total FROM jobs WHERE id = ?', (job_id,)).fetchone()
+        conn.close()
+        if not claimed or row is None:
+            # Cancelled (or claimed by another worker) before it started
+            return
+
+        context = JobContext(self, job_id, json.loads(row['payload'] or '{}'), row['total'])
+        try:
+            result = self._handlers[row['kind']](context)
+            self._finish(job_id, 'completed', result=result)
+        except JobCancelled:
+            self._finish(job_id, 'cancelled')
+        except Exception as e:
+            logger.error(f"Job {job_id} ({row['kind']}) failed: {str(e)}")
+            self._finish(job_id, 'failed', error=str(e))
+        finally:
+            with self._lock:
+                self._cancelled.discard(job_id)
+
+    def _write_progress(self, job_id: str, completed: int, total: int) -> None:
+        conn = self._connect()
+        row = conn.execute(
+            'UPDATE jobs SET completed = ?, total = ?, heartbeat_at = ? WHERE id = ? RETURNING cancel_requested',
+            (completed, total, datetime.now().isoformat(), job_id)
+        ).fetchone()
+        conn.commit()
+        conn.close()
+        # Picks up cancellations requested through another process sharing the database
+        if row and row['cancel_requested']:
+            with self._lock:
+                self._cancelled.add(job_id)
+
+    def _finish(self, job_id: str, status: str, result: Any = None, error: Optional[str] = None) -> None:
+        conn = self._connect()
+        conn.execute(
+            f'''UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?
+            {", completed = total" if status == "completed" else ""}
+            WHERE id = ?''',
+            (status, json.dumps(result) if result is not None else None, error, datetime.now().isoformat(), job_id)
+        )
+        conn.commit()
+        conn.close()
+
+    def _beat(self) -> None:
+        # Renew the leases of this queue's running jobs and fail those whose process stopped renewing
+        while not self._stopping.wait(self.lease.total_seconds() / 4):
+            try:
+                conn = self._connect()
+                conn.execute("UPDATE jobs SET heartbeat_at = ? WHERE owner = ? AND status = 'running'",
+                             (datetime.now().isoformat(), self.owner))
+                conn.commit()
+                conn.close()
+                self.fail_expired()
+            except Exception as e:
+                logger.error(f"Job heartbeat failed: {str(e)}")
+
+    def fail_expired(self) -> int:
+        """Fail running jobs whose lease expired because their process stopped; returns how many."""
+        now = datetime.now()
+        conn = self._connect()
+        # Jobs running when their process stopped cannot be resumed
+        failed = conn.execute(
+            """UPDATE jobs SET status = 'failed', error = 'Interrupted: its process stopped', finished_at = ?
+            WHERE status = 'running' AND owner IS NOT ? AND (heartbeat_at IS NULL OR heartbeat_at < ?)""",
+            (now.isoformat(), self.owner, (now - self.lease).isoformat())
+        ).rowcount
+        conn.commit()
+        conn.close()
+        return failed
+
+    def _recover(self) -> None:
+        self.fail_expired()
+        conn = self._connect()
+        pending = conn.execute("SELECT id, kind FROM jobs WHERE status = 'pending' ORDER BY created_at").fetchall()
+        conn.close()
+        for row in pending:
+            if row['kind'] in self._handlers:
+                self._pending.put(row['id'])
+
+    def _maybe_prune(self) -> None:
+        now = time.monotonic()
+        if now - self._last_prune < PRUNE_INTERVAL:
+            return
+        self._last_prune = now
+        self.prune()
+
+    def prune(self) -> int:
+        """Delete finished jobs past the retention period or beyond the retained count; returns the number deleted."""
+        cutoff = (datetime.now() - self.retention).isoformat()
+        conn = self._connect()
+        deleted = conn.execute('DELETE FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?', (cutoff,)).rowcount
+        deleted += conn.execute(
+            '''DELETE FROM jobs WHERE finished_at IS NOT NULL AND id NOT IN (
+                SELECT id FROM jobs WHERE finished_at IS NOT NULL ORDER BY finished_at DESC LIMIT ?
+            )''',
+            (self.max_finished,)
+        ).rowcount
+        conn.commit()
+        conn.close()
+        return deleted
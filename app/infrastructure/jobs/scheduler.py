@@ -0,0 +1,240 @@
+"""
+Report schedules on top of the job queue.
+
+A schedule names a report type, how often it runs (daily or weekly, at a local
+time of day) and how many days each run covers. A scheduler thread polls for due
+schedules, claims each run by advancing next_run_at with a compare-and-set (so
+processes sharing the database start a run once) and submits it as a "report"
+job. Scheduled runs cover the complete days before the run. Runs missed while
+the application was down are not replayed: an overdue schedule runs once and
+its next run moves to the first slot after now.
+"""
+import logging
+import sqlite3
+import threading
+from datetime import date, datetime, time as dt_time, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from app.infrastructure.jobs.queue import JobQueue
+from utils.constants import REPORTING_AGENT_CONFIG
+
+logger = logging.getLogger('aigovernance.jobs')
+
+# Seconds between checks for due schedules
+DEFAULT_POLL_INTERVAL = 60.0
+
+DEFAULT_RUN_TIME = "06:00"
+
+class ReportScheduler:
+    """Stores report schedules and submits their runs to the job queue when due."""
+
+    def __init__(self, job_queue: JobQueue, db_path: Optional[str] = None,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 section_count: Optional[Callable[[str], int]] = None):
+        """
+        Initialize the scheduler; polling starts on start().
+
+        Args:
+            job_queue: Queue the report jobs are submitted to
+            db_path: SQLite database holding the report_schedules table (defaults to the queue's)
+            poll_interval: Seconds between checks for due schedules
+            section_count: Optional callable giving a report type's number of sections, for job progress
+        """
+        self.job_queue = job_queue
+        self.db_path = db_path or job_queue.db_path
+        self.poll_interval = poll_interval
+        self.section_count = section_count
+        self.frequencies = REPORTING_AGENT_CONFIG["schedule_frequencies"]
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = lambda cursor, row: {col[0]: row[idx] for idx, col in enumerate(cursor.description)}
+        return conn
+
+    def _ensure_schema(self) -> None:
+        conn = self._connect()
+        conn.executescript('''
+        CREATE TABLE IF NOT EXISTS report_schedules (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            name TEXT NOT NULL,
+            report_type TEXT NOT NULL,
+            frequency TEXT NOT NULL,
+            period_days INTEGER NOT NULL,
+            run_time TEXT NOT NULL,
+            enabled INTEGER NOT NULL DEFAULT 1,
+            next_run_at TEXT NOT NULL,
+            last_run_at TEXT,
+            last_job_id TEXT,
+            created_at TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_report_schedules_next_run_at ON report_schedules (enabled, next_run_at);
+        ''')
+        conn.commit()
+        conn.close()
+
+    def create(self, name: str, report_type: str, frequency: str = "daily", period_days: Optional[int] = None,
+               run_time: str = DEFAULT_RUN_TIME, enabled: bool = True) -> Dict[str, Any]:
+        """
+        Create a schedule whose first run is the next occurrence of run_time.
+
+        Args:
+            name: Schedule name, used in the generated report titles
+            report_type: A configured report type
+            frequency: A key of REPORTING_AGENT_CONFIG["schedule_frequencies"]
+            period_days: Days each run covers (defaults to the days between runs)
+            run_time: Local time of day to run, "HH:MM"
+            enabled: Whether the schedule runs
+
+        Raises:
+            ValueError: If the frequency or run time is invalid
+        """
+        if frequency not in self.frequencies:
+            raise ValueError(f"Unknown frequency: {frequency}")
+        run_at = self._next_occurrence(self._parse_run_time(run_time), datetime.now())
+        conn = self._connect()
+        cursor = conn.execute(
+            '''INSERT INTO report_schedules (name, report_type, frequency, period_days, run_time, enabled, next_run_at, created_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)''',
+            (name, report_type, frequency, period_days or self.frequencies[frequency], run_time, int(enabled),
+             run_at.isoformat(), datetime.now().isoformat())
+        )
+        schedule_id = cursor.lastrowid
+        conn.commit()
+        conn.close()
+        return self.get(schedule_id)
+
+    def get(self, schedule_id: int) -> Optional[Dict[str, Any]]:
+        """Return a schedule, or None if it does not exist."""
+        conn = self._connect()
+        row = conn.execute('SELECT * FROM report_schedules WHERE id = ?', (schedule_id,)).fetchone()
+        conn.close()
+        return self._schedule(row) if row else None
+
+    def list(self) -> List[Dict[str, Any]]:
+        """All schedules, by next run."""
+        conn = self._connect()
+        rows = conn.execute('SELECT * FROM report_schedules ORDER BY next_run_at, id').fetchall()
+        conn.close()
+        return [self._schedule(row) for row in rows]
+
+    def set_enabled(self, schedule_id: int, enabled: bool) -> Optional[Dict[str, Any]]:
+        """Pause or resume a schedule; a resumed schedule next runs at the next occurrence of its run time."""
+        schedule = self.get(schedule_id)
+        if schedule is None:
+            return None
+        run_at = self._next_occurrence(self._parse_run_time(schedule['run_time']), datetime.now())
+        conn = self._connect()
+        conn.execute(
+            'UPDATE report_schedules SET enabled = ?, next_run_at = CASE WHEN ? THEN ? ELSE next_run_at END WHERE id = ?',
+            (int(enabled), int(enabled and not schedule['enabled']), run_at.isoformat(), schedule_id)
+        )
+        conn.commit()
+        conn.close()
+        return self.get(schedule_id)
+
+    def delete(self, schedule_id: int) -> bool:
+        """Delete a schedule; reports it already produced are kept."""
+        conn = self._connect()
+        deleted = conn.execute('DELETE FROM report_schedules WHERE id = ?', (schedule_id,)).rowcount
+        conn.commit()
+        conn.close()
+        return deleted > 0
+
+    def run_now(self, schedule_id: int) -> Optional[Dict[str, Any]]:
+        """Submit a run of a schedule covering the period up to today, without moving its next run."""
+        schedule = self.get(schedule_id)
+        if schedule is None:
+            return None
+        return self._submit(schedule, date.today())
+
+    def run_due(self, now: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Submit every enabled schedule whose next run is due.
+
+        Returns:
+            Snapshots of the submitted jobs
+        """
+        now = now or datetime.now()
+        conn = self._connect()
+        due = conn.execute(
+            'SELECT * FROM report_schedules WHERE enabled = 1 AND next_run_at <= ? ORDER BY next_run_at',
+            (now.isoformat(),)
+        ).fetchall()
+        jobs = []
+        for row in due:
+            interval = timedelta(days=self.frequencies.get(row['frequency'], 1))
+            next_run = datetime.fromisoformat(row['next_run_at'])
+            while next_run <= now:
+                next_run += interval
+            # Only the process that moves next_run_at from the value it read runs the schedule
+            claimed = conn.execute(
+                'UPDATE report_schedules SET next_run_at = ?, last_run_at = ? WHERE id = ? AND next_run_at = ?',
+                (next_run.isoformat(), now.isoformat(), row['id'], row['next_run_at'])
+            ).rowcount
+            conn.commit()
+            if claimed:
+                # A run covers the complete days before the day it is due
+                jobs.append(self._submit(self._schedule(row), now.date() - timedelta(days=1)))
+        conn.close()
+        return jobs
+
+    def start(self) -> None:
+        """Start polling for due schedules in a background thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._poll, name="report-scheduler", daemon=True)
+        self._thread.start()
+        logger.info(f"Report scheduler started, polling every {self.poll_interval:g}s")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop polling."""
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _poll(self) -> None:
+        while True:
+            try:
+                self.run_due()
+            except Exception as e:
+                logger.error(f"Checking report schedules failed: {str(e)}")
+            if self._stop.wait(self.poll_interval):
+                return
+
+    def _submit(self, schedule: Dict[str, Any], end_day: date) -> Dict[str, Any]:
+        start_day = end_day - timedelta(days=schedule['period_days'] - 1)
+        period = start_day.isoformat() if start_day == end_day else f"{start_day.isoformat()} to {end_day.isoformat()}"
+        job = self.job_queue.submit("report", {
+            "title": f"{schedule['name']} ({period})",
+            "description": f"Scheduled {schedule['frequency']} {schedule['report_type']} covering {period}.",
+            "report_type": schedule['report_type'],
+            "start_day": start_day.isoformat(),
+            "end_day": end_day.isoformat(),
+            "schedule_id": schedule['id']
+        }, total=self.section_count(schedule['report_type']) if self.section_count else 0)
+        conn = self._connect()
+        conn.execute('UPDATE report_schedules SET last_job_id = ? WHERE id = ?', (job['job_id'], schedule['id']))
+        conn.commit()
+        conn.close()
+        logger.info(f"Submitted report schedule {schedule['id']} ({schedule['name']}) as job {job['job_id']}")
+        return job
+
+    @staticmethod
+    def _parse_run_time(run_time: str) -> dt_time:
+        try:
+            return dt_time.fromisoformat(run_time)
+        except ValueError:
+            raise ValueError(f"Invalid run time (expected HH:MM): {run_time}")
+
+    @staticmethod
+    def _next_occurrence(run_time: dt_time, now: datetime) -> datetime:
+        run_at = datetime.combine(now.date(), run_time)
+        return run_at if run_at > now else run_at + timedelta(days=1)
+
+    def _schedule(self, row: Dict[str, Any]) -> Dict[str, Any]:
+        return {**row, "enabled": bool(row['enabled'])}
@@ -0,0 +1,295 @@
+"""
+Live dashboard updates for server-sent event and WebSocket clients.
+
+One stream per process turns monitor value changes, alert level transitions and
+new activities into events and fans each out to every connected client, so N open
+dashboards cost no more than one. When attached to the event bus (as the
+container does) the changes arrive as write notifications and nothing is polled.
+Standalone, a watcher reads data_versions each interval (one small query) and
+re-reads monitors, or the activities added since its last check, only when their
+table changed.
+
+Every event gets an id "<stream>-<sequence>" and the most recent ones are kept.
+A client reconnecting with Last-Event-ID is sent the events it missed, or a
+"reset" event if they are no longer kept or the id comes from another process;
+on "reset" the client refetches the dashboard. Each client has a bounded queue:
+a client that falls that far behind has its queue replaced by a single "reset"
+rather than holding back the other clients or growing without bound.
+"""
+import asyncio
+import json
+import logging
+import os
+import threading
+import uuid
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional, Set, Tuple
+
+from app.infrastructure.database.executor import run_blocking
+from app.infrastructure.messaging.event_bus import Event, EventBus
+from database import db_utils_sqlite
+
+logger = logging.getLogger('aigovernance.messaging')
+
+# Seconds between change checks
+DEFAULT_POLL_INTERVAL = float(os.environ.get('DASHBOARD_STREAM_POLL_INTERVAL', 1.0))
+
+# Events kept for Last-Event-ID resume
+DEFAULT_HISTORY_SIZE = 1000
+
+# Events a client may have waiting before it is sent a "reset" instead
+DEFAULT_CLIENT_QUEUE_SIZE = 256
+
+# Seconds of silence after which an SSE comment is sent to keep proxies from closing the stream
+DEFAULT_HEARTBEAT_INTERVAL = 15.0
+
+MONITOR_COLUMNS = ('id', 'name', 'model_or_system', 'threshold_value', 'current_value', 'status', 'alert_level', 'last_checked')
+
+@dataclass(frozen=True)
+class StreamEvent:
+    """An event as delivered to clients."""
+    id: str
+    sequence: int
+    event: str
+    data: Dict[str, Any]
+
+    def to_sse(self) -> str:
+        return f"id: {self.id}\nevent: {self.event}\ndata: {json.dumps(self.data, default=str)}\n\n"
+
+    def to_message(self) -> Dict[str, Any]:
+        return {"id": self.id, "event": self.event, "data": self.data}
+
+class DashboardStream:
+    """Detects dashboard changes and fans them out to subscribed clients."""
+
+    def __init__(self, poll_interval: float = DEFAULT_POLL_INTERVAL, history_size: int = DEFAULT_HISTORY_SIZE,
+                 client_queue_size: int = DEFAULT_CLIENT_QUEUE_SIZE):
+        """
+        Initialize the stream; the watcher starts with the first subscriber.
+
+        Args:
+            poll_interval: Seconds between change checks
+            history_size: Number of recent events kept for resuming clients
+            client_queue_size: Events a client may have waiting before it is reset
+        """
+        self.poll_interval = poll_interval
+        self.client_queue_size = client_queue_size
+        self.stream_id = uuid.uuid4().hex[:8]
+        self._sequence = 0
+        self._history: Deque[StreamEvent] = deque(maxlen=history_size)
+        self._clients: Set[asyncio.Queue] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._watcher: Optional[asyncio.Task] = None
+        self._bus: Optional[EventBus] = None
+        self._lock = threading.Lock()
+        # Watcher state: table versions, monitors and newest activity at the last check
+        self._versions: Optional[Dict[str, int]] = None
+        self._monitors: Dict[int, Dict[str, Any]] = {}
+        self._last_activity_id = 0
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    def publish(self, event: str, data: Dict[str, Any]) -> None:
+        """Send an event to every client; safe to call from any thread."""
+        loop = self._loop
+        if loop is None or loop.is_closed():
+            self._dispatch(event, data)
+            return
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._dispatch(event, data)
+        else:
+            loop.call_soon_threadsafe(self._dispatch, event, data)
+
+    def attach(self, bus: EventBus) -> None:
+        """Take monitor and activity changes from the event bus instead of polling for them."""
+        conn = db_utils_sqlite.get_db_connection()
+        try:
+            monitors = {row['id']: row for row in conn.execute(
+                f"SELECT {', '.join(MONITOR_COLUMNS)} FROM compliance_monitors"
+            )}
+        finally:
+            conn.close()
+        with self._lock:
+            self._monitors = monitors
+        self._bus = bus
+        # One subscription so events reach clients in the order they were published
+        bus.subscribe("*", self._on_bus_event)
+
+    async def subscribe(self, last_event_id: Optional[str] = None) -> asyncio.Queue:
+        """
+        Register a client and return the queue its events arrive on.
+
+        Args:
+            last_event_id: Id of the last event the client received, to resume after it
+        """
+        self._start()
+        client: asyncio.Queue = asyncio.Queue(maxsize=self.client_queue_size)
+        if last_event_id:
+            for event in self._replay(last_event_id):
+                self._offer(client, event)
+        self._clients.add(client)
+        return client
+
+    def unsubscribe(self, client: asyncio.Queue) -> None:
+        self._clients.discard(client)
+
+    async def sse(self, last_event_id: Optional[str] = None,
+                  heartbeat_interval: float = DEFAULT_HEARTBEAT_INTERVAL) -> AsyncIterator[str]:
+        """Yield a client's events formatted as server-sent events until it disconnects."""
+        client = await self.subscribe(last_event_id)
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    event = await asyncio.wait_for(client.get(), heartbeat_interval)
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                yield event.to_sse()
+        finally:
+            self.unsubscribe(client)
+
+    async def stop(self) -> None:
+        """Stop the watcher; connected clients stay subscribed."""
+        if self._watcher:
+            self._watcher.cancel()
+            try:
+                await self._watcher
+            except asyncio.CancelledError:
+                pass
+            self._watcher = None
+
+    def _start(self) -> None:
+        loop = asyncio.get_running_loop()
+        if self._bus is not None:
+            self._loop = loop
+            return
+        if self._watcher is None or self._watcher.done() or self._loop is not loop:
+            if self._watcher and not self._watcher.done() and not self._loop.is_closed():
+                # Subscribed from a different event loop: move the watcher to it
+                self._loop.call_soon_threadsafe(self._watcher.cancel)
+            self._loop = loop
+            self._watcher = loop.create_task(self._watch())
+
+    def _dispatch(self, event: str, data: Dict[str, Any]) -> None:
+        with self._lock:
+            self._sequence += 1
+            stream_event = StreamEvent(f"{self.stream_id}-{self._sequence}", self._sequence, event, data)
+            self._history.append(stream_event)
+        for client in list(self._clients):
+            self._offer(client, stream_event)
+
+    def _offer(self, client: asyncio.Queue, event: StreamEvent) -> None:
+        try:
+            client.put_nowait(event)
+        except asyncio.QueueFull:
+            # The client is too far behind to catch up event by event
+            while not client.empty():
+                client.get_nowait()
+            client.put_nowait(self._reset_event(event.sequence, "lagging"))
+
+    def _reset_event(self, sequence: int, reason: str) -> StreamEvent:
+        return StreamEvent(f"{self.stream_id}-{sequence}", sequence, "reset", {"reason": reason})
+
+    def _replay(self, last_event_id: str) -> List[StreamEvent]:
+        stream_id, _, sequence = last_event_id.rpartition("-")
+        with self._lock:
+            current = self._sequence
+            history = list(self._history)
+        try:
+            sequence = int(sequence)
+        except ValueError:
+            return [self._reset_event(current, "unknown_event_id")]
+        if stream_id != self.stream_id or sequence > current:
+            return [self._reset_event(current, "unknown_event_id")]
+        if sequence < current and (not history or history[0].sequence > sequence + 1):
+            return [self._reset_event(current, "history_expired")]
+        return [event for event in history if event.sequence > sequence]
+
+    async def _watch(self) -> None:
+        while True:
+            try:
+                for event, data in await run_blocking(self._check):
+                    self._dispatch(event, data)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Checking dashboard changes failed: {str(e)}")
+            await asyncio.sleep(self.poll_interval)
+
+    def _on_bus_event(self, event: Event) -> None:
+        if event.type == "activity.created":
+            self.publish(event.type, event.payload)
+        elif event.type in ("monitor.created", "monitor.updated"):
+            monitor = {column: event.payload.get(column) for column in MONITOR_COLUMNS}
+            with self._lock:
+                old = self._monitors.get(monitor['id'])
+                self._monitors[monitor['id']] = monitor
+            before = {monitor['id']: old} if old else {}
+            for name, data in self._monitor_changes(before, {monitor['id']: monitor}):
+                self.publish(name, data)
+        elif event.type == "monitor.deleted":
+            with self._lock:
+                old = self._monitors.pop(event.payload.get('id'), None)
+            if old:
+                for name, data in self._monitor_changes({old['id']: old}, {}):
+                    self.publish(name, data)
+
+    def _check(self) -> List[Tuple[str, Dict[str, Any]]]:
+        """Compare the monitors and activities with the last check; runs on the database executor."""
+        conn = db_utils_sqlite.get_db_connection()
+        try:
+            versions = {row['table_name']: row['version'] for row in conn.execute(
+                "SELECT table_name, version FROM data_versions WHERE table_name IN ('compliance_monitors', 'activities')"
+            )}
+            events: List[Tuple[str, Dict[str, Any]]] = []
+            previous, self._versions = self._versions, versions
+            if previous is None or previous.get('compliance_monitors') != versions.get('compliance_monitors'):
+                monitors = {row['id']: row for row in conn.execute(
+                    f"SELECT {', '.join(MONITOR_COLUMNS)} FROM compliance_monitors"
+                )}
+                if previous is not None:
+                    events.extend(self._monitor_changes(self._monitors, monitors))
+                self._monitors = monitors
+            if previous is None:
+                row = conn.execute('SELECT MAX(id) AS id FROM activities').fetchone()
+                self._last_activity_id = row['id'] or 0
+            elif previous.get('activities') != versions.get('activities'):
+                for row in conn.execute('SELECT * FROM activities WHERE id > ? ORDER BY id', (self._last_activity_id,)):
+                    events.append(("activity.created", row))
+                    self._last_activity_id = row['id']
+            return events
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _monitor_changes(before: Dict[int, Dict[str, Any]],
+                         after: Dict[int, Dict[str, Any]]) -> List[Tuple[str, Dict[str, Any]]]:
+        events = []
+        for monitor_id, monitor in after.items():
+            old = before.get(monitor_id)
+            if old is None:
+                events.append(("monitor.created", monitor))
+                continue
+            if old != monitor:
+                events.append(("monitor.updated", {**monitor, "previous_value": old['current_value']}))
+            if old['alert_level'] != monitor['alert_level']:
+                events.append(("alert.transition", {
+                    "monitor_id": monitor_id,
+                    "name": monitor['name'],
+                    "model_or_system": monitor['model_or_system'],
+                    "from_level": old['alert_level'],
+                    "to_level": monitor['alert_level'],
+                    "current_value": monitor['current_value'],
+                    "threshold_value": monitor['threshold_value']
+                }))
+        for monitor_id in before.keys() - after.keys():
+            events.append(("monitor.deleted", {"id": monitor_id}))
+        return events
@@ -0,0 +1,238 @@
+"""
+In-process publish/subscribe bus for write notifications.
+
+Database writes publish typed events (see EVENT_TYPES) once committed, and
+caches, live streams and alerting subscribe to them instead of polling. A
+subscriber is a callable for an event type or a pattern such as "monitor.*".
+Plain functions run on a worker thread of their own, coroutine functions as a
+task on the event loop they subscribed from. Each subscriber has a bounded queue
+so a slow subscriber never blocks the writer: when the queue is full the oldest
+waiting event is dropped and counted.
+
+Events carry the origin of the process that published them; SQLiteEventBridge
+(sqlite_bridge.py) relays them between processes sharing the database.
+"""
+import asyncio
+import fnmatch
+import inspect
+import logging
+import os
+import queue
+import socket
+import threading
+import uuid
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
+
+logger = logging.getLogger('aigovernance.messaging')
+
+EVENT_TYPES = (
+    "policy.created", "policy.updated",
+    "risk_assessment.created",
+    "monitor.created", "monitor.updated", "monitor.deleted",
+    "report.created",
+    "activity.created"
+)
+
+# Events a subscriber may have waiting before the oldest are dropped
+DEFAULT_QUEUE_SIZE = int(os.environ.get('EVENT_BUS_QUEUE_SIZE', 1000))
+
+@dataclass(frozen=True)
+class Event:
+    """A published event."""
+    type: str
+    payload: Dict[str, Any]
+    origin: str
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    occurred_at: str = field(default_factory=lambda: datetime.now().isoformat())
+
+Handler = Union[Callable[[Event], None], Callable[[Event], Awaitable[None]]]
+
+class Subscription(ABC):
+    """A subscriber's pattern, handler and bounded queue."""
+
+    def __init__(self, pattern: str, handler: Handler, queue_size: int):
+        self.pattern = pattern
+        self.handler = handler
+        self.queue_size = queue_size
+        self.dropped = 0
+        self.active = True
+
+    def matches(self, event_type: str) -> bool:
+        return fnmatch.fnmatchcase(event_type, self.pattern)
+
+    @abstractmethod
+    def offer(self, event: Event) -> None:
+        """Queue an event for the handler without blocking, dropping the oldest waiting event if full."""
+        pass
+
+    def close(self) -> None:
+        self.active = False
+
+    def _log_drop(self) -> None:
+        self.dropped += 1
+        if self.dropped == 1 or self.dropped % 1000 == 0:
+            logger.warning(f"Event subscriber {getattr(self.handler, '__qualname__', self.handler)} on "
+                           f"'{self.pattern}' is falling behind; {self.dropped} events dropped")
+
+class ThreadSubscription(Subscription):
+    """Runs a plain function on a dedicated worker thread."""
+
+    def __init__(self, pattern: str, handler: Callable[[Event], None], queue_size: int):
+        super().__init__(pattern, handler, queue_size)
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._run, name=f"event-subscriber-{pattern}", daemon=True)
+        self._thread.start()
+
+    def offer(self, event: Event) -> None:
+        while True:
+            try:
+                self._queue.put_nowait(event)
+                return
+            except queue.Full:
+                try:
+                    self._queue.get_nowait()
+                    self._log_drop()
+                except queue.Empty:
+                    pass
+
+    def close(self) -> None:
+        super().close()
+        self.offer(None)
+
+    def _run(self) -> None:
+        while True:
+            event = self._queue.get()
+            if event is None and not self.active:
+                return
+            try:
+                self.handler(event)
+            except Exception as e:
+                logger.error(f"Event subscriber for {event.type} failed: {str(e)}")
+
+class AsyncSubscription(Subscription):
+    """Runs a coroutine function as a task on an event loop."""
+
+    def __init__(self, pattern: str, handler: Callable[[Event], Awaitable[None]], queue_size: int,
+                 loop: asyncio.AbstractEventLoop):
+        super().__init__(pattern, handler, queue_size)
+        self.loop = loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        loop.call_soon_threadsafe(self._start)
+
+    def _start(self) -> None:
+        # Closed before the loop got to start it
+        if not self.active:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._task = self.loop.create_task(self._run())
+
+    def offer(self, event: Event) -> None:
+        if not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._enqueue, event)
+
+    def close(self) -> None:
+        super().close()
+        # Scheduled after _start, so a task started in the meantime is cancelled too
+        if not self.loop.is_closed():
+            self.loop.call_soon_threadsafe(self._stop)
+
+    def _stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            self._task = None
+
+    def _enqueue(self, event: Event) -> None:
+        if not self.active or self._queue is None:
+            return
+        if self._queue.full():
+            self._queue.get_nowait()
+            self._log_drop()
+        self._queue.put_nowait(event)
+
+    async def _run(self) -> None:
+        while True:
+            event = await self._queue.get()
+            try:
+                await self.handler(event)
+            except Exception as e:
+                logger.error(f"Event subscriber for {event.type} failed: {str(e)}")
+
+class EventBus:
+    """Delivers published events to the subscribers whose pattern matches."""
+
+    def __init__(self, queue_size: int = DEFAULT_QUEUE_SIZE):
+        """
+        Initialize the bus.
+
+        Args:
+            queue_size: Default number of events a subscriber may have waiting
+        """
+        self.queue_size = queue_size
+        self.origin = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+        self._subscriptions: List[Subscription] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self, pattern: str, handler: Handler, queue_size: Optional[int] = None,
+                  loop: Optional[asyncio.AbstractEventLoop] = None) -> Subscription:
+        """
+        Subscribe a handler to the event types matching pattern ("*" for all).
+
+        Args:
+            pattern: An event type or fnmatch pattern, e.g. "monitor.*"
+            handler: Function or coroutine function taking the Event
+            queue_size: Events the subscriber may have waiting (defaults to the bus's)
+            loop: Event loop to run a coroutine handler on (defaults to the running loop)
+
+        Raises:
+            ValueError: If a coroutine handler is subscribed outside a running loop without one
+        """
+        queue_size = queue_size or self.queue_size
+        if inspect.iscoroutinefunction(handler):
+            if loop is None:
+                try:
+                    loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    raise ValueError("Coroutine subscribers need an event loop")
+            subscription = AsyncSubscription(pattern, handler, queue_size, loop)
+        else:
+            subscription = ThreadSubscription(pattern, handler, queue_size)
+        with self._lock:
+            self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            if subscription in self._subscriptions:
+                self._subscriptions.remove(subscription)
+        subscription.close()
+
+    def publish(self, event_type: str, payload: Dict[str, Any]) -> Event:
+        """
+        Publish an event from this process; never blocks on subscribers.
+
+        Raises:
+            ValueError: If the event type is not one of EVENT_TYPES
+        """
+        if event_type not in EVENT_TYPES:
+            raise ValueError(f"Unknown event type: {event_type}")
+        event = Event(event_type, payload, self.origin)
+        self.deliver(event)
+        return event
+
+    def deliver(self, event: Event) -> None:
+        """Hand an event, local or relayed from another process, to the matching subscribers."""
+        with self._lock:
+            subscriptions = [subscription for subscription in self._subscriptions if subscription.matches(event.type)]
+        for subscription in subscriptions:
+            subscription.offer(event)
+
+    def close(self) -> None:
+        """Unsubscribe every subscriber."""
+        with self._lock:
+            subscriptions, self._subscriptions = self._subscriptions, []
+        for subscription in subscriptions:
+            subscription.close()
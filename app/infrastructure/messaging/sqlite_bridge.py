@@ -0,0 +1,150 @@
+"""
+Cross-process relay of event bus events through the SQLite database.
+
+With several API workers each process has its own EventBus. The bridge appends
+the events published in its process to the event_log table and tails the table
+for events other processes appended, delivering those to the local bus, so a
+write handled by one worker reaches the live streams and subscribers of all of
+them. Relayed events arrive within about one poll interval. The log is pruned
+to the events of the last retention period.
+"""
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Optional
+
+from app.infrastructure.messaging.event_bus import Event, EventBus, Subscription
+from database import db_utils_sqlite
+
+logger = logging.getLogger('aigovernance.messaging')
+
+# Seconds between checks for events from other processes
+DEFAULT_POLL_INTERVAL = 0.5
+
+# Events are kept in the log this long
+DEFAULT_RETENTION_SECONDS = 3600
+
+# Seconds between prunes of the log
+PRUNE_INTERVAL = 60.0
+
+# Events read per poll
+READ_BATCH_SIZE = 500
+
+class SQLiteEventBridge:
+    """Relays events between the event buses of processes sharing a SQLite database."""
+
+    def __init__(self, bus: EventBus, db_path: Optional[str] = None,
+                 poll_interval: float = DEFAULT_POLL_INTERVAL, retention_seconds: float = DEFAULT_RETENTION_SECONDS):
+        """
+        Initialize the bridge; relaying starts on start().
+
+        Args:
+            bus: This process's event bus
+            db_path: SQLite database holding the event_log table (defaults to the application database)
+            poll_interval: Seconds between checks for events from other processes
+            retention_seconds: How long events are kept in the log
+        """
+        self.bus = bus
+        self.db_path = db_path or db_utils_sqlite.DB_PATH
+        self.poll_interval = poll_interval
+        self.retention_seconds = retention_seconds
+        self._last_id = 0
+        self._last_prune = 0.0
+        self._subscription: Optional[Subscription] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = lambda cursor, row: {col[0]: row[idx] for idx, col in enumerate(cursor.description)}
+        return conn
+
+    def _ensure_schema(self) -> None:
+        conn = self._connect()
+        conn.executescript('''
+        CREATE TABLE IF NOT EXISTS event_log (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_id TEXT NOT NULL,
+            event_type TEXT NOT NULL,
+            payload TEXT NOT NULL,
+            origin TEXT NOT NULL,
+            occurred_at TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_event_log_occurred_at ON event_log (occurred_at);
+        ''')
+        conn.commit()
+        conn.close()
+
+    def start(self) -> None:
+        """Start relaying; events logged before now are not replayed."""
+        if self._thread and self._thread.is_alive():
+            return
+        conn = self._connect()
+        self._last_id = conn.execute('SELECT COALESCE(MAX(id), 0) AS id FROM event_log').fetchone()['id']
+        conn.close()
+        self._subscription = self.bus.subscribe("*", self._append)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._poll, name="event-bridge", daemon=True)
+        self._thread.start()
+        logger.info(f"Event bridge started for {self.bus.origin}, polling every {self.poll_interval:g}s")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop relaying."""
+        self._stop.set()
+        if self._subscription:
+            self.bus.unsubscribe(self._subscription)
+            self._subscription = None
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _append(self, event: Event) -> None:
+        # Events relayed from other processes are already in the log
+        if event.origin != self.bus.origin:
+            return
+        conn = self._connect()
+        conn.execute(
+            'INSERT INTO event_log (event_id, event_type, payload, origin, occurred_at) VALUES (?, ?, ?, ?, ?)',
+            (event.id, event.type, json.dumps(event.payload, default=str), event.origin, event.occurred_at)
+        )
+        conn.commit()
+        conn.close()
+
+    def _poll(self) -> None:
+        while True:
+            try:
+                self.relay()
+            except Exception as e:
+                logger.error(f"Relaying events failed: {str(e)}")
+            if self._stop.wait(self.poll_interval):
+                return
+
+    def relay(self) -> int:
+        """Deliver the events other processes logged since the last call; returns how many."""
+        conn = self._connect()
+        try:
+            relayed = 0
+            while True:
+                rows = conn.execute(
+                    'SELECT * FROM event_log WHERE id > ? ORDER BY id LIMIT ?', (self._last_id, READ_BATCH_SIZE)
+                ).fetchall()
+                for row in rows:
+                    self._last_id = row['id']
+                    if row['origin'] != self.bus.origin:
+                        self.bus.deliver(Event(row['event_type'], json.loads(row['payload']), row['origin'],
+                                               row['event_id'], row['occurred_at']))
+                        relayed += 1
+                if len(rows) < READ_BATCH_SIZE:
+                    break
+            if time.monotonic() - self._last_prune >= PRUNE_INTERVAL:
+                self._last_prune = time.monotonic()
+                cutoff = (datetime.now() - timedelta(seconds=self.retention_seconds)).isoformat()
+                conn.execute('DELETE FROM event_log WHERE occurred_at < ?', (cutoff,))
+                conn.commit()
+            return relayed
+        finally:
+            conn.close()
@@ -0,0 +1,138 @@
+"""
+Benchmark for async handlers making blocking SQLite calls: inline on the event
+loop versus offloaded with run_blocking to the bounded database executor.
+
+Serves a small FastAPI app over uvicorn on a temporary database and drives it
+with 200 concurrent clients. Most requests are point lookups (get_policy); one
+in ten is an aggregate over the assessment history, like a report query. With
+the calls inline the loop runs one query at a time, so every lookup queues
+behind the aggregates; offloaded, the loop keeps accepting requests while
+SQLite runs queries outside the GIL.
+
+Run from the repository root:
+    python -m benchmarks.bench_api_concurrency
+"""
+import asyncio
+import os
+import random
+import socket
+import statistics
+import tempfile
+import threading
+import time
+
+import httpx
+import uvicorn
+from fastapi import FastAPI
+
+from app.infrastructure.database.executor import run_blocking
+from database import db_utils_sqlite
+
+def aggregate_assessments() -> list:
+    conn = db_utils_sqlite.get_db_connection()
+    rows = conn.execute(
+        """SELECT substr(created_at, 1, 7) AS month, COUNT(*) AS assessments, AVG(risk_score) AS average_risk
+        FROM risk_assessments GROUP BY 1 ORDER BY 1"""
+    ).fetchall()
+    conn.close()
+    return rows
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/inline/policies/{policy_id}")
+    async def inline_policy(policy_id: int):
+        return db_utils_sqlite.get_policy(policy_id)
+
+    @app.get("/inline/aggregate")
+    async def inline_aggregate():
+        return aggregate_assessments()
+
+    @app.get("/offloaded/policies/{policy_id}")
+    async def offloaded_policy(policy_id: int):
+        return await run_blocking(db_utils_sqlite.get_policy, policy_id)
+
+    @app.get("/offloaded/aggregate")
+    async def offloaded_aggregate():
+        return await run_blocking(aggregate_assessments)
+
+    return app
+
+def load_data(num_assessments: int, num_policies: int = 1000, seed: int = 7):
+    rng = random.Random(seed)
+    conn = db_utils_sqlite.get_db_connection()
+    conn.executemany(
+        'INSERT INTO policies (title, description, content, category, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)',
+        [(f"Policy {i}", "Benchmark policy", "Content", "Data Privacy", "Active", "2025-01-01", "2025-01-01")
+         for i in range(num_policies)]
+    )
+    conn.executemany(
+        'INSERT INTO risk_assessments (title, model_name, risk_score, findings, recommendations, created_at, status) '
+        'VALUES (?, ?, ?, ?, ?, ?, ?)',
+        [(f"Assessment {i}", f"model-{i % 200}", round(rng.uniform(5, 95), 1), "", "",
+          f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}", "Medium Risk") for i in range(num_assessments)]
+    )
+    conn.commit()
+    policy_ids = [row['id'] for row in conn.execute('SELECT id FROM policies')]
+    conn.close()
+    return policy_ids
+
+def start_server(app: FastAPI):
+    sock = socket.socket()
+    sock.bind(("127.0.0.1", 0))
+    # Room for every client to connect at once (asyncio's default backlog is 100)
+    sock.listen(2048)
+    # A blocked loop can leave connections idle past uvicorn's 5s keep-alive default
+    server = uvicorn.Server(uvicorn.Config(app, log_level="warning", lifespan="off", timeout_keep_alive=300))
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True)
+    thread.start()
+    while not server.started:
+        time.sleep(0.05)
+    return server, thread, f"http://127.0.0.1:{sock.getsockname()[1]}"
+
+async def drive(base_url: str, mode: str, policy_ids, clients: int, requests_per_client: int, seed: int = 3):
+    rng = random.Random(seed)
+    plans = [[rng.random() < 0.1 for _ in range(requests_per_client)] for _ in range(clients)]
+    latencies = {"lookup": [], "aggregate": []}
+    limits = httpx.Limits(max_connections=clients, max_keepalive_connections=clients)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=300) as client:
+        async def run_client(plan):
+            for heavy in plan:
+                path = f"/{mode}/aggregate" if heavy else f"/{mode}/policies/{rng.choice(policy_ids)}"
+                start = time.perf_counter()
+                response = await client.get(path)
+                response.raise_for_status()
+                latencies["aggregate" if heavy else "lookup"].append(time.perf_counter() - start)
+        start = time.perf_counter()
+        await asyncio.gather(*(run_client(plan) for plan in plans))
+        elapsed = time.perf_counter() - start
+    return latencies, elapsed
+
+def percentile(values, pct: float) -> float:
+    return statistics.quantiles(values, n=100)[int(pct) - 1] if len(values) > 1 else values[0]
+
+def run(num_assessments: int = 100000, clients: int = 200, requests_per_client: int = 10):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_utils_sqlite.DB_PATH = os.path.join(tmp, "bench.db")
+        from database.db_init_sqlite import init_db
+        init_db()
+        policy_ids = load_data(num_assessments)
+        start = time.perf_counter()
+        aggregate_assessments()
+        print(f"{num_assessments} assessments; one aggregate query takes {(time.perf_counter() - start) * 1000:.0f}ms")
+
+        server, thread, base_url = start_server(build_app())
+        try:
+            for mode in ("inline", "offloaded"):
+                latencies, elapsed = asyncio.run(drive(base_url, mode, policy_ids, clients, requests_per_client))
+                total = sum(len(values) for values in latencies.values())
+                print(f"{mode:>9}: {clients} clients, {total} requests in {elapsed:.1f}s ({total / elapsed:.0f} req/s)")
+                for kind, values in latencies.items():
+                    print(f"           {kind:<9} n={len(values):<5} p50 {percentile(values, 50) * 1000:7.0f}ms  "
+                          f"p99 {percentile(values, 99) * 1000:7.0f}ms")
+        finally:
+            server.should_exit = True
+            thread.join()
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,103 @@
+"""
+Benchmark for list endpoint responses: response-model validation with FastAPI's
+default serialization (as main.py runs), validation rendered by FastJSONResponse
+as the app's default response class, and trusted rows rendered with
+FastJSONResponse, plus the bytes saved by gzip compression.
+
+Builds a temporary database with init_db, loads synthetic reports and policies
+and times GET /reports and /policies through a TestClient, with the same
+response models and middleware as main.py.
+
+Run from the repository root:
+    python -m benchmarks.bench_api_responses
+"""
+import os
+import random
+import statistics
+import tempfile
+import time
+from typing import List, Optional, Type
+
+from fastapi import FastAPI, Response
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.testclient import TestClient
+
+from app.api import responses
+from app.api.models import PolicyResponse, ReportResponse
+from app.api.responses import DEFAULT_COMPRESSION_MIN_SIZE, DEFAULT_GZIP_LEVEL, FastJSONResponse, trusted_response
+from database import db_utils_sqlite
+
+WORDS = ("model governance risk compliance policy data privacy fairness audit monitor threshold alert "
+         "review control owner evidence training deployment bias security incident report").split()
+
+def synthetic_text(rng: random.Random, words: int) -> str:
+    lines = []
+    for _ in range(words // 12):
+        lines.append(" ".join(rng.choice(WORDS) for _ in range(12)).capitalize() + ".")
+    return "\n".join(lines)
+
+def load_data(num_reports: int, num_policies: int, seed: int = 5):
+    rng = random.Random(seed)
+    conn = db_utils_sqlite.get_db_connection()
+    conn.executemany(
+        'INSERT INTO reports (title, description, report_type, content, insights, created_at, status) VALUES (?, ?, ?, ?, ?, ?, ?)',
+        [(f"Report {i}", "Benchmark report", "Compliance Summary", "# Report\n\n" + synthetic_text(rng, 400),
+          synthetic_text(rng, 60), f"2025-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d} 10:00:00", "Published")
+         for i in range(num_reports)]
+    )
+    conn.executemany(
+        'INSERT INTO policies (title, description, content, category, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)',
+        [(f"Policy {i}", "Benchmark policy", synthetic_text(rng, 150), "Data Privacy", "Active",
+          "2025-01-01 09:00:00", "2025-02-01 09:00:00") for i in range(num_policies)]
+    )
+    conn.commit()
+    conn.close()
+
+def build_app(default_response_class: Optional[Type[Response]] = None) -> FastAPI:
+    app = FastAPI(**({"default_response_class": default_response_class} if default_response_class else {}))
+    app.add_middleware(GZipMiddleware, minimum_size=DEFAULT_COMPRESSION_MIN_SIZE, compresslevel=DEFAULT_GZIP_LEVEL)
+
+    @app.get("/reports", response_model=List[ReportResponse])
+    async def list_reports():
+        return trusted_response(db_utils_sqlite.get_all_reports(), ReportResponse)
+
+    @app.get("/policies", response_model=List[PolicyResponse])
+    async def list_policies():
+        return trusted_response(db_utils_sqlite.get_all_policies(), PolicyResponse)
+
+    return app
+
+def measure(client: TestClient, path: str, encoding: str, repeat: int):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = client.get(path, headers={"Accept-Encoding": encoding})
+        timings.append(time.perf_counter() - start)
+        response.raise_for_status()
+    # httpx decodes the body; the compressed size is what went over the wire
+    size = response.num_bytes_downloaded
+    return statistics.median(timings), size
+
+def run(num_reports: int = 2000, num_policies: int = 5000, repeat: int = 15):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_utils_sqlite.DB_PATH = os.path.join(tmp, "bench.db")
+        from database.db_init_sqlite import init_db
+        init_db()
+        load_data(num_reports, num_policies)
+        default_client = TestClient(build_app())
+        variants = (
+            ("validated", default_client, True),
+            ("validated+orjson", TestClient(build_app(FastJSONResponse)), True),
+            ("trusted", default_client, False)
+        )
+        print(f"orjson {'available' if responses.ORJSON_AVAILABLE else 'not installed'}")
+        for path in ("/reports", "/policies"):
+            for label, client, validate in variants:
+                responses.VALIDATE_RESPONSES = validate
+                for encoding in ("identity", "gzip"):
+                    elapsed, size = measure(client, path, encoding, repeat)
+                    print(f"{path:<10} {label:<16} {encoding:<8} {elapsed * 1000:7.1f}ms  {size / 1024:8.1f} KiB")
+        responses.VALIDATE_RESPONSES = True
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,37 @@
+"""
+Benchmark for AiUtils batch classification across worker counts.
+
+Run from the repository root:
+    python -m benchmarks.bench_batch_classification
+"""
+import os
+import time
+
+from utils.ai_utils import AiUtils
+
+RISK_LABELS = ["Privacy Risk", "Security Risk", "Bias Risk", "Transparency Risk", "Compliance Risk"]
+
+SAMPLE_DOCUMENT = (
+    "This model processes personal data without explicit consent and shows different accuracy "
+    "across demographic groups. Encryption is applied at rest, but the API has a known vulnerability. "
+    "Decisions are opaque to operators and no explainability tooling is in place. "
+) * 20
+
+def run(num_documents: int = 20000):
+    documents = [f"{SAMPLE_DOCUMENT} Document {i}." for i in range(num_documents)]
+    cpu_count = os.cpu_count() or 1
+    worker_counts = sorted({1, 2, 4, cpu_count})
+    
+    print(f"Classifying {num_documents} documents ({len(SAMPLE_DOCUMENT)} chars each), {cpu_count} CPUs")
+    baseline = None
+    for workers in worker_counts:
+        if workers > cpu_count:
+            continue
+        start = time.perf_counter()
+        AiUtils.classify_batch(documents, RISK_LABELS, max_workers=workers, chunk_size=256)
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(f"workers={workers:>2}  {elapsed:7.2f}s  {num_documents / elapsed:9.0f} docs/s  speedup x{baseline / elapsed:.2f}")
+
+if __name__ == "__main__":
+    run()
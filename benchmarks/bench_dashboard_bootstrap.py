@@ -0,0 +1,190 @@
+"""
+Benchmark for a dashboard page load: the four panel endpoints (metrics,
+compliance status chart, risk distribution chart, recent activities) versus the
+single /api/dashboard/bootstrap endpoint reading one snapshot.
+
+Builds a temporary database with init_db, loads synthetic policies, assessments,
+monitors and activities, and serves both variants with the same handlers as
+main.py through a TestClient. SQL statements are counted with a trace callback
+on every connection db_utils_sqlite opens.
+
+Run from the repository root:
+    python -m benchmarks.bench_dashboard_bootstrap
+"""
+import os
+import random
+import statistics
+import tempfile
+import time
+from typing import List
+
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from app.api.caching import DASHBOARD_TABLES, conditional_response
+from app.api.dashboard import build_metrics, build_compliance_status_chart, build_risk_distribution_chart
+from app.api.models import ActivityResponse, ChartDataResponse, DashboardBootstrapResponse, DashboardMetricsResponse
+from app.infrastructure.database.executor import run_blocking
+from database import db_utils_sqlite
+from utils.constants import RISK_ASSESSMENT_AGENT_CONFIG
+
+PANEL_PATHS = (
+    "/api/dashboard/metrics",
+    "/api/dashboard/compliance-status-chart",
+    "/api/dashboard/risk-distribution-chart",
+    "/api/dashboard/activities"
+)
+
+class StatementCounter:
+    """Counts the connections opened and SQL statements run through db_utils_sqlite."""
+
+    def __init__(self):
+        self.connections = 0
+        self.statements = 0
+        self._connect = db_utils_sqlite.get_db_connection
+
+    def __enter__(self):
+        def get_db_connection():
+            conn = self._connect()
+            self.connections += 1
+            conn.set_trace_callback(self._trace)
+            return conn
+        db_utils_sqlite.get_db_connection = get_db_connection
+        return self
+
+    def __exit__(self, *exc):
+        db_utils_sqlite.get_db_connection = self._connect
+
+    def _trace(self, statement: str) -> None:
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            self.statements += 1
+
+def load_data(num_policies: int, num_models: int, assessments_per_model: int, num_monitors: int,
+              num_activities: int, seed: int = 7):
+    rng = random.Random(seed)
+    conn = db_utils_sqlite.get_db_connection()
+    conn.executemany(
+        'INSERT INTO policies (title, description, content, category, status, created_at, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?)',
+        [(f"Policy {i}", "Benchmark policy", "Policy text. " * 200, "Data Privacy", "Active",
+          "2025-01-01 09:00:00", "2025-02-01 09:00:00") for i in range(num_policies)]
+    )
+    categories = RISK_ASSESSMENT_AGENT_CONFIG["risk_categories"]
+    for round_number in range(assessments_per_model):
+        for model in range(num_models):
+            cursor = conn.execute(
+                'INSERT INTO risk_assessments (title, model_name, risk_score, findings, recommendations, created_at, status) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (f"Assessment {model}-{round_number}", f"model-{model}", rng.uniform(10, 95), "Findings", "Recommendations",
+                 f"2025-{round_number + 1:02d}-15 10:00:00", "Completed")
+            )
+            conn.executemany(
+                'INSERT INTO risk_category_scores (assessment_id, model_name, category, score) VALUES (?, ?, ?, ?)',
+                [(cursor.lastrowid, f"model-{model}", category, rng.uniform(0, 100)) for category in categories]
+            )
+    conn.executemany(
+        'INSERT INTO compliance_monitors (name, description, model_or_system, threshold_value, current_value, status, last_checked, alert_level) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+        [(f"Monitor {i}", "Benchmark monitor", f"model-{i % num_models}", 0.8, rng.random(),
+          rng.choice(["Active", "Active", "Inactive"]), f"2025-03-{rng.randint(1, 28):02d} 08:00:00",
+          rng.choice(["Normal", "Normal", "Warning", "Critical"])) for i in range(num_monitors)]
+    )
+    conn.executemany(
+        'INSERT INTO activities (activity_type, description, created_at, actor, related_entity_id, related_entity_type) VALUES (?, ?, ?, ?, ?, ?)',
+        [("update_compliance_monitor", f"Updated compliance monitor: Monitor {i % num_monitors}",
+          f"2025-03-01 08:{i // 3600 % 60:02d}:{i % 60:02d}.{i:06d}", "Monitoring Agent", i % num_monitors, "compliance_monitor")
+         for i in range(num_activities)]
+    )
+    conn.commit()
+    conn.close()
+
+def build_app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/api/dashboard/metrics", response_model=DashboardMetricsResponse)
+    async def metrics(request: Request, response: Response):
+        not_modified = await conditional_response(request, response, DASHBOARD_TABLES["metrics"])
+        if not_modified:
+            return not_modified
+        policy_count = await run_blocking(db_utils_sqlite.get_policy_count)
+        risk_summary = await run_blocking(db_utils_sqlite.get_model_risk_summary)
+        monitors = await run_blocking(db_utils_sqlite.get_all_compliance_monitors)
+        return build_metrics(policy_count, risk_summary, monitors)
+
+    @app.get("/api/dashboard/compliance-status-chart", response_model=ChartDataResponse)
+    async def compliance_status(request: Request, response: Response):
+        not_modified = await conditional_response(request, response, DASHBOARD_TABLES["compliance_status"])
+        if not_modified:
+            return not_modified
+        return build_compliance_status_chart(await run_blocking(db_utils_sqlite.get_all_compliance_monitors))
+
+    @app.get("/api/dashboard/risk-distribution-chart", response_model=ChartDataResponse)
+    async def risk_distribution(request: Request, response: Response):
+        not_modified = await conditional_response(request, response, DASHBOARD_TABLES["risk_distribution"])
+        if not_modified:
+            return not_modified
+        return build_risk_distribution_chart(await run_blocking(db_utils_sqlite.get_risk_category_distribution, None, 5))
+
+    @app.get("/api/dashboard/activities", response_model=List[ActivityResponse])
+    async def activities(request: Request, response: Response):
+        not_modified = await conditional_response(request, response, DASHBOARD_TABLES["activities"])
+        if not_modified:
+            return not_modified
+        return await run_blocking(db_utils_sqlite.get_recent_activities, limit=10)
+
+    @app.get("/api/dashboard/bootstrap", response_model=DashboardBootstrapResponse)
+    async def bootstrap(request: Request, response: Response):
+        not_modified = await conditional_response(request, response, DASHBOARD_TABLES["bootstrap"])
+        if not_modified:
+            return not_modified
+        snapshot = await run_blocking(db_utils_sqlite.get_dashboard_snapshot, None, 5)
+        return {
+            "metrics": build_metrics(snapshot['policy_count'], snapshot['risk_summary'], snapshot['monitors']),
+            "compliance_status": build_compliance_status_chart(snapshot['monitors']),
+            "risk_distribution": build_risk_distribution_chart(snapshot['risk_distribution']),
+            "activities": snapshot['activities']
+        }
+
+    return app
+
+def page_load(client: TestClient, paths) -> dict:
+    bodies = {}
+    for path in paths:
+        response = client.get(path)
+        response.raise_for_status()
+        bodies[path] = response.json()
+    return bodies
+
+def measure(client: TestClient, paths, repeat: int):
+    with StatementCounter() as counter:
+        page_load(client, paths)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        page_load(client, paths)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings), counter
+
+def run(num_policies: int = 5000, num_models: int = 300, assessments_per_model: int = 10,
+        num_monitors: int = 2000, num_activities: int = 50000, repeat: int = 20):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_utils_sqlite.DB_PATH = os.path.join(tmp, "bench.db")
+        from database.db_init_sqlite import init_db
+        init_db()
+        load_data(num_policies, num_models, assessments_per_model, num_monitors, num_activities)
+        client = TestClient(build_app())
+
+        # The combined response must hold exactly what the panels return
+        panels = page_load(client, PANEL_PATHS)
+        combined = page_load(client, ["/api/dashboard/bootstrap"])["/api/dashboard/bootstrap"]
+        assert combined["metrics"] == panels["/api/dashboard/metrics"]
+        assert combined["compliance_status"] == panels["/api/dashboard/compliance-status-chart"]
+        assert combined["risk_distribution"] == panels["/api/dashboard/risk-distribution-chart"]
+        assert combined["activities"] == panels["/api/dashboard/activities"]
+
+        print(f"{num_policies} policies, {num_models * assessments_per_model} assessments, "
+              f"{num_monitors} monitors, {num_activities} activities")
+        for label, paths in (("4 panel requests", PANEL_PATHS), ("bootstrap", ["/api/dashboard/bootstrap"])):
+            elapsed, counter = measure(client, paths, repeat)
+            print(f"{label:<17} {len(paths)} request(s)  {counter.connections:2d} connections  "
+                  f"{counter.statements:2d} queries  {elapsed * 1000:7.1f}ms per page load")
+
+if __name__ == "__main__":
+    run()
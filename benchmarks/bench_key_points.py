@@ -0,0 +1,30 @@
+"""
+Benchmark for TextRank key point extraction on large documents.
+
+Run from the repository root:
+    python -m benchmarks.bench_key_points
+"""
+import random
+import time
+
+from utils.summarizer import rank_sentences, np
+
+def make_sentences(num_sentences: int, vocabulary_size: int = 8000, seed: int = 0):
+    """Synthetic sentences with a Zipfian word distribution, like natural text."""
+    rng = random.Random(seed)
+    words = [f"term{i}" for i in range(vocabulary_size)]
+    weights = [1 / (rank + 1) for rank in range(vocabulary_size)]
+    return [" ".join(rng.choices(words, weights, k=rng.randint(8, 25))) for _ in range(num_sentences)]
+
+def run():
+    paths = [True, False] if np is not None else [False]
+    for num_sentences in (1000, 10000):
+        sentences = make_sentences(num_sentences)
+        for use_numpy in paths:
+            start = time.perf_counter()
+            rank_sentences(sentences, use_numpy=use_numpy)
+            elapsed = time.perf_counter() - start
+            print(f"{num_sentences:>6} sentences  {'numpy' if use_numpy else 'python':>6}  {elapsed:6.3f}s")
+
+if __name__ == "__main__":
+    run()
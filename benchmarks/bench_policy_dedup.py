@@ -0,0 +1,116 @@
+"""
+Benchmark for near-duplicate policy lookup: LSH bucket index versus a full scan.
+
+Builds an in-memory SQLite library of synthetic policies (families of lightly
+edited copies of the same text), indexes it, and compares the latency of the
+LSH lookup against comparing the query signature with every stored signature
+and against exact Jaccard similarity over every policy's shingles.
+
+Run from the repository root:
+    python -m benchmarks.bench_policy_dedup
+"""
+import random
+import sqlite3
+import time
+
+import numpy as np
+
+from database.db_utils_sqlite import dict_factory
+from utils.policy_index import (
+    DEFAULT_SIMILARITY_THRESHOLD, MinHasher, find_near_duplicates, rebuild_policy_index, shingles
+)
+
+VOCABULARY = (
+    "model data access review audit privacy security risk control policy system training "
+    "deployment monitoring incident response owner approval retention consent bias fairness "
+    "transparency documentation evaluation vendor third party logging encryption user impact"
+).split()
+
+def synthetic_policies(num_policies: int, family_size: int = 5, words: int = 120, seed: int = 7):
+    """Families of policies: one base text plus copies with a few words changed."""
+    rng = random.Random(seed)
+    policies = []
+    while len(policies) < num_policies:
+        base = [rng.choice(VOCABULARY) for _ in range(words)]
+        policies.append(" ".join(base))
+        for _ in range(family_size - 1):
+            copy = list(base)
+            for position in rng.sample(range(words), 3):
+                copy[position] = rng.choice(VOCABULARY)
+            policies.append(" ".join(copy))
+    return policies[:num_policies]
+
+def build_library(policies):
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = dict_factory
+    conn.executescript('''
+    CREATE TABLE policies (id INTEGER PRIMARY KEY, content TEXT);
+    CREATE TABLE policy_minhash (policy_id INTEGER PRIMARY KEY, signature BLOB NOT NULL);
+    CREATE TABLE policy_lsh_buckets (
+        band INTEGER NOT NULL, bucket INTEGER NOT NULL, policy_id INTEGER NOT NULL,
+        PRIMARY KEY (band, bucket, policy_id)
+    ) WITHOUT ROWID;
+    CREATE INDEX idx_policy_lsh_buckets_policy_id ON policy_lsh_buckets (policy_id);
+    ''')
+    conn.executemany('INSERT INTO policies (id, content) VALUES (?, ?)', enumerate(policies, 1))
+    conn.commit()
+    return conn
+
+def scan_signatures(conn, policy_id, threshold):
+    cursor = conn.cursor()
+    cursor.execute('SELECT signature FROM policy_minhash WHERE policy_id = ?', (policy_id,))
+    signature = np.frombuffer(cursor.fetchone()['signature'], dtype=np.uint32)
+    cursor.execute('SELECT policy_id, signature FROM policy_minhash WHERE policy_id != ?', (policy_id,))
+    rows = cursor.fetchall()
+    matrix = np.frombuffer(b''.join(row['signature'] for row in rows), dtype=np.uint32).reshape(len(rows), -1)
+    similarities = MinHasher.similarity(signature, matrix)
+    return {rows[i]['policy_id'] for i in np.nonzero(similarities >= threshold)[0]}
+
+def scan_exact(shingle_sets, index, threshold):
+    own = shingle_sets[index]
+    return {
+        i + 1 for i, other in enumerate(shingle_sets)
+        if i != index and len(own & other) / len(own | other) >= threshold
+    }
+
+def run(num_policies: int = 100000, queries: int = 20):
+    policies = synthetic_policies(num_policies)
+    conn = build_library(policies)
+
+    start = time.perf_counter()
+    rebuild_policy_index(conn)
+    print(f"Indexed {num_policies} policies in {time.perf_counter() - start:.1f}s")
+
+    rng = random.Random(11)
+    query_ids = rng.sample(range(1, num_policies + 1), queries)
+    threshold = DEFAULT_SIMILARITY_THRESHOLD
+    cursor = conn.cursor()
+
+    start = time.perf_counter()
+    lsh_results = {policy_id: {m['policy_id'] for m in find_near_duplicates(cursor, policy_id, threshold, limit=1000)}
+                   for policy_id in query_ids}
+    lsh_elapsed = (time.perf_counter() - start) / queries
+    print(f"LSH lookup           {lsh_elapsed * 1000:9.2f}ms per query")
+
+    start = time.perf_counter()
+    scan_results = {policy_id: scan_signatures(conn, policy_id, threshold) for policy_id in query_ids}
+    scan_elapsed = (time.perf_counter() - start) / queries
+    print(f"signature scan       {scan_elapsed * 1000:9.2f}ms per query  (x{scan_elapsed / lsh_elapsed:.0f})")
+
+    shingle_sets = [set(shingles(text)) for text in policies]
+    exact_queries = query_ids[:5]
+    start = time.perf_counter()
+    exact_results = {policy_id: scan_exact(shingle_sets, policy_id - 1, threshold) for policy_id in exact_queries}
+    exact_elapsed = (time.perf_counter() - start) / len(exact_queries)
+    print(f"exact Jaccard scan   {exact_elapsed * 1000:9.2f}ms per query  (x{exact_elapsed / lsh_elapsed:.0f})")
+
+    # LSH can only miss pairs the scan finds, never add any
+    found = sum(len(lsh_results[q]) for q in query_ids)
+    expected = sum(len(scan_results[q]) for q in query_ids)
+    assert all(lsh_results[q] <= scan_results[q] for q in query_ids)
+    exact_found = sum(len(lsh_results[q] & exact_results[q]) for q in exact_queries)
+    exact_expected = sum(len(exact_results[q]) for q in exact_queries)
+    print(f"recall vs signature scan {found}/{expected}, vs exact Jaccard {exact_found}/{exact_expected}")
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,110 @@
+"""
+Benchmark for policy text rendering: compiled templates and trie prompt lookup
+versus per-call f-strings and a linear scan over a rebuilt template dict.
+
+Run from the repository root:
+    python -m benchmarks.bench_policy_templates
+"""
+import random
+import time
+
+from app.core.governance.governance_agent import DEFAULT_POLICY_SCOPE, POLICY_TEMPLATES, render_policy_text
+from app.infrastructure.ai.analysis_engine import GOVERNANCE_TEMPLATES
+from app.infrastructure.ai.templates import TemplateRegistry
+from utils.constants import GOVERNANCE_AGENT_CONFIG
+
+def generate_text_linear(prompt: str, fallback: str = "") -> str:
+    # The original lookup: the template dict is rebuilt and scanned on every call
+    governance_templates = dict(GOVERNANCE_TEMPLATES)
+    for template_key, template_text in governance_templates.items():
+        if template_key in prompt or prompt in template_key:
+            return template_text
+    return fallback
+
+def render_policy_fstring(category: str):
+    title = f"{category} Policy for AI Systems"
+    scope = DEFAULT_POLICY_SCOPE
+    prompt = f"Policy for {category} in AI systems:"
+    fallback_content = f"""
+        # {title}
+        
+        ## Purpose
+        This policy establishes guidelines for {category.lower()} in AI systems.
+        
+        ## Scope
+        This policy applies to {scope}.
+        
+        ## Requirements
+        1. All AI systems must be reviewed for {category.lower()} concerns.
+        2. Documentation must include {category.lower()} considerations.
+        3. Regular audits will be conducted to ensure compliance.
+        
+        ## Responsibilities
+        - Data Scientists: Implement technical controls
+        - AI Ethics Board: Review and approve AI systems
+        - Management: Ensure resources for compliance
+        
+        ## Compliance Measurement
+        Compliance will be measured through regular audits and assessments.
+        """
+    return title, generate_text_linear(prompt, fallback_content)
+
+def render_policy_compiled(registry: TemplateRegistry, category: str):
+    title = POLICY_TEMPLATES.render("title", category=category)
+    prompt = POLICY_TEMPLATES.render("prompt", category=category)
+    content = registry.match_prompt(prompt) or POLICY_TEMPLATES.render(
+        "document", title=title, category_lower=category.lower(), scope=DEFAULT_POLICY_SCOPE
+    )
+    return title, content
+
+def render_policy_cached(registry: TemplateRegistry, category: str):
+    title, prompt, document = render_policy_text(category)
+    return title, registry.match_prompt(prompt) or document
+
+def time_per_call(fn, args_list):
+    start = time.perf_counter()
+    for args in args_list:
+        fn(*args)
+    return (time.perf_counter() - start) / len(args_list)
+
+def run(num_policies: int = 200000):
+    categories = GOVERNANCE_AGENT_CONFIG["policy_categories"]
+    registry = TemplateRegistry(GOVERNANCE_TEMPLATES)
+
+    # Same output as the f-string path, and the same prompt matches as the linear scan
+    for category in categories:
+        assert render_policy_fstring(category) == render_policy_compiled(registry, category) == render_policy_cached(registry, category)
+    rng = random.Random(3)
+    keys = list(GOVERNANCE_TEMPLATES)
+    prompts = [rng.choice(keys)[rng.randint(0, 10):rng.randint(11, 40)] + rng.choice(["", " extra", "x"]) for _ in range(2000)]
+    prompts += [f"Please answer. {key} Thanks" for key in keys] + ["", "unrelated prompt"]
+    for prompt in prompts:
+        assert TemplateRegistry(GOVERNANCE_TEMPLATES).match_prompt(prompt) == (generate_text_linear(prompt, None))
+
+    workload = [(rng.choice(categories),) for _ in range(num_policies)]
+    print(f"Rendering {num_policies} policies across {len(categories)} categories")
+
+    legacy = time_per_call(render_policy_fstring, workload)
+    print(f"f-string + linear lookup          {legacy * 1e6:6.2f}us per policy")
+    compiled = time_per_call(lambda category: render_policy_compiled(registry, category), workload)
+    print(f"compiled templates, uncached      {compiled * 1e6:6.2f}us per policy")
+    cached = time_per_call(lambda category: render_policy_cached(registry, category), workload)
+    print(f"compiled templates, memoized      {cached * 1e6:6.2f}us per policy  speedup x{legacy / cached:.1f}")
+
+    lookups = [(f"Policy for {category} in AI systems:",) for (category,) in workload]
+    linear_lookup = time_per_call(generate_text_linear, lookups)
+    trie_lookup = time_per_call(registry.match_prompt, lookups)
+    print(f"prompt lookup: linear {linear_lookup * 1e6:.2f}us, trie (memoized) {trie_lookup * 1e6:.2f}us")
+
+    # Cold (unmemoized) resolution as the number of prompt templates grows
+    for num_keys in (len(keys), 100, 1000):
+        prompt_templates = dict(GOVERNANCE_TEMPLATES)
+        prompt_templates.update({f"Template prompt number {i}:": f"text {i}" for i in range(num_keys - len(keys))})
+        scaled = TemplateRegistry(prompt_templates)
+        unique = [(f"Policy for item {i} in AI systems:",) for i in range(2000)]
+        linear = time_per_call(lambda prompt: next((k for k in prompt_templates if k in prompt or prompt in k), None), unique)
+        print(f"cold lookup, {num_keys:5d} templates: linear {linear * 1e6:8.2f}us, "
+              f"registry {time_per_call(scaled._resolve, unique) * 1e6:8.2f}us")
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,74 @@
+"""
+Benchmark for period reports: daily rollup rows versus aggregating the raw
+assessment history, plus the write overhead of maintaining the rollups.
+
+Builds a temporary database with init_db, loads a synthetic two-year history of
+risk assessments and times a quarterly per-day aggregation both ways.
+
+Run from the repository root:
+    python -m benchmarks.bench_report_rollups
+"""
+import os
+import random
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from database import db_utils_sqlite
+
+def synthetic_assessments(num_assessments: int, days: int = 730, seed: int = 11):
+    rng = random.Random(seed)
+    start = datetime(2024, 1, 1)
+    for i in range(num_assessments):
+        created_at = start + timedelta(seconds=rng.randrange(days * 86400))
+        yield (f"Assessment {i}", f"model-{i % 500}", round(rng.uniform(5, 95), 1), "", "", created_at.isoformat(), "Medium Risk")
+
+def timed(fn, repeat: int = 5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+def run(num_assessments: int = 500000):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_utils_sqlite.DB_PATH = os.path.join(tmp, "bench.db")
+        from database.db_init_sqlite import init_db
+        init_db()
+        conn = db_utils_sqlite.get_db_connection()
+        rows = list(synthetic_assessments(num_assessments))
+        insert = ('INSERT INTO risk_assessments (title, model_name, risk_score, findings, recommendations, created_at, status) '
+                  'VALUES (?, ?, ?, ?, ?, ?, ?)')
+
+        start = time.perf_counter()
+        conn.executemany(insert, rows)
+        conn.commit()
+        with_rollups = time.perf_counter() - start
+        print(f"Inserted {num_assessments} assessments with rollup triggers in {with_rollups:.2f}s")
+
+        conn.execute('DROP TRIGGER trg_risk_assessments_rollup_insert')
+        start = time.perf_counter()
+        conn.executemany(insert, rows[:100000])
+        conn.rollback()
+        without = (time.perf_counter() - start) * num_assessments / 100000
+        print(f"  without them (extrapolated from 100k rows)         {without:.2f}s")
+
+        start_day, end_day = "2025-07-01", "2025-09-29"
+        raw_time, raw = timed(lambda: conn.execute(
+            """SELECT substr(created_at, 1, 10) AS day, COUNT(*) AS assessments, SUM(risk_score) AS risk_score_sum,
+                      SUM(risk_score >= 75) AS high_risk_assessments
+            FROM risk_assessments WHERE created_at >= ? AND created_at < date(?, '+1 day') GROUP BY 1 ORDER BY 1""",
+            (start_day, end_day)
+        ).fetchall())
+        rollup_time, rollup = timed(lambda: conn.execute(
+            'SELECT * FROM daily_risk_rollup WHERE day BETWEEN ? AND ? ORDER BY day', (start_day, end_day)
+        ).fetchall())
+        assert [(r['day'], r['assessments'], r['high_risk_assessments']) for r in raw] == \
+               [(r['day'], r['assessments'], r['high_risk_assessments']) for r in rollup]
+        print(f"Quarter {start_day}..{end_day}: raw aggregation {raw_time * 1000:.1f}ms, "
+              f"rollups {rollup_time * 1000:.2f}ms ({len(rollup)} rows), x{raw_time / rollup_time:.0f}")
+        conn.close()
+
+if __name__ == "__main__":
+    run()
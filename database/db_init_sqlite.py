@@ -2,7 +2,8 @@ import sqlite3
 import os
 import datetime
 from database.models import Policy, RiskAssessment, ComplianceMonitor, Report, Activity
-from database.db_utils_sqlite import DB_PATH, get_db_connection
+from database.db_utils_sqlite import DB_PATH, VERSIONED_TABLES, get_db_connection
+from utils.policy_index import rebuild_policy_index
 
 def init_db():
     """Initialize the SQLite database with the required tables if they don't exist."""
@@ -25,6 +26,66 @@ def init_db():
         content TEXT
     );
     
+    CREATE TABLE IF NOT EXISTS policy_category_counts (
+        category TEXT PRIMARY KEY,
+        active_count INTEGER NOT NULL DEFAULT 0,
+        total_count INTEGER NOT NULL DEFAULT 0
+    );
+    
+    -- Keep policy_category_counts in step with policies inside the writing transaction
+    CREATE TRIGGER IF NOT EXISTS trg_policies_category_counts_insert
+    AFTER INSERT ON policies
+    BEGIN
+        INSERT INTO policy_category_counts (category, active_count, total_count)
+        VALUES (COALESCE(NEW.category, ''), NEW.status = 'Active', 1)
+        ON CONFLICT (category) DO UPDATE SET
+            active_count = active_count + excluded.active_count,
+            total_count = total_count + 1;
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS trg_policies_category_counts_update
+    AFTER UPDATE OF category, status ON policies
+    BEGIN
+        UPDATE policy_category_counts
+        SET active_count = active_count - (OLD.status = 'Active'), total_count = total_count - 1
+        WHERE category = COALESCE(OLD.category, '');
+        INSERT INTO policy_category_counts (category, active_count, total_count)
+        VALUES (COALESCE(NEW.category, ''), NEW.status = 'Active', 1)
+        ON CONFLICT (category) DO UPDATE SET
+            active_count = active_count + excluded.active_count,
+            total_count = total_count + 1;
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS trg_policies_category_counts_delete
+    AFTER DELETE ON policies
+    BEGIN
+        UPDATE policy_category_counts
+        SET active_count = active_count - (OLD.status = 'Active'), total_count = total_count - 1
+        WHERE category = COALESCE(OLD.category, '');
+    END;
+    
+    -- MinHash signatures and LSH band buckets of policy content (see utils/policy_index.py)
+    CREATE TABLE IF NOT EXISTS policy_minhash (
+        policy_id INTEGER PRIMARY KEY,
+        signature BLOB NOT NULL
+    );
+    
+    CREATE TABLE IF NOT EXISTS policy_lsh_buckets (
+        band INTEGER NOT NULL,
+        bucket INTEGER NOT NULL,
+        policy_id INTEGER NOT NULL,
+        PRIMARY KEY (band, bucket, policy_id)
+    ) WITHOUT ROWID;
+    
+    CREATE INDEX IF NOT EXISTS idx_policy_lsh_buckets_policy_id ON policy_lsh_buckets (policy_id);
+    
+    CREATE TRIGGER IF NOT EXISTS trg_policies_minhash_delete
+    AFTER DELETE ON policies
+    BEGIN
+        DELETE FROM policy_lsh_buckets WHERE policy_id = OLD.id;
+        DELETE FROM policy_minhash WHERE policy_id = OLD.id;
+    END;
+    
     CREATE TABLE IF NOT EXISTS risk_assessments (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         title TEXT NOT NULL,
@@ -33,9 +94,80 @@ def init_db():
         findings TEXT,
         recommendations TEXT,
         created_at TEXT,
-        status TEXT
+        status TEXT,
+        score_source TEXT NOT NULL DEFAULT 'manual'
     );
     
+    -- Category weights of the risk scoring engine, shared by every process
+    CREATE TABLE IF NOT EXISTS risk_category_weights (
+        category TEXT PRIMARY KEY,
+        weight REAL NOT NULL
+    ) WITHOUT ROWID;
+    
+    CREATE INDEX IF NOT EXISTS idx_risk_assessments_risk_score
+        ON risk_assessments (risk_score DESC, model_name);
+    
+    CREATE INDEX IF NOT EXISTS idx_risk_assessments_model_name_id
+        ON risk_assessments (model_name, id DESC);
+    
+    CREATE TABLE IF NOT EXISTS model_risk_current (
+        model_name TEXT PRIMARY KEY,
+        assessment_id INTEGER NOT NULL,
+        title TEXT,
+        risk_score REAL,
+        status TEXT,
+        created_at TEXT,
+        previous_assessment_id INTEGER,
+        previous_risk_score REAL,
+        risk_delta REAL,
+        assessment_count INTEGER NOT NULL DEFAULT 1
+    );
+    
+    -- model_name breaks ties in score order so pages neither repeat nor skip models
+    CREATE INDEX IF NOT EXISTS idx_model_risk_current_risk_score_model
+        ON model_risk_current (risk_score DESC, model_name);
+    
+    -- Keep model_risk_current in step with risk_assessments inside the writing transaction
+    CREATE TRIGGER IF NOT EXISTS trg_risk_assessments_current_insert
+    AFTER INSERT ON risk_assessments
+    WHEN NEW.model_name IS NOT NULL
+    BEGIN
+        INSERT INTO model_risk_current (model_name, assessment_id, title, risk_score, status, created_at, assessment_count)
+        VALUES (NEW.model_name, NEW.id, NEW.title, NEW.risk_score, NEW.status, NEW.created_at, 1)
+        ON CONFLICT (model_name) DO UPDATE SET
+            previous_assessment_id = assessment_id,
+            previous_risk_score = risk_score,
+            risk_delta = ROUND(excluded.risk_score - risk_score, 2),
+            assessment_id = excluded.assessment_id,
+            title = excluded.title,
+            risk_score = excluded.risk_score,
+            status = excluded.status,
+            created_at = excluded.created_at,
+            assessment_count = assessment_count + 1;
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS trg_risk_assessments_current_update
+    AFTER UPDATE OF risk_score, status ON risk_assessments
+    BEGIN
+        UPDATE model_risk_current
+        SET risk_score = NEW.risk_score, status = NEW.status, risk_delta = ROUND(NEW.risk_score - previous_risk_score, 2)
+        WHERE assessment_id = NEW.id;
+        UPDATE model_risk_current
+        SET previous_risk_score = NEW.risk_score, risk_delta = ROUND(risk_score - NEW.risk_score, 2)
+        WHERE previous_assessment_id = NEW.id;
+    END;
+    
+    CREATE TABLE IF NOT EXISTS risk_category_scores (
+        assessment_id INTEGER NOT NULL REFERENCES risk_assessments(id),
+        model_name TEXT,
+        category TEXT NOT NULL,
+        score REAL NOT NULL,
+        PRIMARY KEY (assessment_id, category)
+    );
+    
+    CREATE INDEX IF NOT EXISTS idx_risk_category_scores_category_score
+        ON risk_category_scores (category, score DESC);
+    
     CREATE TABLE IF NOT EXISTS compliance_monitors (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         name TEXT NOT NULL,
@@ -48,6 +180,121 @@ def init_db():
         alert_level TEXT
     );
     
+    -- Daily rollups for period reports, maintained by the triggers below so a report over
+    -- N days reads N rows. Days are local dates, as the timestamps are local times.
+    CREATE TABLE IF NOT EXISTS daily_risk_rollup (
+        day TEXT PRIMARY KEY,
+        assessments INTEGER NOT NULL DEFAULT 0,
+        risk_score_sum REAL NOT NULL DEFAULT 0,
+        high_risk_assessments INTEGER NOT NULL DEFAULT 0
+    ) WITHOUT ROWID;
+    
+    -- High risk is a score of 75 or more (HIGH_RISK_THRESHOLD in the report sections)
+    CREATE TRIGGER IF NOT EXISTS trg_risk_assessments_rollup_insert
+    AFTER INSERT ON risk_assessments
+    BEGIN
+        INSERT INTO daily_risk_rollup (day, assessments, risk_score_sum, high_risk_assessments)
+        VALUES (COALESCE(substr(NEW.created_at, 1, 10), date('now', 'localtime')), 1,
+                COALESCE(NEW.risk_score, 0), COALESCE(NEW.risk_score >= 75, 0))
+        ON CONFLICT (day) DO UPDATE SET
+            assessments = assessments + 1,
+            risk_score_sum = risk_score_sum + excluded.risk_score_sum,
+            high_risk_assessments = high_risk_assessments + excluded.high_risk_assessments;
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS trg_risk_assessments_rollup_update
+    AFTER UPDATE OF risk_score, created_at ON risk_assessments
+    BEGIN
+        UPDATE daily_risk_rollup
+        SET assessments = assessments - 1,
+            risk_score_sum = risk_score_sum - COALESCE(OLD.risk_score, 0),
+            high_risk_assessments = high_risk_assessments - COALESCE(OLD.risk_score >= 75, 0)
+        WHERE day = COALESCE(substr(OLD.created_at, 1, 10), date('now', 'localtime'));
+        INSERT INTO daily_risk_rollup (day, assessments, risk_score_sum, high_risk_assessments)
+        VALUES (COALESCE(substr(NEW.created_at, 1, 10), date('now', 'localtime')), 1,
+                COALESCE(NEW.risk_score, 0), COALESCE(NEW.risk_score >= 75, 0))
+        ON CONFLICT (day) DO UPDATE SET
+            assessments = assessments + 1,
+            risk_score_sum = risk_score_sum + excluded.risk_score_sum,
+            high_risk_assessments = high_risk_assessments + excluded.high_risk_assessments;
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS trg_risk_assessments_rollup_delete
+    AFTER DELETE ON risk_assessments
+    BEGIN
+        UPDATE daily_risk_rollup
+        SET assessments = assessments - 1,
+            risk_score_sum = risk_score_sum - COALESCE(OLD.risk_score, 0),
+            high_risk_assessments = high_risk_assessments - COALESCE(OLD.risk_score >= 75, 0)
+        WHERE day = COALESCE(substr(OLD.created_at, 1, 10), date('now', 'localtime'));
+    END;
+    
+    -- Monitor state as of the last monitor write of each day, plus the alerts raised that day
+    CREATE TABLE IF NOT EXISTS daily_compliance_rollup (
+        day TEXT PRIMARY KEY,
+        active_monitors INTEGER NOT NULL DEFAULT 0,
+        compliant_monitors INTEGER NOT NULL DEFAULT 0,
+        warning_monitors INTEGER NOT NULL DEFAULT 0,
+        critical_monitors INTEGER NOT NULL DEFAULT 0,
+        alerts_raised INTEGER NOT NULL DEFAULT 0
+    ) WITHOUT ROWID;
+    
+    -- The first monitor write of a day carries the last recorded state forward, then every
+    -- write adjusts today's row by the change it made, like the policy_category_counts triggers
+    CREATE TRIGGER IF NOT EXISTS trg_compliance_monitors_rollup_insert
+    AFTER INSERT ON compliance_monitors
+    BEGIN
+        INSERT OR IGNORE INTO daily_compliance_rollup
+            (day, active_monitors, compliant_monitors, warning_monitors, critical_monitors)
+        SELECT date('now', 'localtime'), active_monitors, compliant_monitors, warning_monitors, critical_monitors
+        FROM daily_compliance_rollup WHERE day < date('now', 'localtime') ORDER BY day DESC LIMIT 1;
+        INSERT OR IGNORE INTO daily_compliance_rollup (day) VALUES (date('now', 'localtime'));
+        UPDATE daily_compliance_rollup SET
+            active_monitors = active_monitors + (NEW.status IS 'Active'),
+            compliant_monitors = compliant_monitors + (NEW.status IS 'Active' AND NEW.alert_level IS 'Normal'),
+            warning_monitors = warning_monitors + (NEW.status IS 'Active' AND NEW.alert_level IS 'Warning'),
+            critical_monitors = critical_monitors + (NEW.status IS 'Active' AND NEW.alert_level IS 'Critical'),
+            alerts_raised = alerts_raised + (NEW.alert_level IS 'Warning' OR NEW.alert_level IS 'Critical')
+        WHERE day = date('now', 'localtime');
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS trg_compliance_monitors_rollup_update
+    AFTER UPDATE OF status, alert_level ON compliance_monitors
+    BEGIN
+        INSERT OR IGNORE INTO daily_compliance_rollup
+            (day, active_monitors, compliant_monitors, warning_monitors, critical_monitors)
+        SELECT date('now', 'localtime'), active_monitors, compliant_monitors, warning_monitors, critical_monitors
+        FROM daily_compliance_rollup WHERE day < date('now', 'localtime') ORDER BY day DESC LIMIT 1;
+        INSERT OR IGNORE INTO daily_compliance_rollup (day) VALUES (date('now', 'localtime'));
+        UPDATE daily_compliance_rollup SET
+            active_monitors = active_monitors + (NEW.status IS 'Active') - (OLD.status IS 'Active'),
+            compliant_monitors = compliant_monitors + (NEW.status IS 'Active' AND NEW.alert_level IS 'Normal')
+                - (OLD.status IS 'Active' AND OLD.alert_level IS 'Normal'),
+            warning_monitors = warning_monitors + (NEW.status IS 'Active' AND NEW.alert_level IS 'Warning')
+                - (OLD.status IS 'Active' AND OLD.alert_level IS 'Warning'),
+            critical_monitors = critical_monitors + (NEW.status IS 'Active' AND NEW.alert_level IS 'Critical')
+                - (OLD.status IS 'Active' AND OLD.alert_level IS 'Critical'),
+            alerts_raised = alerts_raised + ((NEW.alert_level IS 'Warning' OR NEW.alert_level IS 'Critical')
+                AND NEW.alert_level IS NOT OLD.alert_level)
+        WHERE day = date('now', 'localtime');
+    END;
+    
+    CREATE TRIGGER IF NOT EXISTS trg_compliance_monitors_rollup_delete
+    AFTER DELETE ON compliance_monitors
+    BEGIN
+        INSERT OR IGNORE INTO daily_compliance_rollup
+            (day, active_monitors, compliant_monitors, warning_monitors, critical_monitors)
+        SELECT date('now', 'localtime'), active_monitors, compliant_monitors, warning_monitors, critical_monitors
+        FROM daily_compliance_rollup WHERE day < date('now', 'localtime') ORDER BY day DESC LIMIT 1;
+        INSERT OR IGNORE INTO daily_compliance_rollup (day) VALUES (date('now', 'localtime'));
+        UPDATE daily_compliance_rollup SET
+            active_monitors = active_monitors - (OLD.status IS 'Active'),
+            compliant_monitors = compliant_monitors - (OLD.status IS 'Active' AND OLD.alert_level IS 'Normal'),
+            warning_monitors = warning_monitors - (OLD.status IS 'Active' AND OLD.alert_level IS 'Warning'),
+            critical_monitors = critical_monitors - (OLD.status IS 'Active' AND OLD.alert_level IS 'Critical')
+        WHERE day = date('now', 'localtime');
+    END;
+    
     CREATE TABLE IF NOT EXISTS reports (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         title TEXT NOT NULL,
@@ -59,6 +306,15 @@ def init_db():
         status TEXT
     );
     
+    -- Build time of each section of generated reports
+    CREATE TABLE IF NOT EXISTS report_section_timings (
+        report_id INTEGER NOT NULL,
+        section TEXT NOT NULL,
+        position INTEGER NOT NULL,
+        elapsed_ms REAL NOT NULL,
+        PRIMARY KEY (report_id, section)
+    );
+    
     CREATE TABLE IF NOT EXISTS activities (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         activity_type TEXT,
@@ -68,10 +324,50 @@ def init_db():
         related_entity_id INTEGER,
         related_entity_type TEXT
     );
+    
+    -- Per-table data versions, bumped by the triggers below on every row written
+    CREATE TABLE IF NOT EXISTS data_versions (
+        table_name TEXT PRIMARY KEY,
+        version INTEGER NOT NULL DEFAULT 0,
+        updated_at TEXT
+    ) WITHOUT ROWID;
     ''')
     
+    # Assessments stored before score sources were recorded keep their scores as entered
+    cursor.execute('PRAGMA table_info(risk_assessments)')
+    if 'score_source' not in {row['name'] for row in cursor.fetchall()}:
+        cursor.execute("ALTER TABLE risk_assessments ADD COLUMN score_source TEXT NOT NULL DEFAULT 'manual'")
+    
+    for table in VERSIONED_TABLES:
+        cursor.execute(
+            "INSERT OR IGNORE INTO data_versions (table_name, version, updated_at) VALUES (?, 0, strftime('%Y-%m-%dT%H:%M:%SZ', 'now'))",
+            (table,)
+        )
+        for event in ('INSERT', 'UPDATE', 'DELETE'):
+            cursor.execute(f'''
+            CREATE TRIGGER IF NOT EXISTS trg_{table}_version_{event.lower()}
+            AFTER {event} ON {table}
+            BEGIN
+                UPDATE data_versions SET version = version + 1, updated_at = strftime('%Y-%m-%dT%H:%M:%SZ', 'now')
+                WHERE table_name = '{table}';
+            END
+            ''')
+    
     conn.commit()
     
+    # Databases created before model_risk_current existed get it built once from the history
+    cursor.execute('SELECT COUNT(*) as count FROM model_risk_current')
+    if cursor.fetchone()['count'] == 0:
+        rebuild_model_risk_current(conn)
+    
+    cursor.execute('SELECT COUNT(*) as count FROM policy_category_counts')
+    if cursor.fetchone()['count'] == 0:
+        rebuild_policy_category_counts(conn)
+    
+    cursor.execute('SELECT (SELECT COUNT(*) FROM daily_risk_rollup) + (SELECT COUNT(*) FROM daily_compliance_rollup) as count')
+    if cursor.fetchone()['count'] == 0:
+        rebuild_daily_rollups(conn)
+    
     # Check if we need to preload data (only if tables are empty)
     cursor.execute('SELECT COUNT(*) as count FROM policies')
     policy_count = cursor.fetchone()['count']
@@ -86,11 +382,79 @@ def init_db():
     if policy_count == 0 and assessment_count == 0 and monitor_count == 0:
         preload_sample_data(conn)
     
+    # Index policies written before the near-duplicate index existed (and the sample data)
+    cursor.execute('SELECT COUNT(*) as count FROM policies WHERE id NOT IN (SELECT policy_id FROM policy_minhash)')
+    if cursor.fetchone()['count'] > 0:
+        rebuild_policy_index(conn)
+    
     cursor.close()
     conn.close()
     
     print("Database initialized successfully.")
 
+def rebuild_policy_category_counts(conn):
+    """Recompute the per-category active and total policy counters from the policies table."""
+    cursor = conn.cursor()
+    cursor.execute('DELETE FROM policy_category_counts')
+    cursor.execute('''
+    INSERT INTO policy_category_counts (category, active_count, total_count)
+    SELECT COALESCE(category, ''), SUM(status = 'Active'), COUNT(*)
+    FROM policies
+    GROUP BY COALESCE(category, '')
+    ''')
+    conn.commit()
+    cursor.close()
+
+def rebuild_model_risk_current(conn):
+    """Recompute the latest assessment and trend of every model from the full assessment history."""
+    cursor = conn.cursor()
+    cursor.execute('DELETE FROM model_risk_current')
+    cursor.execute('''
+    INSERT INTO model_risk_current (
+        model_name, assessment_id, title, risk_score, status, created_at,
+        previous_assessment_id, previous_risk_score, risk_delta, assessment_count
+    )
+    SELECT model_name, id, title, risk_score, status, created_at,
+           previous_id, previous_score, ROUND(risk_score - previous_score, 2), assessment_count
+    FROM (
+        SELECT ra.*,
+               ROW_NUMBER() OVER (PARTITION BY model_name ORDER BY id DESC) AS version_rank,
+               LEAD(id) OVER (PARTITION BY model_name ORDER BY id DESC) AS previous_id,
+               LEAD(risk_score) OVER (PARTITION BY model_name ORDER BY id DESC) AS previous_score,
+               COUNT(*) OVER (PARTITION BY model_name) AS assessment_count
+        FROM risk_assessments ra
+        WHERE model_name IS NOT NULL
+    )
+    WHERE version_rank = 1
+    ''')
+    conn.commit()
+    cursor.close()
+
+def rebuild_daily_rollups(conn):
+    """
+    Recompute the daily risk rollup from the assessment history and record today's monitor state.
+    
+    Past monitor states are not stored, so compliance rollups start from the day this runs.
+    """
+    cursor = conn.cursor()
+    cursor.execute('DELETE FROM daily_risk_rollup')
+    cursor.execute('''
+    INSERT INTO daily_risk_rollup (day, assessments, risk_score_sum, high_risk_assessments)
+    SELECT COALESCE(substr(created_at, 1, 10), date('now', 'localtime')), COUNT(*),
+           SUM(COALESCE(risk_score, 0)), SUM(COALESCE(risk_score >= 75, 0))
+    FROM risk_assessments
+    GROUP BY 1
+    ''')
+    cursor.execute('DELETE FROM daily_compliance_rollup')
+    cursor.execute('''
+    INSERT INTO daily_compliance_rollup
+    SELECT date('now', 'localtime'), COUNT(*), COALESCE(SUM(alert_level = 'Normal'), 0),
+           COALESCE(SUM(alert_level = 'Warning'), 0), COALESCE(SUM(alert_level = 'Critical'), 0), 0
+    FROM compliance_monitors WHERE status = 'Active'
+    ''')
+    conn.commit()
+    cursor.close()
+
 def preload_sample_data(conn):
     """Preload sample data aligned with NIST AI Risk Management Framework."""
     cursor = conn.cursor()
@@ -1,8 +1,9 @@
 import sqlite3
 import os
 import datetime
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, Optional, Union, Iterator, Callable
 from database.models import Policy, RiskAssessment, ComplianceMonitor, Report, Activity
+from utils.policy_index import index_policy, find_near_duplicates, DEFAULT_SIMILARITY_THRESHOLD
 
 # Create database directory if it doesn't exist
 os.makedirs('database/data', exist_ok=True)
@@ -18,6 +19,93 @@ def get_db_connection():
     conn.row_factory = dict_factory
     return conn
 
+# Called as listener(event_type, payload) after each committed write; see add_write_listener
+_write_listeners: List[Callable[[str, Dict[str, Any]], None]] = []
+
+def add_write_listener(listener: Callable[[str, Dict[str, Any]], None]) -> None:
+    """
+    Register a callable notified after each committed write.
+    
+    Listeners are called on the writing thread with an event type and payload, e.g.
+    ("policy.created", {"id": 3, ...}), and should hand the work off rather than block.
+    """
+    if listener not in _write_listeners:
+        _write_listeners.append(listener)
+
+def remove_write_listener(listener: Callable[[str, Dict[str, Any]], None]) -> None:
+    """Unregister a write listener."""
+    if listener in _write_listeners:
+        _write_listeners.remove(listener)
+
+def notify_write(event_type: str, payload: Dict[str, Any]) -> None:
+    """Notify the write listeners of a committed write; a failing listener does not fail the write."""
+    for listener in list(_write_listeners):
+        try:
+            listener(event_type, payload)
+        except Exception as e:
+            print(f"Write listener failed for {event_type}: {str(e)}")
+
+def insert_activity(cursor, activity_type: str, description: str, created_at: str, actor: str,
+                    related_entity_id: Optional[int] = None, related_entity_type: Optional[str] = None) -> Dict[str, Any]:
+    """Insert an activity row using an open cursor and return it, for notify_write once committed."""
+    cursor.execute(
+        'INSERT INTO activities (activity_type, description, created_at, actor, related_entity_id, related_entity_type) VALUES (?, ?, ?, ?, ?, ?)',
+        (activity_type, description, created_at, actor, related_entity_id, related_entity_type)
+    )
+    return {
+        "id": cursor.lastrowid, "activity_type": activity_type, "description": description, "created_at": created_at,
+        "actor": actor, "related_entity_id": related_entity_id, "related_entity_type": related_entity_type
+    }
+
+def policy_event_payload(policy_id: int, policy, updated_at: str) -> Dict[str, Any]:
+    """Build the payload of a policy.created or policy.updated event."""
+    return {"id": policy_id, "title": policy.title, "category": policy.category, "status": policy.status, "updated_at": updated_at}
+
+def monitor_event_payload(monitor_id: int, monitor, last_checked: str) -> Dict[str, Any]:
+    """Build the payload of a monitor.created or monitor.updated event: the monitor's dashboard columns."""
+    return {
+        "id": monitor_id, "name": monitor.name, "model_or_system": monitor.model_or_system,
+        "threshold_value": monitor.threshold_value, "current_value": monitor.current_value, "status": monitor.status,
+        "alert_level": monitor.alert_level, "last_checked": last_checked
+    }
+
+# Tables whose writes bump their row in data_versions (via triggers created by init_db)
+VERSIONED_TABLES = ('policies', 'risk_assessments', 'risk_category_scores', 'compliance_monitors', 'reports', 'activities')
+
+def read_data_versions(cursor) -> Dict[str, int]:
+    """Read the current data version of every versioned table using an open cursor."""
+    cursor.execute('SELECT table_name, version FROM data_versions')
+    return {row['table_name']: row['version'] for row in cursor.fetchall()}
+
+def get_data_versions() -> Dict[str, int]:
+    """
+    Retrieve the data version of every versioned table.
+    
+    A table's version increases with every row written to it, by any write path
+    and any process, so equal versions mean the table's data has not changed.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    versions = read_data_versions(cursor)
+    cursor.close()
+    conn.close()
+    return versions
+
+def get_data_version_stamps() -> Dict[str, Dict[str, Any]]:
+    """
+    Retrieve the data version of every versioned table with the time it last changed.
+    
+    Returns:
+        Mapping of table name to {"version": int, "updated_at": UTC "YYYY-MM-DDTHH:MM:SSZ"}
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute('SELECT table_name, version, updated_at FROM data_versions')
+    stamps = {row['table_name']: {"version": row['version'], "updated_at": row['updated_at']} for row in cursor.fetchall()}
+    cursor.close()
+    conn.close()
+    return stamps
+
 # Policy functions
 def get_all_policies() -> List[Dict[str, Any]]:
     """Retrieve all policies from the database."""
@@ -49,16 +137,16 @@ def create_policy(policy: Policy) -> int:
         (policy.title, policy.description, policy.category, policy.status, now, now, policy.content)
     )
     policy_id = cursor.lastrowid
+    index_policy(cursor, policy_id, policy.content)
     
     # Log the activity
-    cursor.execute(
-        'INSERT INTO activities (activity_type, description, created_at, actor, related_entity_id, related_entity_type) VALUES (?, ?, ?, ?, ?, ?)',
-        ('create_policy', f'Created policy: {policy.title}', now, 'Governance Agent', policy_id, 'policy')
-    )
+    activity = insert_activity(cursor, 'create_policy', f'Created policy: {policy.title}', now, 'Governance Agent', policy_id, 'policy')
     
     conn.commit()
     cursor.close()
     conn.close()
+    notify_write('policy.created', policy_event_payload(policy_id, policy, now))
+    notify_write('activity.created', activity)
     return policy_id
 
 def update_policy(policy: Policy) -> bool:
@@ -70,18 +158,67 @@ def update_policy(policy: Policy) -> bool:
         'UPDATE policies SET title = ?, description = ?, category = ?, status = ?, updated_at = ?, content = ? WHERE id = ?',
         (policy.title, policy.description, policy.category, policy.status, now, policy.content, policy.id)
     )
+    index_policy(cursor, policy.id, policy.content)
     
     # Log the activity
-    cursor.execute(
-        'INSERT INTO activities (activity_type, description, created_at, actor, related_entity_id, related_entity_type) VALUES (?, ?, ?, ?, ?, ?)',
-        ('update_policy', f'Updated policy: {policy.title}', now, 'Governance Agent', policy.id, 'policy')
-    )
+    activity = insert_activity(cursor, 'update_policy', f'Updated policy: {policy.title}', now, 'Governance Agent', policy.id, 'policy')
     
     conn.commit()
     cursor.close()
     conn.close()
+    notify_write('policy.updated', policy_event_payload(policy.id, policy, now))
+    notify_write('activity.created', activity)
     return True
 
+def get_policy_category_counts() -> Dict[str, Dict[str, int]]:
+    """Retrieve the maintained active and total policy counts per category."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute('SELECT category, active_count, total_count FROM policy_category_counts')
+    counts = {row['category']: {'active': row['active_count'], 'total': row['total_count']} for row in cursor.fetchall()}
+    cursor.close()
+    conn.close()
+    return counts
+
+def get_policy_count() -> int:
+    """Count all policies from the maintained per-category counters."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    policy_count = read_policy_count(cursor)
+    cursor.close()
+    conn.close()
+    return policy_count
+
+def read_policy_count(cursor) -> int:
+    """Count all policies as get_policy_count does, using an open cursor; reads one row per category."""
+    cursor.execute('SELECT COALESCE(SUM(total_count), 0) AS policy_count FROM policy_category_counts')
+    return cursor.fetchone()['policy_count']
+
+def get_near_duplicate_policies(policy_id: int, threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+                                limit: int = 20) -> List[Dict[str, Any]]:
+    """
+    Retrieve policies whose content is a near-duplicate of a policy.
+    
+    Candidates come from the LSH bucket index, so only policies sharing a band with
+    the given one are compared. Each result is the policy summary plus its estimated
+    Jaccard similarity, most similar first.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    matches = find_near_duplicates(cursor, policy_id, threshold, limit)
+    policies = {}
+    if matches:
+        ids = [match['policy_id'] for match in matches]
+        cursor.execute(
+            f'SELECT id, title, category, status, updated_at FROM policies WHERE id IN ({", ".join("?" for _ in ids)})',
+            ids
+        )
+        policies = {row['id']: row for row in cursor.fetchall()}
+    cursor.close()
+    conn.close()
+    return [dict(policies[match['policy_id']], similarity=match['similarity'])
+            for match in matches if match['policy_id'] in policies]
+
 # Risk Assessment functions
 def get_all_risk_assessments() -> List[Dict[str, Any]]:
     """Retrieve all risk assessments from the database."""
@@ -103,28 +240,208 @@ def get_risk_assessment(assessment_id: int) -> Optional[Dict[str, Any]]:
     conn.close()
     return assessment
 
-def create_risk_assessment(assessment: RiskAssessment) -> int:
-    """Create a new risk assessment and return its ID."""
+def create_risk_assessment(assessment: RiskAssessment, category_scores: Optional[Dict[str, float]] = None) -> int:
+    """Create a new risk assessment, with its optional per-category scores, and return its ID."""
     conn = get_db_connection()
     cursor = conn.cursor()
     now = datetime.datetime.now().isoformat()
     cursor.execute(
-        'INSERT INTO risk_assessments (title, model_name, risk_score, findings, recommendations, created_at, status) VALUES (?, ?, ?, ?, ?, ?, ?)',
-        (assessment.title, assessment.model_name, assessment.risk_score, assessment.findings, assessment.recommendations, now, assessment.status)
+        'INSERT INTO risk_assessments (title, model_name, risk_score, findings, recommendations, created_at, status, score_source) VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+        (assessment.title, assessment.model_name, assessment.risk_score, assessment.findings, assessment.recommendations, now,
+         assessment.status, assessment.score_source)
     )
     assessment_id = cursor.lastrowid
     
+    if category_scores:
+        cursor.executemany(
+            'INSERT INTO risk_category_scores (assessment_id, model_name, category, score) VALUES (?, ?, ?, ?)',
+            [(assessment_id, assessment.model_name, category, score) for category, score in category_scores.items()]
+        )
+    
     # Log the activity
-    cursor.execute(
-        'INSERT INTO activities (activity_type, description, created_at, actor, related_entity_id, related_entity_type) VALUES (?, ?, ?, ?, ?, ?)',
-        ('create_risk_assessment', f'Created risk assessment: {assessment.title}', now, 'Risk Assessment Agent', assessment_id, 'risk_assessment')
-    )
+    activity = insert_activity(cursor, 'create_risk_assessment', f'Created risk assessment: {assessment.title}', now,
+                               'Risk Assessment Agent', assessment_id, 'risk_assessment')
     
     conn.commit()
     cursor.close()
     conn.close()
+    notify_write('risk_assessment.created', {
+        "id": assessment_id, "title": assessment.title, "model_name": assessment.model_name,
+        "risk_score": assessment.risk_score, "status": assessment.status, "created_at": now
+    })
+    notify_write('activity.created', activity)
     return assessment_id
 
+def get_risk_category_distribution(model_names: Optional[List[str]] = None, limit: int = 5) -> Dict[str, Any]:
+    """
+    Aggregate per-category risk scores over the latest assessment of the selected models.
+    
+    Models are selected by name, otherwise the highest-risk models are used. Returns the
+    per-category average and maximum across the selection plus each model's category scores.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    distribution = read_risk_category_distribution(cursor, model_names, limit)
+    cursor.close()
+    conn.close()
+    return distribution
+
+def read_risk_category_distribution(cursor, model_names: Optional[List[str]] = None, limit: int = 5) -> Dict[str, Any]:
+    """Aggregate per-category risk scores as get_risk_category_distribution does, using an open cursor."""
+    params = []
+    name_filter = ''
+    if model_names:
+        name_filter = f'WHERE model_name IN ({", ".join("?" for _ in model_names)})'
+        params.extend(model_names)
+    params.append(limit)
+    selection = f'''
+        WITH selected AS (
+            SELECT assessment_id AS id, model_name, risk_score
+            FROM model_risk_current {name_filter}
+            ORDER BY risk_score DESC, model_name
+            LIMIT ?
+        )
+    '''
+    
+    cursor.execute(selection + '''
+        SELECT rcs.category, AVG(rcs.score) AS average_score, MAX(rcs.score) AS max_score, COUNT(*) AS model_count
+        FROM risk_category_scores rcs JOIN selected ON selected.id = rcs.assessment_id
+        GROUP BY rcs.category
+    ''', params)
+    categories = cursor.fetchall()
+    cursor.execute(selection + '''
+        SELECT selected.id AS assessment_id, selected.model_name, selected.risk_score, rcs.category, rcs.score
+        FROM selected JOIN risk_category_scores rcs ON rcs.assessment_id = selected.id
+        ORDER BY selected.risk_score DESC, selected.id DESC
+    ''', params)
+    rows = cursor.fetchall()
+    
+    models = {}
+    for row in rows:
+        model = models.setdefault(row['assessment_id'], {
+            'model_name': row['model_name'], 'risk_score': row['risk_score'], 'scores': {}
+        })
+        model['scores'][row['category']] = row['score']
+    return {'categories': categories, 'models': list(models.values())}
+
+def get_high_risk_assessments(threshold: float = 75.0, limit: int = 50, offset: int = 0) -> Dict[str, Any]:
+    """
+    Retrieve the latest assessment of every model whose current risk score is at least the threshold.
+    
+    Reads model_risk_current in risk_score index order, so both the page and the total
+    cost O(matching models) however long the assessment history grows.
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute('SELECT COUNT(*) AS total FROM model_risk_current WHERE risk_score >= ?', (threshold,))
+    total = cursor.fetchone()['total']
+    cursor.execute(
+        '''SELECT ra.id, ra.title, ra.model_name, ra.risk_score, ra.findings, ra.recommendations, ra.created_at, ra.status,
+               ra.score_source
+        FROM model_risk_current mrc JOIN risk_assessments ra ON ra.id = mrc.assessment_id
+        WHERE mrc.risk_score >= ?
+        ORDER BY mrc.risk_score DESC, mrc.model_name
+        LIMIT ? OFFSET ?''',
+        (threshold, limit, offset)
+    )
+    items = cursor.fetchall()
+    cursor.close()
+    conn.close()
+    return {'items': items, 'total': total, 'threshold': threshold, 'limit': limit, 'offset': offset}
+
+def get_model_risk_current(limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+    """Retrieve the latest risk score and trend of each model, highest risk first."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute(
+        'SELECT * FROM model_risk_current ORDER BY risk_score DESC, model_name LIMIT ? OFFSET ?',
+        (limit, offset)
+    )
+    models = cursor.fetchall()
+    cursor.close()
+    conn.close()
+    return models or []
+
+def get_model_risk_summary() -> Dict[str, Any]:
+    """Average current and previous risk score across models, for dashboard trend deltas."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    summary = read_model_risk_summary(cursor)
+    cursor.close()
+    conn.close()
+    return summary
+
+def read_model_risk_summary(cursor) -> Dict[str, Any]:
+    """Summarize current model risk as get_model_risk_summary does, using an open cursor."""
+    cursor.execute(
+        '''SELECT COUNT(*) AS model_count,
+                  AVG(risk_score) AS avg_risk_score,
+                  AVG(COALESCE(previous_risk_score, risk_score)) AS avg_previous_risk_score,
+                  SUM(CASE WHEN risk_delta > 0 THEN 1 ELSE 0 END) AS models_worsened,
+                  SUM(CASE WHEN risk_delta < 0 THEN 1 ELSE 0 END) AS models_improved
+           FROM model_risk_current'''
+    )
+    return cursor.fetchone()
+
+def get_dashboard_snapshot(model_names: Optional[List[str]] = None, limit: int = 5,
+                           activity_limit: int = 10) -> Dict[str, Any]:
+    """
+    Read everything the dashboard panels are built from in one read transaction.
+    
+    All reads see the same committed state, and each table is read once for every
+    panel that uses it: monitors are shared by the metrics and the compliance
+    status chart, and policies are counted rather than fetched.
+    
+    Args:
+        model_names: Models for the risk distribution, otherwise the highest-risk ones
+        limit: Number of highest-risk models when none are named
+        activity_limit: Number of recent activities
+    
+    Returns:
+        Dictionary with policy_count, risk_summary, monitors (alert_level and status,
+        most recently checked first), risk_distribution and activities
+    """
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    # Reads outside a transaction each see the latest commit; inside one they share a snapshot
+    cursor.execute('BEGIN')
+    try:
+        policy_count = read_policy_count(cursor)
+        risk_summary = read_model_risk_summary(cursor)
+        cursor.execute('SELECT alert_level, status FROM compliance_monitors ORDER BY last_checked DESC')
+        monitors = cursor.fetchall()
+        risk_distribution = read_risk_category_distribution(cursor, model_names, limit)
+        cursor.execute('SELECT * FROM activities ORDER BY created_at DESC LIMIT ?', (activity_limit,))
+        activities = cursor.fetchall()
+    finally:
+        conn.rollback()
+        cursor.close()
+        conn.close()
+    return {
+        'policy_count': policy_count,
+        'risk_summary': risk_summary,
+        'monitors': monitors,
+        'risk_distribution': risk_distribution,
+        'activities': activities
+    }
+
+def get_top_models_for_category(category: str, limit: int = 10) -> List[Dict[str, Any]]:
+    """Retrieve the assessments with the highest score in one risk category."""
+    conn = get_db_connection()
+    cursor = conn.cursor()
+    cursor.execute(
+        '''SELECT rcs.assessment_id, rcs.model_name, rcs.score, ra.risk_score, ra.created_at
+        FROM risk_category_scores rcs JOIN risk_assessments ra ON ra.id = rcs.assessment_id
+        WHERE rcs.category = ?
+        ORDER BY rcs.score DESC
+        LIMIT ?''',
+        (category, limit)
+    )
+    rows = cursor.fetchall()
+    cursor.close()
+    conn.close()
+    return rows or []
+
 # Compliance Monitor functions
 def get_all_compliance_monitors() -> List[Dict[str, Any]]:
     """Retrieve all compliance monitors from the database."""
@@ -158,14 +475,14 @@ def create_compliance_monitor(monitor: ComplianceMonitor) -> int:
     monitor_id = cursor.lastrowid
     
     # Log the activity
-    cursor.execute(
-        'INSERT INTO activities (activity_type, description, created_at, actor, related_entity_id, related_entity_type) VALUES (?, ?, ?, ?, ?, ?)',
-        ('create_compliance_monitor', f'Created compliance monitor: {monitor.name}', now, 'Monitoring Agent', monitor_id, 'compliance_monitor')
-    )
+    activity = insert_activity(cursor, 'create_compliance_monitor', f'Created compliance monitor: {monitor.name}', now,
+                               'Monitoring Agent', monitor_id, 'compliance_monitor')
     
     conn.commit()
     cursor.close()
     conn.close()
+    notify_write('monitor.created', monitor_event_payload(monitor_id, monitor, now))
+    notify_write('activity.created', activity)
     return monitor_id
 
 def update_compliance_monitor(monitor: ComplianceMonitor) -> bool:
@@ -179,14 +496,14 @@ def update_compliance_monitor(monitor: ComplianceMonitor) -> bool:
     )
     
     # Log the activity
-    cursor.execute(
-        'INSERT INTO activities (activity_type, description, created_at, actor, related_entity_id, related_entity_type) VALUES (?, ?, ?, ?, ?, ?)',
-        ('update_compliance_monitor', f'Updated compliance monitor: {monitor.name}', now, 'Monitoring Agent', monitor.id, 'compliance_monitor')
-    )
+    activity = insert_activity(cursor, 'update_compliance_monitor', f'Updated compliance monitor: {monitor.name}', now,
+                               'Monitoring Agent', monitor.id, 'compliance_monitor')
     
     conn.commit()
     cursor.close()
     conn.close()
+    notify_write('monitor.updated', monitor_event_payload(monitor.id, monitor, now))
+    notify_write('activity.created', activity)
     return True
 
 # Report functions
@@ -222,14 +539,15 @@ def create_report(report: Report) -> int:
     report_id = cursor.lastrowid
     
     # Log the activity
-    cursor.execute(
-        'INSERT INTO activities (activity_type, description, created_at, actor, related_entity_id, related_entity_type) VALUES (?, ?, ?, ?, ?, ?)',
-        ('create_report', f'Created report: {report.title}', now, 'Reporting Agent', report_id, 'report')
-    )
+    activity = insert_activity(cursor, 'create_report', f'Created report: {report.title}', now, 'Reporting Agent', report_id, 'report')
     
     conn.commit()
     cursor.close()
     conn.close()
+    notify_write('report.created', {
+        "id": report_id, "title": report.title, "report_type": report.report_type, "status": report.status, "created_at": now
+    })
+    notify_write('activity.created', activity)
     return report_id
 
 # Activity functions
@@ -248,12 +566,51 @@ def log_activity(activity: Activity) -> int:
     conn = get_db_connection()
     cursor = conn.cursor()
     now = datetime.datetime.now().isoformat()
-    cursor.execute(
-        'INSERT INTO activities (activity_type, description, created_at, actor, related_entity_id, related_entity_type) VALUES (?, ?, ?, ?, ?, ?)',
-        (activity.activity_type, activity.description, now, activity.actor, activity.related_entity_id, activity.related_entity_type)
-    )
-    activity_id = cursor.lastrowid
+    row = insert_activity(cursor, activity.activity_type, activity.description, now, activity.actor,
+                          activity.related_entity_id, activity.related_entity_type)
     conn.commit()
     cursor.close()
     conn.close()
-    return activity_id
\ No newline at end of file
+    notify_write('activity.created', row)
+    return row['id']
+
+# Export functions
+# Exportable tables and their columns, in export order
+EXPORT_COLUMNS = {
+    'reports': ['id', 'title', 'description', 'report_type', 'created_at', 'content', 'insights', 'status'],
+    'risk_assessments': ['id', 'title', 'model_name', 'risk_score', 'findings', 'recommendations', 'created_at', 'status',
+                         'score_source'],
+    'compliance_monitors': ['id', 'name', 'description', 'model_or_system', 'threshold_value', 'current_value',
+                            'status', 'last_checked', 'alert_level'],
+    'activities': ['id', 'activity_type', 'description', 'created_at', 'actor', 'related_entity_id', 'related_entity_type']
+}
+
+def iter_export_rows(table: str, batch_size: int = 500, row_id: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Yield the rows of an exportable table in id order, holding at most one batch in memory.
+    
+    Rows are read in keyset pages (WHERE id > last id), each page its own short
+    statement, so a slow consumer never keeps a read lock open against writers.
+    
+    Args:
+        table: A key of EXPORT_COLUMNS
+        batch_size: Rows read per page
+        row_id: Export only the row with this ID
+    """
+    columns = ', '.join(EXPORT_COLUMNS[table])
+    conn = get_db_connection()
+    try:
+        if row_id is not None:
+            yield from conn.execute(f'SELECT {columns} FROM {table} WHERE id = ?', (row_id,))
+            return
+        last_id = 0
+        while True:
+            rows = conn.execute(
+                f'SELECT {columns} FROM {table} WHERE id > ? ORDER BY id LIMIT ?', (last_id, batch_size)
+            ).fetchall()
+            yield from rows
+            if len(rows) < batch_size:
+                return
+            last_id = rows[-1]['id']
+    finally:
+        conn.close()
@@ -23,6 +23,8 @@ class RiskAssessment:
     recommendations: str = ""
     created_at: datetime = None
     status: str = "Pending"
+    # "engine" when risk_score was computed by the risk scoring engine; only those are re-scored
+    score_source: str = "manual"
 
 @dataclass
 class ComplianceMonitor:
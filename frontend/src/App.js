@@ -14,7 +14,7 @@ import Compliance from './pages/Compliance';
 import Reports from './pages/Reports';
 
 // Service imports
-import { fetchDashboardMetrics } from './services/api';
+import { fetchDashboardMetrics, subscribeDashboardEvents } from './services/api';
 
 const App = () => {
   const [sidebarCollapsed, setSidebarCollapsed] = useState(false);
@@ -53,16 +53,23 @@ const App = () => {
     
     fetchInitialData();
     
-    // Set up polling for real-time updates (every 30 seconds)
-    const interval = setInterval(async () => {
+    const refreshMetrics = async () => {
       try {
         const metricsData = await fetchDashboardMetrics();
         setDashboardMetrics(metricsData);
       } catch (error) {
         console.error('Error fetching dashboard updates:', error);
       }
-    }, 30000);
+    };
+    
+    // Refetch on live updates; every write logs an activity, so any event may change the metrics
+    const unsubscribe = subscribeDashboardEvents(refreshMetrics);
+    if (unsubscribe) {
+      return unsubscribe;
+    }
     
+    // Without EventSource support, poll for updates (every 30 seconds)
+    const interval = setInterval(refreshMetrics, 30000);
     return () => clearInterval(interval);
   }, []);
 
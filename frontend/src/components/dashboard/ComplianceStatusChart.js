@@ -9,7 +9,7 @@ import {
   Title,
   SubTitle
 } from 'chart.js';
-import { fetchComplianceStatusChart, fetchComplianceMonitors } from '../../services/api';
+import { fetchComplianceStatusChart, fetchComplianceMonitors, subscribeDashboardEvents } from '../../services/api';
 import LoadingSpinner from '../common/LoadingSpinner';
 
 // Register required components
@@ -102,9 +102,9 @@ const ComplianceStatusChart = () => {
 
   // Fetch chart data
   useEffect(() => {
-    const getChartData = async () => {
+    const getChartData = async (showSpinner = true) => {
       try {
-        setIsLoading(true);
+        setIsLoading(showSpinner);
         const response = await fetchComplianceStatusChart();
         const data = response.data || response;
         
@@ -156,6 +156,14 @@ const ComplianceStatusChart = () => {
     };
 
     getChartData();
+    
+    // Refetch when a monitor changes, or the stream asks for a full refetch
+    const unsubscribe = subscribeDashboardEvents((type) => {
+      if (type.startsWith('monitor.') || type === 'alert.transition' || type === 'reset') {
+        getChartData(false);
+      }
+    });
+    return unsubscribe || undefined;
   }, [selectedModel]);
 
   // Helper function to count statuses by model
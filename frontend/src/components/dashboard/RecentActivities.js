@@ -1,5 +1,5 @@
 import React, { useEffect, useState } from 'react';
-import { fetchRecentActivities } from '../../services/api';
+import { fetchRecentActivities, subscribeDashboardEvents } from '../../services/api';
 import LoadingSpinner from '../common/LoadingSpinner';
 
 const RecentActivities = () => {
@@ -8,9 +8,9 @@ const RecentActivities = () => {
   const [error, setError] = useState(null);
 
   useEffect(() => {
-    const getActivities = async () => {
+    const getActivities = async (showSpinner = true) => {
       try {
-        setIsLoading(true);
+        setIsLoading(showSpinner);
         const data = await fetchRecentActivities();
         setActivities(data);
         setError(null);
@@ -24,7 +24,17 @@ const RecentActivities = () => {
 
     getActivities();
     
-    // Poll for updates every minute
+    // Refetch when an activity is logged, or the stream asks for a full refetch
+    const unsubscribe = subscribeDashboardEvents((type) => {
+      if (type === 'activity.created' || type === 'reset') {
+        getActivities(false);
+      }
+    });
+    if (unsubscribe) {
+      return unsubscribe;
+    }
+    
+    // Without EventSource support, poll for updates every minute
     const interval = setInterval(getActivities, 60000);
     return () => clearInterval(interval);
   }, []);
@@ -13,7 +13,7 @@ import {
   LineElement,
   Filler
 } from 'chart.js';
-import { fetchRiskDistributionChart, fetchRiskAssessments } from '../../services/api';
+import { fetchRiskDistributionChart, fetchRiskAssessments, subscribeDashboardEvents } from '../../services/api';
 import LoadingSpinner from '../common/LoadingSpinner';
 
 ChartJS.register(
@@ -39,9 +39,9 @@ const RiskDistributionChart = () => {
   const chartRef = useRef(null);
 
   useEffect(() => {
-    const getChartData = async () => {
+    const getChartData = async (showSpinner = true) => {
       try {
-        setIsLoading(true);
+        setIsLoading(showSpinner);
         
         // Fetch risk distribution data
         const data = await fetchRiskDistributionChart();
@@ -175,6 +175,14 @@ const RiskDistributionChart = () => {
     };
 
     getChartData();
+    
+    // Refetch when an assessment is recorded (each logs an activity), or the stream asks for a full refetch
+    const unsubscribe = subscribeDashboardEvents((type, data) => {
+      if ((type === 'activity.created' && data.related_entity_type === 'risk_assessment') || type === 'reset') {
+        getChartData(false);
+      }
+    });
+    return unsubscribe || undefined;
   }, []);
 
   const handleChartClick = (event) => {
@@ -5,10 +5,24 @@ import axios from 'axios';
 axios.defaults.headers.common['Content-Type'] = 'application/json';
 
 // Dashboard endpoints
+// Panels loading together share one /api/dashboard/bootstrap request for all of them
+let dashboardBootstrapRequest = null;
+
+export const fetchDashboardBootstrap = () => {
+  if (!dashboardBootstrapRequest) {
+    dashboardBootstrapRequest = axios.get('/api/dashboard/bootstrap')
+      .then(response => response.data)
+      .finally(() => {
+        dashboardBootstrapRequest = null;
+      });
+  }
+  return dashboardBootstrapRequest;
+};
+
 export const fetchDashboardMetrics = async () => {
   try {
-    const response = await axios.get('/api/dashboard/metrics');
-    return response.data; // Backend returns the data directly
+    const data = await fetchDashboardBootstrap();
+    return data.metrics;
   } catch (error) {
     console.error('Error fetching dashboard metrics:', error);
     return {
@@ -28,8 +42,8 @@ export const fetchDashboardMetrics = async () => {
 
 export const fetchComplianceStatusChart = async () => {
   try {
-    const response = await axios.get('/api/dashboard/compliance-status-chart');
-    return response.data; // Backend returns the data directly
+    const data = await fetchDashboardBootstrap();
+    return data.compliance_status;
   } catch (error) {
     console.error('Error fetching compliance status chart:', error);
     return { labels: [], datasets: [{ data: [], backgroundColor: [] }] };
@@ -38,8 +52,8 @@ export const fetchComplianceStatusChart = async () => {
 
 export const fetchRiskDistributionChart = async () => {
   try {
-    const response = await axios.get('/api/dashboard/risk-distribution-chart');
-    return response.data; // Backend returns the data directly
+    const data = await fetchDashboardBootstrap();
+    return data.risk_distribution;
   } catch (error) {
     console.error('Error fetching risk distribution chart:', error);
     return { labels: [], datasets: [] };
@@ -48,14 +62,58 @@ export const fetchRiskDistributionChart = async () => {
 
 export const fetchRecentActivities = async () => {
   try {
-    const response = await axios.get('/api/dashboard/activities');
-    return response.data; // Backend returns the data directly
+    const data = await fetchDashboardBootstrap();
+    return data.activities;
   } catch (error) {
     console.error('Error fetching recent activities:', error);
     return [];
   }
 };
 
+// Live dashboard updates (server-sent events from /api/dashboard/events)
+// "reset" means events were missed and the whole dashboard should be refetched
+export const DASHBOARD_EVENT_TYPES = [
+  'monitor.created',
+  'monitor.updated',
+  'monitor.deleted',
+  'alert.transition',
+  'activity.created',
+  'reset'
+];
+
+// One EventSource is shared by every subscriber and closed when the last one leaves
+let dashboardEvents = null;
+const dashboardEventListeners = new Set();
+
+export const subscribeDashboardEvents = (onEvent) => {
+  if (typeof EventSource === 'undefined') {
+    return null;
+  }
+  if (!dashboardEvents) {
+    // EventSource reconnects by itself, resuming after the last event id it received
+    dashboardEvents = new EventSource('/api/dashboard/events');
+    DASHBOARD_EVENT_TYPES.forEach(type => {
+      dashboardEvents.addEventListener(type, (message) => {
+        let data = {};
+        try {
+          data = JSON.parse(message.data);
+        } catch (error) {
+          console.error('Error parsing dashboard event:', error);
+        }
+        dashboardEventListeners.forEach(listener => listener(type, data));
+      });
+    });
+  }
+  dashboardEventListeners.add(onEvent);
+  return () => {
+    dashboardEventListeners.delete(onEvent);
+    if (dashboardEventListeners.size === 0 && dashboardEvents) {
+      dashboardEvents.close();
+      dashboardEvents = null;
+    }
+  };
+};
+
 // Governance endpoints
 export const fetchPolicies = async () => {
   try {
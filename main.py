@@ -1,10 +1,13 @@
-from fastapi import FastAPI, HTTPException, Depends, Request
+from fastapi import FastAPI, HTTPException, Depends, Request, Query, Response, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, StreamingResponse
 import os
 import json
-from datetime import datetime
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import date, datetime, timedelta
 from typing import List, Dict, Any, Optional
 import uvicorn
 
@@ -14,24 +17,70 @@ from database.db_utils_sqlite import (
     get_all_risk_assessments, get_risk_assessment, create_risk_assessment,
     get_all_compliance_monitors, get_compliance_monitor,
     create_compliance_monitor, update_compliance_monitor, get_all_reports,
-    get_report, create_report, get_recent_activities, log_activity
+    get_report, create_report, get_recent_activities, log_activity,
+    get_risk_category_distribution, get_top_models_for_category, get_high_risk_assessments,
+    get_model_risk_current, get_model_risk_summary, get_policy_category_counts, get_policy_count,
+    get_near_duplicate_policies, get_dashboard_snapshot, iter_export_rows, EXPORT_COLUMNS
 )
 from database.models import Policy, RiskAssessment, ComplianceMonitor, Report, Activity
+from app.infrastructure.container import container
+from app.api.reporting import router as reporting_router
+from app.api.responses import DEFAULT_COMPRESSION_MIN_SIZE, DEFAULT_GZIP_LEVEL, trusted_response
+from app.api.caching import DASHBOARD_TABLES, conditional_response
+from app.api.dashboard import build_metrics, build_compliance_status_chart, build_risk_distribution_chart
+from utils.constants import RISK_ASSESSMENT_AGENT_CONFIG, GOVERNANCE_AGENT_CONFIG, REPORTING_AGENT_CONFIG
+from utils.policy_index import DEFAULT_SIMILARITY_THRESHOLD
+from utils.export import EXPORT_FORMATS, stream_export
+from app.infrastructure.jobs.queue import FINISHED_STATUSES
+from app.infrastructure.database.executor import run_blocking
+from app.infrastructure.export.columnar import COLUMNAR_FORMATS, COLUMNAR_TABLES, columnar_available
 
 # Pydantic models for request/response validation
 from app.api.models import (
-    PolicyResponse, PolicyRequest, 
+    PolicyResponse, PolicyRequest, PolicyGapAnalysisResponse, NearDuplicatePolicyResponse,
+    PolicyPackRequest, JobStatusResponse, ColumnarExportRequest,
     RiskAssessmentResponse, RiskAssessmentRequest,
+    RiskWeightsRequest, RiskRescoreResponse, HighRiskAssessmentsResponse, ModelRiskResponse,
     ComplianceMonitorResponse, ComplianceMonitorRequest,
-    ReportResponse, ReportRequest,
-    DashboardMetricsResponse, ChartDataResponse, ActivityResponse
+    ReportResponse, ReportRequest, ReportScheduleRequest, ReportScheduleUpdate, ReportScheduleResponse,
+    DailyRollupsResponse,
+    DashboardMetricsResponse, ChartDataResponse, ActivityResponse, DashboardBootstrapResponse
 )
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Prepare the database and run the background services while the app serves requests"""
+    # Initialize the database
+    init_db()
+    
+    # Assessments created before per-category scores were stored get them computed once
+    container.get('risk_assessment_agent').backfill_category_scores()
+    
+    # Publish committed writes on the event bus before anything writes
+    container.get('event_bus')
+    if container.has('event_bridge'):
+        container.get('event_bridge').start()
+    
+    # Start the background job workers (re-queues jobs left pending by a previous run)
+    job_queue = container.get('job_queue')
+    report_scheduler = container.get('report_scheduler')
+    job_queue.start()
+    report_scheduler.start()
+    try:
+        yield
+    finally:
+        report_scheduler.stop()
+        job_queue.stop()
+        await container.get('dashboard_stream').stop()
+        if container.has('event_bridge'):
+            container.get('event_bridge').stop()
+
 # Create the FastAPI application
 app = FastAPI(
     title="AI Governance Dashboard",
     description="API for AI Governance Dashboard",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Configure CORS
@@ -43,8 +92,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize the database
-init_db()
+# Gzip large responses
+app.add_middleware(GZipMiddleware, minimum_size=DEFAULT_COMPRESSION_MIN_SIZE, compresslevel=DEFAULT_GZIP_LEVEL)
+
+# Report generation routes used by the Streamlit reporting page
+app.include_router(reporting_router)
 
 # Do not mount static files at root since we need to handle API routes
 # We'll mount specific folders and use catch-all for SPA routing
@@ -60,162 +112,142 @@ app.mount("/css", StaticFiles(directory="static/css"), name="css")
 
 # Dashboard metrics
 @app.get("/api/dashboard/metrics", response_model=DashboardMetricsResponse)
-async def get_dashboard_metrics():
+async def get_dashboard_metrics(request: Request, response: Response):
     """Get summary metrics for the dashboard"""
     try:
-        # Get all data for calculating metrics
-        policies = get_all_policies()
-        risk_assessments = get_all_risk_assessments()
-        compliance_monitors = get_all_compliance_monitors()
+        not_modified = await conditional_response(request, response, DASHBOARD_TABLES["metrics"])
+        if not_modified:
+            return not_modified
         
-        # Calculate metrics
-        policy_count = len(policies)
-        
-        # Average risk score calculation
-        risk_scores = [ra['risk_score'] for ra in risk_assessments if ra['risk_score'] is not None]
-        avg_risk_score = sum(risk_scores) / len(risk_scores) if risk_scores else 0
-        
-        # Compliance rate calculation
-        compliant_monitors = [m for m in compliance_monitors 
-                             if m['alert_level'] == 'Normal' and m['status'] == 'Active']
-        active_monitors = [m for m in compliance_monitors if m['status'] == 'Active']
-        compliance_rate = len(compliant_monitors) / len(active_monitors) if active_monitors else 1
-        
-        # Calculate changes over time (dummy values for now)
-        delta_policy = 2  # Increase of 2 policies
-        delta_risk = -0.05  # Decrease in risk score (good)
-        delta_compliance = 0.03  # Increase in compliance rate (good)
-        delta_monitors = 1  # Added 1 new monitor
+        # Get all data for calculating metrics
+        policy_count = await run_blocking(get_policy_count)
+        risk_summary = await run_blocking(get_model_risk_summary)
+        compliance_monitors = await run_blocking(get_all_compliance_monitors)
         
-        return {
-            "policy_count": policy_count,
-            "avg_risk_score": round(avg_risk_score, 2),
-            "compliance_rate": round(compliance_rate, 2),
-            "active_monitors": len(active_monitors),
-            "deltas": {
-                "policy_count": delta_policy,
-                "avg_risk_score": delta_risk,
-                "compliance_rate": delta_compliance,
-                "active_monitors": delta_monitors
-            }
-        }
+        return build_metrics(policy_count, risk_summary, compliance_monitors)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 # Compliance Status Chart data
 @app.get("/api/dashboard/compliance-status-chart", response_model=ChartDataResponse)
-async def get_compliance_status_chart():
+async def get_compliance_status_chart(request: Request, response: Response):
     """Get data for the compliance status chart"""
     try:
-        monitors = get_all_compliance_monitors()
+        not_modified = await conditional_response(request, response, DASHBOARD_TABLES["compliance_status"])
+        if not_modified:
+            return not_modified
         
-        # Group monitors by alert level
-        alert_levels = {}
-        for monitor in monitors:
-            level = monitor['alert_level']
-            if level not in alert_levels:
-                alert_levels[level] = 0
-            alert_levels[level] += 1
-        
-        # Prepare data for chart
-        labels = list(alert_levels.keys())
-        data = list(alert_levels.values())
-        
-        # Colors for each status
-        colors = {
-            'Normal': '#4caf50',
-            'Warning': '#ff9800',
-            'Critical': '#f44336'
-        }
-        
-        background_colors = [colors.get(label, '#999') for label in labels]
-        
-        return {
-            "labels": labels,
-            "datasets": [{
-                "data": data,
-                "backgroundColor": background_colors
-            }]
-        }
+        monitors = await run_blocking(get_all_compliance_monitors)
+        return build_compliance_status_chart(monitors)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 # Alias for backward compatibility with legacy frontend code
 @app.get("/api/charts/compliance-status", response_model=ChartDataResponse)
-async def get_compliance_status_chart_legacy():
+async def get_compliance_status_chart_legacy(request: Request, response: Response):
     """Legacy endpoint for compliance status chart"""
-    return await get_compliance_status_chart()
+    return await get_compliance_status_chart(request, response)
 
 # Risk Distribution Chart data
 @app.get("/api/dashboard/risk-distribution-chart", response_model=ChartDataResponse)
-async def get_risk_distribution_chart():
-    """Get data for the risk distribution chart"""
+async def get_risk_distribution_chart(request: Request, response: Response,
+                                      models: Optional[List[str]] = Query(None), limit: int = Query(5, ge=1, le=100)):
+    """Get per-category risk scores for the selected (default: highest-risk) models"""
     try:
-        assessments = get_all_risk_assessments()
-        
-        # Define risk categories
-        risk_categories = [
-            'Security', 'Privacy', 'Fairness', 'Transparency',
-            'Safety', 'Accountability'
-        ]
-        
-        # Simulate risk values for each category
-        # (in a real app, these would come from detailed assessments)
-        data = []
-        for i, assessment in enumerate(assessments[:5]):  # Take up to 5 assessments
-            # Generate pseudo-random values based on the assessment risk score
-            risk_score = assessment['risk_score']
-            assessment_data = [
-                min(1.0, max(0.1, risk_score * (1 + (((i + category_idx) % 3) - 1) * 0.2)))
-                for category_idx, _ in enumerate(risk_categories)
-            ]
-            data.append({
-                "label": assessment['model_name'] or f"Assessment {assessment['id']}",
-                "data": assessment_data,
-                "backgroundColor": f"rgba(54, 162, 235, {0.2 + i * 0.15})",
-                "borderColor": f"rgb(54, 162, 235)",
-                "pointBackgroundColor": f"rgb(54, 162, 235)",
-                "pointBorderColor": "#fff",
-                "pointHoverBackgroundColor": "#fff",
-                "pointHoverBorderColor": f"rgb(54, 162, 235)"
-            })
+        not_modified = await conditional_response(request, response, DASHBOARD_TABLES["risk_distribution"])
+        if not_modified:
+            return not_modified
         
-        return {
-            "labels": risk_categories,
-            "datasets": data
-        }
+        distribution = await run_blocking(get_risk_category_distribution, models, limit)
+        return build_risk_distribution_chart(distribution)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 # Alias for backward compatibility with legacy frontend code
 @app.get("/api/charts/risk-distribution", response_model=ChartDataResponse)
-async def get_risk_distribution_chart_legacy():
+async def get_risk_distribution_chart_legacy(request: Request, response: Response):
     """Legacy endpoint for risk distribution chart"""
-    return await get_risk_distribution_chart()
+    return await get_risk_distribution_chart(request, response, None, 5)
 
 # Recent Activities
 @app.get("/api/dashboard/activities", response_model=List[ActivityResponse])
-async def get_activities():
+async def get_activities(request: Request, response: Response):
     """Get recent activities"""
     try:
-        activities = get_recent_activities(limit=10)
-        return activities
+        not_modified = await conditional_response(request, response, DASHBOARD_TABLES["activities"])
+        if not_modified:
+            return not_modified
+        
+        activities = await run_blocking(get_recent_activities, limit=10)
+        return trusted_response(activities, ActivityResponse, headers=response.headers)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 # Alias for backward compatibility with legacy frontend code
 @app.get("/api/activities/recent", response_model=List[ActivityResponse])
-async def get_activities_legacy():
+async def get_activities_legacy(request: Request, response: Response):
     """Legacy endpoint for recent activities"""
-    return await get_activities()
+    return await get_activities(request, response)
+
+# Every dashboard panel in one response
+@app.get("/api/dashboard/bootstrap", response_model=DashboardBootstrapResponse)
+async def get_dashboard_bootstrap(request: Request, response: Response,
+                                  models: Optional[List[str]] = Query(None), limit: int = Query(5, ge=1, le=100)):
+    """Get the metrics, charts and recent activities for a dashboard page load, read from one snapshot"""
+    try:
+        not_modified = await conditional_response(request, response, DASHBOARD_TABLES["bootstrap"])
+        if not_modified:
+            return not_modified
+        
+        snapshot = await run_blocking(get_dashboard_snapshot, models, limit)
+        return {
+            "metrics": build_metrics(snapshot['policy_count'], snapshot['risk_summary'], snapshot['monitors']),
+            "compliance_status": build_compliance_status_chart(snapshot['monitors']),
+            "risk_distribution": build_risk_distribution_chart(snapshot['risk_distribution']),
+            "activities": snapshot['activities']
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Live dashboard updates: monitor changes, alert transitions and new activities
+@app.get("/api/dashboard/events")
+async def api_stream_dashboard(request: Request, last_event_id: Optional[str] = Query(None)):
+    """Stream live dashboard updates as server-sent events, resuming after Last-Event-ID"""
+    # EventSource sends the Last-Event-ID header on reconnect; the query parameter serves other clients
+    resume_after = request.headers.get("last-event-id") or last_event_id
+    return StreamingResponse(
+        container.get('dashboard_stream').sse(resume_after), media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+@app.websocket("/api/dashboard/ws")
+async def api_dashboard_socket(websocket: WebSocket, last_event_id: Optional[str] = None):
+    """Send live dashboard updates as JSON messages over a WebSocket"""
+    await websocket.accept()
+    stream = container.get('dashboard_stream')
+    client = await stream.subscribe(last_event_id)
+    
+    async def forward():
+        while True:
+            event = await client.get()
+            await websocket.send_json(event.to_message())
+    
+    # Forward events while watching for the client to disconnect, which a blocked send would not notice
+    sender = asyncio.create_task(forward())
+    try:
+        while (await websocket.receive())["type"] != "websocket.disconnect":
+            pass
+    finally:
+        sender.cancel()
+        stream.unsubscribe(client)
 
 # Policies endpoints
 @app.get("/api/policies", response_model=List[PolicyResponse])
 async def api_get_policies():
     """Get all governance policies"""
     try:
-        policies = get_all_policies()
-        return policies
+        policies = await run_blocking(get_all_policies)
+        return trusted_response(policies, PolicyResponse)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -223,7 +255,7 @@ async def api_get_policies():
 async def api_get_policy(policy_id: int):
     """Get a specific policy by ID"""
     try:
-        policy = get_policy(policy_id)
+        policy = await run_blocking(get_policy, policy_id)
         if not policy:
             raise HTTPException(status_code=404, detail=f"Policy with ID {policy_id} not found")
         return policy
@@ -232,6 +264,22 @@ async def api_get_policy(policy_id: int):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/policies/{policy_id}/near-duplicates", response_model=List[NearDuplicatePolicyResponse])
+async def api_get_near_duplicate_policies(
+    policy_id: int,
+    threshold: float = Query(DEFAULT_SIMILARITY_THRESHOLD, ge=0.0, le=1.0),
+    limit: int = Query(20, ge=1, le=200)
+):
+    """Get policies whose content is a near-duplicate of a policy, from the MinHash/LSH index"""
+    try:
+        if not await run_blocking(get_policy, policy_id):
+            raise HTTPException(status_code=404, detail=f"Policy with ID {policy_id} not found")
+        return await run_blocking(get_near_duplicate_policies, policy_id, threshold, limit)
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 @app.post("/api/policies", response_model=Dict[str, Any])
 async def api_create_policy(policy_request: PolicyRequest):
     """Create a new policy"""
@@ -247,7 +295,7 @@ async def api_create_policy(policy_request: PolicyRequest):
             updated_at=datetime.now()
         )
         
-        policy_id = create_policy(policy)
+        policy_id = await run_blocking(create_policy, policy)
         
         # Log the activity
         activity = Activity(
@@ -258,7 +306,7 @@ async def api_create_policy(policy_request: PolicyRequest):
             related_entity_id=policy_id,
             related_entity_type="policy"
         )
-        log_activity(activity)
+        await run_blocking(log_activity, activity)
         
         return {"success": True, "policy_id": policy_id}
     except Exception as e:
@@ -268,7 +316,7 @@ async def api_create_policy(policy_request: PolicyRequest):
 async def api_update_policy(policy_id: int, policy_request: PolicyRequest):
     """Update an existing policy"""
     try:
-        existing_policy = get_policy(policy_id)
+        existing_policy = await run_blocking(get_policy, policy_id)
         if not existing_policy:
             raise HTTPException(status_code=404, detail=f"Policy with ID {policy_id} not found")
         
@@ -284,7 +332,7 @@ async def api_update_policy(policy_id: int, policy_request: PolicyRequest):
             updated_at=datetime.now()
         )
         
-        success = update_policy(updated_policy)
+        success = await run_blocking(update_policy, updated_policy)
         
         # Log the activity
         activity = Activity(
@@ -295,7 +343,7 @@ async def api_update_policy(policy_id: int, policy_request: PolicyRequest):
             related_entity_id=policy_id,
             related_entity_type="policy"
         )
-        log_activity(activity)
+        await run_blocking(log_activity, activity)
         
         return {"success": success}
     except HTTPException:
@@ -303,13 +351,66 @@ async def api_update_policy(policy_id: int, policy_request: PolicyRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Governance gap analysis
+@app.get("/api/governance/gaps", response_model=PolicyGapAnalysisResponse)
+async def api_get_policy_gaps():
+    """Get policy categories without an active policy, from the maintained category counters"""
+    try:
+        recommendations = await run_blocking(container.get('governance_agent').generate_policy_recommendations)
+        return {
+            "gaps": [rec["category"] for rec in recommendations],
+            "category_counts": await run_blocking(get_policy_category_counts),
+            "recommendations": recommendations
+        }
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Alias used by the Streamlit governance page
+@app.get("/governance/recommendations", response_model=PolicyGapAnalysisResponse)
+async def api_get_policy_recommendations_legacy():
+    """Legacy endpoint for policy recommendations"""
+    return await api_get_policy_gaps()
+
+@app.post("/api/governance/policy-packs", response_model=JobStatusResponse)
+async def api_create_policy_pack(pack_request: PolicyPackRequest, response: Response):
+    """
+    Generate a policy pack (categories x AI systems) saved in one transaction.
+    
+    Small packs are generated within the request; larger ones are queued as a background
+    job and return 202 with a job id whose progress can be polled at /api/jobs/{job_id}.
+    """
+    governance_agent = container.get('governance_agent')
+    categories = pack_request.categories or governance_agent.policy_categories
+    unknown = [c for c in categories if c not in governance_agent.policy_categories]
+    if not pack_request.system_names:
+        raise HTTPException(status_code=400, detail="At least one system name is required")
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown policy categories: {unknown}")
+    
+    total = len(categories) * len(pack_request.system_names)
+    run_inline = total <= GOVERNANCE_AGENT_CONFIG["policy_pack_inline_limit"]
+    job = await run_blocking(
+        container.get('job_queue').submit, "policy_pack", {"system_names": pack_request.system_names, "categories": categories},
+        total=total, run_inline=run_inline
+    )
+    if job["status"] == "failed":
+        raise HTTPException(status_code=500, detail=job["error"])
+    if not run_inline:
+        response.status_code = 202
+    return job
+
+@app.get("/api/governance/policy-packs/{job_id}", response_model=JobStatusResponse)
+async def api_get_policy_pack_job(job_id: str):
+    """Get the status and progress of a policy pack job"""
+    return await api_get_job(job_id)
+
 # Risk Assessments endpoints
 @app.get("/api/risk-assessments", response_model=List[RiskAssessmentResponse])
 async def api_get_risk_assessments():
     """Get all risk assessments"""
     try:
-        assessments = get_all_risk_assessments()
-        return assessments
+        assessments = await run_blocking(get_all_risk_assessments)
+        return trusted_response(assessments, RiskAssessmentResponse)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -317,7 +418,7 @@ async def api_get_risk_assessments():
 async def api_get_risk_assessment(assessment_id: int):
     """Get a specific risk assessment by ID"""
     try:
-        assessment = get_risk_assessment(assessment_id)
+        assessment = await run_blocking(get_risk_assessment, assessment_id)
         if not assessment:
             raise HTTPException(status_code=404, detail=f"Risk assessment with ID {assessment_id} not found")
         return assessment
@@ -330,18 +431,27 @@ async def api_get_risk_assessment(assessment_id: int):
 async def api_create_risk_assessment(assessment_request: RiskAssessmentRequest):
     """Create a new risk assessment"""
     try:
+        agent = container.get('risk_assessment_agent')
+        category_scores = await run_blocking(agent.category_scores, assessment_request.findings)
+        risk_score = assessment_request.risk_score
+        score_source = "manual"
+        if risk_score is None:
+            risk_score = await run_blocking(agent.score_from_categories, category_scores)
+            score_source = "engine"
+        
         # Convert from Pydantic model to our domain model
         assessment = RiskAssessment(
             title=assessment_request.title,
             model_name=assessment_request.model_name,
-            risk_score=assessment_request.risk_score,
+            risk_score=risk_score,
             findings=assessment_request.findings,
             recommendations=assessment_request.recommendations,
             status=assessment_request.status,
-            created_at=datetime.now()
+            created_at=datetime.now(),
+            score_source=score_source
         )
         
-        assessment_id = create_risk_assessment(assessment)
+        assessment_id = await run_blocking(create_risk_assessment, assessment, category_scores)
         
         # Log the activity
         activity = Activity(
@@ -352,19 +462,74 @@ async def api_create_risk_assessment(assessment_request: RiskAssessmentRequest):
             related_entity_id=assessment_id,
             related_entity_type="risk_assessment"
         )
-        log_activity(activity)
+        await run_blocking(log_activity, activity)
         
         return {"success": True, "assessment_id": assessment_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.post("/api/risk-assessments/rescore", response_model=RiskRescoreResponse)
+async def api_rescore_risk_assessments(weights_request: RiskWeightsRequest):
+    """Re-score the engine-scored risk assessments, optionally with new category weights, which are saved"""
+    try:
+        agent = container.get('risk_assessment_agent')
+        return await run_blocking(agent.rescore_all, weights_request.weights)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/risk-assessments/rescore-jobs", response_model=JobStatusResponse, status_code=202)
+async def api_submit_rescore_job(weights_request: RiskWeightsRequest):
+    """Queue a re-score of the engine-scored risk assessments as a background job"""
+    categories = container.get('risk_assessment_agent').risk_categories
+    unknown = [c for c in (weights_request.weights or {}) if c not in categories]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown risk categories: {unknown}")
+    return await run_blocking(container.get('job_queue').submit, "risk_rescore", {"weights": weights_request.weights}, total=1)
+
+# Declared with its own prefix so it cannot be shadowed by /api/risk-assessments/{assessment_id}
+@app.get("/api/risk/high-risk", response_model=HighRiskAssessmentsResponse)
+async def api_get_high_risk_assessments(threshold: float = Query(75.0, ge=0, le=100),
+                                        limit: int = Query(50, ge=1, le=500),
+                                        offset: int = Query(0, ge=0)):
+    """Get the latest assessment of each model at or above a risk threshold, highest risk first"""
+    try:
+        return await run_blocking(get_high_risk_assessments, threshold, limit, offset)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/risk/models", response_model=List[ModelRiskResponse])
+async def api_get_model_risk_current(limit: int = Query(100, ge=1, le=1000), offset: int = Query(0, ge=0)):
+    """Get each model's latest risk score and its change since the previous assessment"""
+    try:
+        return await run_blocking(get_model_risk_current, limit, offset)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Alias used by the Streamlit risk assessment page
+@app.get("/risk/high-risk", response_model=HighRiskAssessmentsResponse)
+async def api_get_high_risk_assessments_legacy(threshold: float = Query(75.0, ge=0, le=100),
+                                               limit: int = Query(50, ge=1, le=500),
+                                               offset: int = Query(0, ge=0)):
+    """Legacy endpoint for high-risk models"""
+    return await api_get_high_risk_assessments(threshold, limit, offset)
+
+@app.get("/api/risk-categories/{category}/top-models", response_model=List[Dict[str, Any]])
+async def api_get_top_models_for_category(category: str, limit: int = Query(10, ge=1, le=1000)):
+    """Get the assessments with the highest score in one risk category"""
+    try:
+        return await run_blocking(get_top_models_for_category, category, limit)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
 # Compliance Monitors endpoints
 @app.get("/api/compliance-monitors", response_model=List[ComplianceMonitorResponse])
 async def api_get_compliance_monitors():
     """Get all compliance monitors"""
     try:
-        monitors = get_all_compliance_monitors()
-        return monitors
+        monitors = await run_blocking(get_all_compliance_monitors)
+        return trusted_response(monitors, ComplianceMonitorResponse)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -372,7 +537,7 @@ async def api_get_compliance_monitors():
 async def api_get_compliance_monitor(monitor_id: int):
     """Get a specific compliance monitor by ID"""
     try:
-        monitor = get_compliance_monitor(monitor_id)
+        monitor = await run_blocking(get_compliance_monitor, monitor_id)
         if not monitor:
             raise HTTPException(status_code=404, detail=f"Compliance monitor with ID {monitor_id} not found")
         return monitor
@@ -397,7 +562,7 @@ async def api_create_compliance_monitor(monitor_request: ComplianceMonitorReques
             alert_level=monitor_request.alert_level
         )
         
-        monitor_id = create_compliance_monitor(monitor)
+        monitor_id = await run_blocking(create_compliance_monitor, monitor)
         
         # Log the activity
         activity = Activity(
@@ -408,7 +573,7 @@ async def api_create_compliance_monitor(monitor_request: ComplianceMonitorReques
             related_entity_id=monitor_id,
             related_entity_type="compliance_monitor"
         )
-        log_activity(activity)
+        await run_blocking(log_activity, activity)
         
         return {"success": True, "monitor_id": monitor_id}
     except Exception as e:
@@ -418,7 +583,7 @@ async def api_create_compliance_monitor(monitor_request: ComplianceMonitorReques
 async def api_update_compliance_monitor(monitor_id: int, monitor_request: ComplianceMonitorRequest):
     """Update an existing compliance monitor"""
     try:
-        existing_monitor = get_compliance_monitor(monitor_id)
+        existing_monitor = await run_blocking(get_compliance_monitor, monitor_id)
         if not existing_monitor:
             raise HTTPException(status_code=404, detail=f"Compliance monitor with ID {monitor_id} not found")
         
@@ -435,7 +600,7 @@ async def api_update_compliance_monitor(monitor_id: int, monitor_request: Compli
             alert_level=monitor_request.alert_level
         )
         
-        success = update_compliance_monitor(updated_monitor)
+        success = await run_blocking(update_compliance_monitor, updated_monitor)
         
         # Log the activity
         activity = Activity(
@@ -446,7 +611,7 @@ async def api_update_compliance_monitor(monitor_id: int, monitor_request: Compli
             related_entity_id=monitor_id,
             related_entity_type="compliance_monitor"
         )
-        log_activity(activity)
+        await run_blocking(log_activity, activity)
         
         return {"success": success}
     except HTTPException:
@@ -459,8 +624,8 @@ async def api_update_compliance_monitor(monitor_id: int, monitor_request: Compli
 async def api_get_reports():
     """Get all reports"""
     try:
-        reports = get_all_reports()
-        return reports
+        reports = await run_blocking(get_all_reports)
+        return trusted_response(reports, ReportResponse)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -468,7 +633,7 @@ async def api_get_reports():
 async def api_get_report(report_id: int):
     """Get a specific report by ID"""
     try:
-        report = get_report(report_id)
+        report = await run_blocking(get_report, report_id)
         if not report:
             raise HTTPException(status_code=404, detail=f"Report with ID {report_id} not found")
         return report
@@ -477,6 +642,15 @@ async def api_get_report(report_id: int):
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/reports/{report_id}/export")
+async def api_export_report(report_id: int, export_format: str = Query("markdown", alias="format")):
+    """Download a single report as Markdown, CSV or NDJSON"""
+    if export_format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported export format: {export_format}")
+    if not await run_blocking(get_report, report_id):
+        raise HTTPException(status_code=404, detail=f"Report with ID {report_id} not found")
+    return export_response("reports", export_format, row_id=report_id, filename=f"report-{report_id}")
+
 @app.post("/api/reports", response_model=Dict[str, Any])
 async def api_create_report(report_request: ReportRequest):
     """Create a new report"""
@@ -492,7 +666,7 @@ async def api_create_report(report_request: ReportRequest):
             created_at=datetime.now()
         )
         
-        report_id = create_report(report)
+        report_id = await run_blocking(create_report, report)
         
         # Log the activity
         activity = Activity(
@@ -503,12 +677,167 @@ async def api_create_report(report_request: ReportRequest):
             related_entity_id=report_id,
             related_entity_type="report"
         )
-        log_activity(activity)
+        await run_blocking(log_activity, activity)
         
         return {"success": True, "report_id": report_id}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
+# Report schedules and rollups
+@app.get("/api/report-schedules", response_model=List[ReportScheduleResponse])
+async def api_get_report_schedules():
+    """Get all report schedules"""
+    try:
+        return await run_blocking(container.get('report_scheduler').list)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.post("/api/report-schedules", response_model=ReportScheduleResponse)
+async def api_create_report_schedule(schedule_request: ReportScheduleRequest):
+    """Create a daily or weekly report schedule"""
+    try:
+        report_type = container.get('reporting_agent').resolve_report_type(schedule_request.report_type)
+        return await run_blocking(
+            container.get('report_scheduler').create, schedule_request.name, report_type, schedule_request.frequency,
+            schedule_request.period_days, schedule_request.run_time, schedule_request.enabled
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.put("/api/report-schedules/{schedule_id}", response_model=ReportScheduleResponse)
+async def api_update_report_schedule(schedule_id: int, schedule_update: ReportScheduleUpdate):
+    """Pause or resume a report schedule"""
+    schedule = await run_blocking(container.get('report_scheduler').set_enabled, schedule_id, schedule_update.enabled)
+    if not schedule:
+        raise HTTPException(status_code=404, detail=f"Report schedule with ID {schedule_id} not found")
+    return schedule
+
+@app.delete("/api/report-schedules/{schedule_id}", response_model=Dict[str, Any])
+async def api_delete_report_schedule(schedule_id: int):
+    """Delete a report schedule"""
+    if not await run_blocking(container.get('report_scheduler').delete, schedule_id):
+        raise HTTPException(status_code=404, detail=f"Report schedule with ID {schedule_id} not found")
+    return {"success": True}
+
+@app.post("/api/report-schedules/{schedule_id}/run", response_model=JobStatusResponse, status_code=202)
+async def api_run_report_schedule(schedule_id: int):
+    """Queue a run of a report schedule now, covering the period up to today"""
+    job = await run_blocking(container.get('report_scheduler').run_now, schedule_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Report schedule with ID {schedule_id} not found")
+    return job
+
+@app.get("/api/rollups/daily", response_model=DailyRollupsResponse)
+async def api_get_daily_rollups(start_day: Optional[date] = None, end_day: Optional[date] = None):
+    """Get the daily compliance and risk rollups of a date range (default: the configured report period up to today)"""
+    end_day = end_day or date.today()
+    start_day = start_day or end_day - timedelta(days=REPORTING_AGENT_CONFIG["default_period_days"] - 1)
+    if start_day > end_day:
+        raise HTTPException(status_code=400, detail="start_day must not be after end_day")
+    try:
+        return await run_blocking(
+            container.get('reporting_agent').report_repository.get_daily_rollups, start_day.isoformat(), end_day.isoformat()
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+# Export endpoints
+def export_response(table: str, export_format: str, row_id: Optional[int] = None,
+                    filename: Optional[str] = None) -> StreamingResponse:
+    """Stream rows of a table as a file download without loading the table into memory."""
+    media_type, extension = EXPORT_FORMATS[export_format]
+    filename = filename or f"{table}-{datetime.now().strftime('%Y%m%d')}"
+    # A sync generator: Starlette iterates it in the threadpool, one batch of rows at a time
+    chunks = stream_export(table, EXPORT_COLUMNS[table], iter_export_rows(table, row_id=row_id), export_format)
+    return StreamingResponse(
+        chunks,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{extension}"'}
+    )
+
+@app.post("/api/exports/columnar", response_model=JobStatusResponse, status_code=202)
+async def api_queue_columnar_export(export_request: ColumnarExportRequest):
+    """Queue an incremental Parquet / Arrow export of the governance tables"""
+    if not columnar_available():
+        raise HTTPException(status_code=503, detail="Columnar export requires pyarrow, which is not installed")
+    unknown = [table for table in export_request.tables or [] if table not in COLUMNAR_TABLES]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown tables: {', '.join(unknown)}")
+    if export_request.file_format is not None and export_request.file_format not in COLUMNAR_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported columnar format: {export_request.file_format}")
+    try:
+        tables = export_request.tables or list(COLUMNAR_TABLES)
+        return await run_blocking(
+            container.get('job_queue').submit, "columnar_export", export_request.model_dump(), total=len(tables)
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/exports/columnar", response_model=Dict[str, Any])
+async def api_get_columnar_exports():
+    """Get the export directory and each exported table's format, watermark and row count"""
+    exporter = container.get('columnar_exporter')
+    return {"export_dir": exporter.export_dir, "tables": await run_blocking(exporter.watermarks)}
+
+@app.get("/api/exports/{table}")
+async def api_export_table(table: str, export_format: str = Query("csv", alias="format")):
+    """Download every row of reports, risk_assessments, compliance_monitors or activities as CSV, NDJSON or Markdown"""
+    if table not in EXPORT_COLUMNS:
+        raise HTTPException(status_code=404, detail=f"Unknown export table: {table}")
+    if export_format not in EXPORT_FORMATS:
+        raise HTTPException(status_code=400, detail=f"Unsupported export format: {export_format}")
+    return export_response(table, export_format)
+
+# Background jobs
+@app.get("/api/jobs", response_model=List[JobStatusResponse])
+async def api_get_jobs(kind: Optional[str] = None, status: Optional[str] = None, limit: int = Query(50, ge=1, le=500)):
+    """List retained background jobs, newest first"""
+    try:
+        return await run_blocking(container.get('job_queue').list, kind, status, limit)
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+@app.get("/api/jobs/{job_id}", response_model=JobStatusResponse)
+async def api_get_job(job_id: str):
+    """Get the status and progress of a background job"""
+    job = await run_blocking(container.get('job_queue').get, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job with ID {job_id} not found")
+    return job
+
+@app.post("/api/jobs/{job_id}/cancel", response_model=JobStatusResponse)
+async def api_cancel_job(job_id: str):
+    """Cancel a pending or running background job"""
+    job = await run_blocking(container.get('job_queue').cancel, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job with ID {job_id} not found")
+    return job
+
+@app.get("/api/jobs/{job_id}/events")
+async def api_stream_job(job_id: str, interval: float = Query(0.5, ge=0.1, le=10.0)):
+    """Stream a job's status as server-sent events until it finishes"""
+    job_queue = container.get('job_queue')
+    if not await run_blocking(job_queue.get, job_id):
+        raise HTTPException(status_code=404, detail=f"Job with ID {job_id} not found")
+    
+    async def events():
+        last = None
+        while True:
+            job = await run_blocking(job_queue.get, job_id)
+            if job is None:
+                return
+            state = (job["status"], job["completed"], job["total"])
+            if state != last:
+                last = state
+                yield f"event: progress\ndata: {json.dumps(job)}\n\n"
+            if job["status"] in FINISHED_STATUSES:
+                return
+            await asyncio.sleep(interval)
+    
+    return StreamingResponse(events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
 # Run the application
 # Catch-all route to serve index.html for all non-API routes (SPA client-side routing)
 # This MUST be the last route to ensure API routes are checked first
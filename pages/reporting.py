@@ -131,6 +131,11 @@ def load_reports():
         st.error(f"Error connecting to API: {str(e)}")
         return []
 
+def export_report(report_id) -> bytes:
+    response = requests.get(f"{API_URL}/api/reports/{report_id}/export", params={"format": "markdown"})
+    response.raise_for_status()
+    return response.content
+
 reports = load_reports()
 for report in reports:
     with st.container():
@@ -150,7 +155,14 @@ for report in reports:
 
         col1, col2, col3 = st.columns([1,1,1])
         with col1:
-            st.button("📥 Download", key=f"download_{report.get('id')}")
+            # Exported only when clicked, so listing reports fetches no report content
+            st.download_button(
+                "📥 Download",
+                data=lambda report_id=report.get('id'): export_report(report_id),
+                file_name=f"report-{report.get('id')}.md",
+                mime="text/markdown",
+                key=f"download_{report.get('id')}"
+            )
         with col2:
             st.button("👁️ View", key=f"view_{report.get('id')}")
         with col3:
@@ -83,7 +83,7 @@ with tab1:
                     "ID": a.get("id"),
                     "Title": a.get("title"),
                     "Model": a.get("model_name"),
-                    "Risk Score": f"{a.get('risk_score', 0):.1f}",
+                    "Risk Score": round(a.get("risk_score", 0), 1),
                     "Status": a.get("status"),
                     "Date": a.get("created_at").split("T")[0] if a.get("created_at") else "Unknown",
                 }
@@ -267,30 +267,39 @@ with tab4:
     st.markdown("View and manage high-risk AI models requiring immediate attention")
     
     # Set threshold for high-risk classification
-    threshold = st.slider("High-Risk Threshold", 50, 95, 75)
+    col1, col2 = st.columns(2)
+    with col1:
+        threshold = st.slider("High-Risk Threshold", 50, 95, 75)
+    with col2:
+        page_size = st.selectbox("Models per page", options=[25, 50, 100], index=1)
+    page = st.number_input("Page", min_value=1, value=1, step=1)
     
     if st.button("Load High-Risk Models"):
         with st.spinner("Loading high-risk models..."):
             try:
-                response = requests.get(f"{RISK_API}/high-risk", params={"threshold": threshold})
+                response = requests.get(
+                    f"{RISK_API}/high-risk",
+                    params={"threshold": threshold, "limit": page_size, "offset": (page - 1) * page_size}
+                )
                 
                 if response.status_code == 200:
-                    high_risk_models = response.json()["items"]
+                    result = response.json()
+                    high_risk_models = result["items"]
                     
                     if high_risk_models:
-                        st.warning(f"Found {len(high_risk_models)} high-risk models with risk score >= {threshold}")
+                        st.warning(f"Found {result['total']} high-risk models with risk score >= {threshold} (showing {len(high_risk_models)})")
                         
                         # Create a dataframe for display
                         high_risk_df = pd.DataFrame([
                             {
                                 "ID": a.get("id"),
                                 "Model": a.get("model_name"),
-                                "Risk Score": f"{a.get('risk_score', 0):.1f}",
+                                "Risk Score": round(a.get("risk_score", 0), 1),
                                 "Title": a.get("title"),
                                 "Date": a.get("created_at").split("T")[0] if a.get("created_at") else "Unknown",
                             }
                             for a in high_risk_models
-                        ]).sort_values(by="Risk Score", ascending=False)
+                        ])  # Already sorted by risk score on the server
                         
                         st.dataframe(high_risk_df, use_container_width=True, hide_index=True)
                         
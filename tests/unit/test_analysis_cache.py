@@ -0,0 +1,105 @@
+import sqlite3
+
+from app.infrastructure.ai import analysis_engine
+from app.infrastructure.ai.analysis_engine import AnalysisEngine
+from utils import analysis_cache
+from utils.analysis_cache import AnalysisCache
+
+
+def count_commits(cache):
+    commits = []
+    cache._conn.set_trace_callback(lambda statement: commits.append(statement) if statement.startswith('COMMIT') else None)
+    return commits
+
+
+def test_disk_hit_after_memory_eviction(tmp_path):
+    cache = AnalysisCache(str(tmp_path / "cache.db"), max_memory_entries=1)
+    cache.set("a", ["x"], "kind")
+    cache.set("b", ["y"], "kind")
+
+    assert cache.get("a") == ["x"]
+    assert cache.stats()["disk_hits"] == 1
+    assert cache.get("a") == ["x"]
+    assert cache.stats()["memory_hits"] == 1
+
+
+def test_results_do_not_alias_the_memory_tier():
+    cache = AnalysisCache(None)
+    value = ["first"]
+    cache.set("key", value)
+    value.append("changed by caller")
+    cache.get("key").append("changed by caller")
+
+    assert cache.get("key") == ["first"]
+
+
+def test_batch_writes_commits_once(tmp_path):
+    cache = AnalysisCache(str(tmp_path / "cache.db"))
+    commits = count_commits(cache)
+
+    with cache.batch_writes():
+        for i in range(50):
+            cache.set(f"key-{i}", i, "kind")
+        assert commits == []
+
+    assert len(commits) == 1
+    conn = sqlite3.connect(str(tmp_path / "cache.db"))
+    assert conn.execute("SELECT COUNT(*) FROM analysis_cache").fetchone()[0] == 50
+    conn.close()
+
+
+def test_map_batch_in_process_commits_once(tmp_path):
+    cache = AnalysisCache(str(tmp_path / "cache.db"))
+    engine = AnalysisEngine(cache=cache)
+    commits = count_commits(cache)
+
+    results = engine.map_batch("analyze_sentiment", [f"secure and compliant system {i}" for i in range(20)])
+
+    assert len(results) == 20
+    assert len(commits) == 1
+
+
+def test_worker_entries_and_counters_reach_the_parent(tmp_path, monkeypatch):
+    # Run the worker function in-process as a pool would, then let map_batch store its output
+    texts = [f"privacy risk document {i}" for i in range(10)]
+    worker_cache = AnalysisCache(None)
+    monkeypatch.setattr(analysis_engine, "_worker_engine", AnalysisEngine(cache=worker_cache))
+    worker_engine = analysis_engine._worker_engine
+    worker_engine.classify_text(texts[0], ["privacy", "security"])
+
+    results, entries, counters = analysis_engine._run_batch_chunk("classify_text", texts, (["privacy", "security"],))
+
+    assert len(results) == 10
+    assert len(entries) == 9
+    assert counters == {"memory_hits": 1, "disk_hits": 0, "misses": 9}
+
+    parent = AnalysisCache(str(tmp_path / "cache.db"))
+    commits = count_commits(parent)
+    parent.set_many(entries)
+    parent.add_stats(counters)
+
+    assert len(commits) == 1
+    assert parent.stats()["lookups"] == 10
+    assert tuple(parent.get(entries[0][0])) == results[1]
+
+
+def test_disk_tier_is_pruned_by_version_age_and_count(tmp_path, monkeypatch):
+    path = str(tmp_path / "cache.db")
+    cache = AnalysisCache(path, max_disk_entries=2)
+    for i in range(5):
+        cache.set(f"key-{i}", i, "kind")
+    conn = sqlite3.connect(path)
+    conn.execute("UPDATE analysis_cache SET created_at = '2000-01-01T00:00:00' WHERE cache_key = 'key-4'")
+    conn.execute("UPDATE analysis_cache SET analyzer_version = 'rule-based-0' WHERE cache_key = 'key-3'")
+    conn.execute("UPDATE analysis_cache SET created_at = '2100-01-01T00:00:00' WHERE cache_key IN ('key-0', 'key-1')")
+    conn.commit()
+
+    assert cache.prune() == 3
+    assert sorted(row[0] for row in conn.execute("SELECT cache_key FROM analysis_cache")) == ["key-0", "key-1"]
+
+    # Reopening prunes as well, and enough stored results trigger a prune on their own
+    monkeypatch.setattr(analysis_cache, "PRUNE_EVERY_WRITES", 4)
+    reopened = AnalysisCache(path, max_disk_entries=2)
+    reopened.set_many([(f"new-{i}", "kind", i) for i in range(4)])
+    assert conn.execute("SELECT COUNT(*) FROM analysis_cache").fetchone()[0] == 2
+    conn.close()
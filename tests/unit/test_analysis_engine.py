@@ -0,0 +1,18 @@
+from app.infrastructure.ai.analysis_engine import DEFAULT_CATEGORY_MEMO_SIZE, AnalysisEngine
+from utils.analysis_cache import AnalysisCache
+
+
+def test_label_category_memo_is_bounded():
+    engine = AnalysisEngine(cache=AnalysisCache(None))
+    for i in range(DEFAULT_CATEGORY_MEMO_SIZE + 200):
+        engine.classify_text("privacy and consent", [f"Privacy Risk {i}", f"custom label {i}"])
+
+    assert engine._classification_category.cache_info().currsize == DEFAULT_CATEGORY_MEMO_SIZE
+    assert engine.classify_text("personal data and consent", ["Security Risk", "Privacy Risk"])[0] == "Privacy Risk"
+
+
+def test_container_registers_the_facade_engine():
+    from app.infrastructure.container import Container
+    from utils.ai_utils import get_engine
+
+    assert Container().get('analysis_engine') is get_engine()
@@ -0,0 +1,31 @@
+import importlib
+import threading
+
+from fastapi.testclient import TestClient
+
+from app.infrastructure.database import sqlite_repositories
+from database import db_utils_sqlite
+
+BACKGROUND_THREADS = ("job-worker", "job-heartbeat", "report-scheduler")
+
+
+def background_threads():
+    return [thread.name for thread in threading.enumerate()
+            if thread.name.startswith(BACKGROUND_THREADS) and thread.is_alive()]
+
+
+def test_importing_main_starts_nothing_until_the_app_runs(tmp_path, monkeypatch):
+    path = str(tmp_path / "governance.db")
+    monkeypatch.setattr(db_utils_sqlite, "DB_PATH", path)
+    monkeypatch.setattr(sqlite_repositories, "DB_PATH", path)
+    main = importlib.import_module("main")
+
+    assert background_threads() == []
+    assert not (tmp_path / "governance.db").exists()
+
+    with TestClient(main.app) as client:
+        assert client.get("/api/dashboard/metrics").status_code == 200
+        running = background_threads()
+        assert all(any(name.startswith(prefix) for name in running) for prefix in BACKGROUND_THREADS)
+
+    assert background_threads() == []
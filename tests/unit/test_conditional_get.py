@@ -0,0 +1,48 @@
+import pytest
+from fastapi import FastAPI, Request, Response
+from fastapi.testclient import TestClient
+
+from app.api.caching import DASHBOARD_TABLES, conditional_response
+from database import db_utils_sqlite
+from database.db_init_sqlite import init_db
+from database.models import ComplianceMonitor, Policy
+
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_utils_sqlite, "DB_PATH", str(tmp_path / "governance.db"))
+    init_db()
+    app = FastAPI()
+
+    @app.get("/monitors")
+    async def monitors(request: Request, response: Response):
+        not_modified = await conditional_response(request, response, DASHBOARD_TABLES["compliance_status"])
+        if not_modified:
+            return not_modified
+        return db_utils_sqlite.get_all_compliance_monitors()
+
+    return TestClient(app)
+
+
+def test_matching_etag_gets_304_without_a_body(client):
+    first = client.get("/monitors")
+    etag = first.headers["etag"]
+
+    revalidated = client.get("/monitors", headers={"If-None-Match": etag})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["etag"] == etag
+    assert client.get("/monitors", headers={"If-None-Match": etag.removeprefix("W/")}).status_code == 304
+
+
+def test_write_to_a_read_table_changes_the_etag(client):
+    etag = client.get("/monitors").headers["etag"]
+    db_utils_sqlite.create_policy(Policy(title="Unrelated", category="Security", status="Active"))
+    assert client.get("/monitors", headers={"If-None-Match": etag}).status_code == 304
+
+    db_utils_sqlite.create_compliance_monitor(ComplianceMonitor(name="Drift", alert_level="Warning"))
+
+    changed = client.get("/monitors", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.headers["etag"] != etag
+    assert any(monitor["name"] == "Drift" for monitor in changed.json())
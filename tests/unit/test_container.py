@@ -0,0 +1,25 @@
+import threading
+import time
+
+from app.infrastructure.container import Container
+
+
+def test_concurrent_first_gets_share_one_singleton():
+    container = Container()
+    created = []
+
+    def factory():
+        time.sleep(0.05)
+        created.append(object())
+        return created[-1]
+
+    container.register_factory("slow", factory)
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(container.get("slow"))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(created) == 1
+    assert all(result is created[0] for result in results)
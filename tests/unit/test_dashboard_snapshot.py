@@ -0,0 +1,37 @@
+import pytest
+
+from database import db_utils_sqlite
+from database.db_init_sqlite import init_db
+from database.models import Policy
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_utils_sqlite, "DB_PATH", str(tmp_path / "governance.db"))
+    init_db()
+
+
+def count_policies():
+    conn = db_utils_sqlite.get_db_connection()
+    count = conn.execute("SELECT COUNT(*) AS count FROM policies").fetchone()['count']
+    conn.close()
+    return count
+
+
+def test_policy_count_comes_from_the_counters_and_matches_the_table(database):
+    for i, status in enumerate(["Active", "Draft", "Retired"]):
+        db_utils_sqlite.create_policy(Policy(title=f"Policy {i}", category=None if i else "Security", status=status))
+    conn = db_utils_sqlite.get_db_connection()
+    conn.execute("DELETE FROM policies WHERE id = (SELECT MIN(id) FROM policies)")
+    conn.commit()
+    conn.close()
+
+    statements = []
+    conn = db_utils_sqlite.get_db_connection()
+    conn.set_trace_callback(statements.append)
+    assert db_utils_sqlite.read_policy_count(conn.cursor()) == count_policies()
+    conn.close()
+    assert not any("FROM policies" in statement for statement in statements)
+
+    assert db_utils_sqlite.get_policy_count() == count_policies()
+    assert db_utils_sqlite.get_dashboard_snapshot()['policy_count'] == count_policies()
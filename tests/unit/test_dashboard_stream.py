@@ -0,0 +1,98 @@
+import asyncio
+
+import pytest
+
+from app.infrastructure.messaging.dashboard_stream import MONITOR_COLUMNS, DashboardStream
+from app.infrastructure.messaging.event_bus import EventBus
+from database import db_utils_sqlite
+from database.db_init_sqlite import init_db
+
+
+@pytest.fixture
+def monitor(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_utils_sqlite, "DB_PATH", str(tmp_path / "governance.db"))
+    init_db()
+    conn = db_utils_sqlite.get_db_connection()
+    row = conn.execute(f"SELECT {', '.join(MONITOR_COLUMNS)} FROM compliance_monitors "
+                       "WHERE alert_level = 'Normal' ORDER BY id LIMIT 1").fetchone()
+    conn.close()
+    return dict(row)
+
+
+@pytest.fixture
+def bus():
+    bus = EventBus()
+    yield bus
+    bus.close()
+
+
+async def receive(client, count):
+    return [await asyncio.wait_for(client.get(), 5) for _ in range(count)]
+
+
+def test_bus_monitor_events_are_diffed(monitor, bus):
+    async def scenario():
+        stream = DashboardStream()
+        stream.attach(bus)
+        client = await stream.subscribe()
+
+        bus.publish("monitor.updated", {**monitor, "current_value": monitor['current_value'] + 1,
+                                        "alert_level": "Critical"})
+        updated, transition = await receive(client, 2)
+        # An unchanged monitor produces nothing, so the activity is the next event
+        bus.publish("monitor.updated", {**monitor, "current_value": monitor['current_value'] + 1,
+                                        "alert_level": "Critical"})
+        bus.publish("activity.created", {"id": 999})
+        activity, = await receive(client, 1)
+        bus.publish("monitor.deleted", {"id": monitor['id']})
+        deleted, = await receive(client, 1)
+        return updated, transition, activity, deleted
+
+    updated, transition, activity, deleted = asyncio.run(scenario())
+
+    assert updated.event == "monitor.updated"
+    assert updated.data['previous_value'] == monitor['current_value']
+    assert transition.event == "alert.transition"
+    assert (transition.data['from_level'], transition.data['to_level']) == ("Normal", "Critical")
+    assert activity.event == "activity.created"
+    assert (deleted.event, deleted.data) == ("monitor.deleted", {"id": monitor['id']})
+
+
+def test_last_event_id_replays_missed_events_or_resets(monitor, bus):
+    async def scenario():
+        stream = DashboardStream(history_size=3)
+        stream.attach(bus)
+        first = await stream.subscribe()
+        for n in range(5):
+            bus.publish("activity.created", {"id": n})
+        events = await receive(first, 5)
+
+        resumed = await stream.subscribe(events[2].id)
+        expired = await stream.subscribe(events[0].id)
+        foreign = await stream.subscribe("0123abcd-3")
+        return (events, [resumed.get_nowait() for _ in range(resumed.qsize())],
+                expired.get_nowait(), foreign.get_nowait())
+
+    events, resumed, expired, foreign = asyncio.run(scenario())
+
+    assert [event.data['id'] for event in resumed] == [3, 4]
+    assert [event.id for event in resumed] == [event.id for event in events[3:]]
+    assert (expired.event, expired.data) == ("reset", {"reason": "history_expired"})
+    assert (foreign.event, foreign.data) == ("reset", {"reason": "unknown_event_id"})
+
+
+def test_client_that_falls_behind_gets_a_single_reset(monitor, bus):
+    async def scenario():
+        stream = DashboardStream(client_queue_size=2)
+        stream.attach(bus)
+        slow = await stream.subscribe()
+        for n in range(3):
+            stream.publish("activity.created", {"id": n})
+        waiting = [slow.get_nowait() for _ in range(slow.qsize())]
+        stream.publish("activity.created", {"id": 3})
+        return waiting, slow.get_nowait()
+
+    waiting, after = asyncio.run(scenario())
+
+    assert [(event.event, event.data) for event in waiting] == [("reset", {"reason": "lagging"})]
+    assert (after.event, after.data) == ("activity.created", {"id": 3})
@@ -0,0 +1,116 @@
+import asyncio
+import threading
+
+import pytest
+
+from app.infrastructure.messaging.event_bus import AsyncSubscription, EventBus, Subscription
+from app.infrastructure.messaging.sqlite_bridge import SQLiteEventBridge
+
+
+def collect(bus, pattern):
+    received, done = [], threading.Event()
+
+    def handler(event):
+        received.append(event)
+        done.set()
+
+    return bus.subscribe(pattern, handler), received, done
+
+
+def test_events_reach_matching_subscribers_only():
+    bus = EventBus()
+    _, monitors, monitor_done = collect(bus, "monitor.*")
+
+    bus.publish("policy.created", {"id": 1})
+    bus.publish("monitor.updated", {"id": 2})
+
+    assert monitor_done.wait(5)
+    bus.close()
+    assert [event.payload for event in monitors] == [{"id": 2}]
+    with pytest.raises(ValueError):
+        bus.publish("policy.deleted", {})
+
+
+def test_full_queue_drops_the_oldest_event():
+    bus = EventBus()
+    started, release, finished = threading.Event(), threading.Event(), threading.Event()
+    received = []
+
+    def handler(event):
+        started.set()
+        release.wait(5)
+        received.append(event.payload["n"])
+        if len(received) == 3:
+            finished.set()
+
+    subscription = bus.subscribe("activity.created", handler, queue_size=2)
+    bus.publish("activity.created", {"n": 0})
+    assert started.wait(5)
+    for n in range(1, 6):
+        bus.publish("activity.created", {"n": n})
+    release.set()
+
+    assert finished.wait(5)
+    assert received == [0, 4, 5]
+    assert subscription.dropped == 3
+    bus.unsubscribe(subscription)
+    subscription._thread.join(5)
+    assert not subscription._thread.is_alive()
+
+
+def test_subscription_is_abstract():
+    with pytest.raises(TypeError):
+        Subscription("*", print, 1)
+
+
+def test_async_subscriber_runs_on_its_loop_and_stops_on_close():
+    async def scenario():
+        bus = EventBus()
+        received = asyncio.Queue()
+
+        async def handler(event):
+            await received.put(event.type)
+
+        subscription = bus.subscribe("report.*", handler)
+        await asyncio.sleep(0)
+        await asyncio.to_thread(bus.publish, "report.created", {"id": 1})
+        assert await asyncio.wait_for(received.get(), 5) == "report.created"
+
+        task = subscription._task
+        bus.close()
+        await asyncio.sleep(0.01)
+        assert task.cancelled()
+
+    asyncio.run(scenario())
+
+
+def test_async_subscription_closed_before_start_never_starts():
+    async def scenario():
+        async def handler(event):
+            pass
+
+        subscription = AsyncSubscription("*", handler, 10, asyncio.get_running_loop())
+        subscription.close()
+        subscription.offer(None)
+        await asyncio.sleep(0.01)
+        assert subscription._task is None
+
+    asyncio.run(scenario())
+
+
+def test_bridge_relays_events_between_buses(tmp_path):
+    path = str(tmp_path / "events.db")
+    publisher, listener = EventBus(), EventBus()
+    sender, receiver = SQLiteEventBridge(publisher, path), SQLiteEventBridge(listener, path, poll_interval=0.05)
+    _, received, done = collect(listener, "policy.*")
+    sender.start()
+    receiver.start()
+    try:
+        event = publisher.publish("policy.updated", {"id": 7})
+        assert done.wait(5)
+        assert (received[0].id, received[0].payload, received[0].origin) == (event.id, {"id": 7}, publisher.origin)
+    finally:
+        sender.stop()
+        receiver.stop()
+        publisher.close()
+        listener.close()
@@ -0,0 +1,27 @@
+import pytest
+
+from database import db_utils_sqlite
+from database.db_init_sqlite import init_db
+
+
+@pytest.fixture
+def database(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_utils_sqlite, "DB_PATH", str(tmp_path / "governance.db"))
+    init_db()
+    conn = db_utils_sqlite.get_db_connection()
+    conn.executemany(
+        'INSERT INTO risk_assessments (title, model_name, risk_score, findings, recommendations, created_at, status) VALUES (?, ?, ?, ?, ?, ?, ?)',
+        [(f"Assessment {i}", f"tied-model-{i:02d}", 80.0, "", "", "2025-01-01T00:00:00", "High Risk") for i in range(30)]
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_pages_of_equal_scores_neither_repeat_nor_skip(database):
+    first = db_utils_sqlite.get_high_risk_assessments(threshold=75.0, limit=1000)
+    paged = []
+    for offset in range(0, first['total'], 7):
+        paged.extend(db_utils_sqlite.get_high_risk_assessments(threshold=75.0, limit=7, offset=offset)['items'])
+
+    assert [row['id'] for row in paged] == [row['id'] for row in first['items']]
+    assert len({row['model_name'] for row in paged}) == first['total']
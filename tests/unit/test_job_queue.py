@@ -0,0 +1,90 @@
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.infrastructure.jobs.queue import JobQueue
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "jobs.db")
+
+
+def insert_running(db_path, job_id, owner, heartbeat_at):
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "INSERT INTO jobs (id, kind, status, payload, created_at, started_at, owner, heartbeat_at) VALUES (?, 'noop', 'running', '{}', ?, ?, ?, ?)",
+        (job_id, heartbeat_at, heartbeat_at, owner, heartbeat_at)
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_start_fails_only_jobs_whose_lease_expired(db_path):
+    JobQueue(db_path)
+    now = datetime.now()
+    insert_running(db_path, "live", "other-host:1:abc", now.isoformat())
+    insert_running(db_path, "expired", "other-host:2:def", (now - timedelta(minutes=5)).isoformat())
+
+    queue = JobQueue(db_path, num_workers=1, lease_seconds=60)
+    queue.start()
+    try:
+        assert queue.get("live")["status"] == "running"
+        assert queue.get("expired")["status"] == "failed"
+    finally:
+        queue.stop()
+
+
+def test_pending_job_is_cancelled_before_it_starts(db_path):
+    queue = JobQueue(db_path)
+    queue.register("noop", lambda context: "ran")
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO jobs (id, kind, status, payload, created_at) VALUES ('queued', 'noop', 'pending', '{}', ?)",
+                 (datetime.now().isoformat(),))
+    conn.commit()
+    conn.close()
+
+    assert queue.cancel("queued")["status"] == "cancelled"
+    queue._run("queued")
+    assert queue.get("queued")["result"] is None
+    assert queue._cancelled == set()
+
+
+def test_running_job_stops_at_its_next_progress_report(db_path):
+    queue = JobQueue(db_path, num_workers=1)
+    started, release = threading.Event(), threading.Event()
+
+    def handler(context):
+        started.set()
+        release.wait(5)
+        context.progress(1)
+        return "finished"
+
+    queue.register("slow", handler)
+    job = queue.submit("slow", total=2)
+    try:
+        assert started.wait(5)
+        assert queue.cancel(job["job_id"])["cancel_requested"]
+        assert job["job_id"] in queue._cancelled
+        release.set()
+        for _ in range(100):
+            if queue.get(job["job_id"])["status"] != "running":
+                break
+            time.sleep(0.05)
+        assert queue.get(job["job_id"])["status"] == "cancelled"
+        assert queue._cancelled == set()
+    finally:
+        release.set()
+        queue.stop()
+
+
+def test_cancelling_a_finished_job_is_not_remembered(db_path):
+    queue = JobQueue(db_path)
+    queue.register("noop", lambda context: "ran")
+    job = queue.submit("noop", run_inline=True)
+
+    assert queue.cancel(job["job_id"])["status"] == "completed"
+    assert queue._cancelled == set()
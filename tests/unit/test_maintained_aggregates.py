@@ -0,0 +1,112 @@
+import random
+
+import pytest
+
+from database import db_utils_sqlite
+from database.db_init_sqlite import (init_db, rebuild_daily_rollups, rebuild_model_risk_current,
+                                     rebuild_policy_category_counts)
+
+
+@pytest.fixture
+def conn(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_utils_sqlite, "DB_PATH", str(tmp_path / "governance.db"))
+    init_db()
+    conn = db_utils_sqlite.get_db_connection()
+    yield conn
+    conn.close()
+
+
+def rows(conn, query):
+    return [tuple(row.values()) for row in conn.execute(query).fetchall()]
+
+
+def assert_matches_rebuild(conn, query, rebuild):
+    maintained = rows(conn, query)
+    rebuild(conn)
+    assert maintained == rows(conn, query)
+
+
+def test_policy_category_counts_match_a_recount(conn):
+    rng = random.Random(5)
+    categories = ["Data Privacy", "Fairness", "Security", None]
+    statuses = ["Active", "Draft", "Retired"]
+    for i in range(60):
+        conn.execute("INSERT INTO policies (title, category, status) VALUES (?, ?, ?)",
+                     (f"Policy {i}", rng.choice(categories), rng.choice(statuses)))
+    ids = [row['id'] for row in conn.execute("SELECT id FROM policies").fetchall()]
+    for policy_id in rng.sample(ids, 30):
+        conn.execute("UPDATE policies SET category = ?, status = ? WHERE id = ?",
+                     (rng.choice(categories), rng.choice(statuses), policy_id))
+    for policy_id in rng.sample(ids, 10):
+        conn.execute("DELETE FROM policies WHERE id = ?", (policy_id,))
+    conn.commit()
+
+    # Categories emptied by deletes keep a zero row; a recount omits them
+    assert_matches_rebuild(
+        conn, "SELECT * FROM policy_category_counts WHERE total_count > 0 ORDER BY category",
+        rebuild_policy_category_counts
+    )
+
+
+def test_model_risk_current_matches_a_recompute(conn):
+    rng = random.Random(6)
+    for i in range(80):
+        conn.execute(
+            "INSERT INTO risk_assessments (title, model_name, risk_score, created_at, status) VALUES (?, ?, ?, ?, ?)",
+            (f"Assessment {i}", f"model-{rng.randint(0, 9)}", round(rng.uniform(0, 100), 1),
+             f"2025-01-{rng.randint(1, 28):02d}T10:00:00", "Completed")
+        )
+    ids = [row['id'] for row in conn.execute("SELECT id FROM risk_assessments").fetchall()]
+    for assessment_id in rng.sample(ids, 25):
+        conn.execute("UPDATE risk_assessments SET risk_score = ?, status = ? WHERE id = ?",
+                     (round(rng.uniform(0, 100), 1), "Rescored", assessment_id))
+    conn.commit()
+
+    assert_matches_rebuild(conn, "SELECT * FROM model_risk_current ORDER BY model_name", rebuild_model_risk_current)
+
+
+def test_daily_rollups_match_a_recompute(conn):
+    rng = random.Random(7)
+    for i in range(60):
+        conn.execute(
+            "INSERT INTO risk_assessments (title, model_name, risk_score, created_at, status) VALUES (?, ?, ?, ?, ?)",
+            (f"Assessment {i}", "model", round(rng.uniform(0, 100), 1), f"2025-02-{rng.randint(1, 5):02d}T09:00:00", "Completed")
+        )
+    ids = [row['id'] for row in conn.execute("SELECT id FROM risk_assessments").fetchall()]
+    for assessment_id in rng.sample(ids, 20):
+        conn.execute("UPDATE risk_assessments SET risk_score = ?, created_at = ? WHERE id = ?",
+                     (round(rng.uniform(0, 100), 1), f"2025-02-{rng.randint(1, 5):02d}T18:00:00", assessment_id))
+    for assessment_id in rng.sample(ids, 10):
+        conn.execute("DELETE FROM risk_assessments WHERE id = ?", (assessment_id,))
+    for i in range(10):
+        conn.execute("INSERT INTO compliance_monitors (name, status, alert_level) VALUES (?, ?, ?)",
+                     (f"Monitor {i}", rng.choice(["Active", "Inactive"]), rng.choice(["Normal", "Warning", "Critical"])))
+    monitor_ids = [row['id'] for row in conn.execute("SELECT id FROM compliance_monitors").fetchall()]
+    for monitor_id in rng.sample(monitor_ids, 6):
+        conn.execute("UPDATE compliance_monitors SET status = ?, alert_level = ? WHERE id = ?",
+                     (rng.choice(["Active", "Inactive"]), rng.choice(["Normal", "Warning", "Critical"]), monitor_id))
+    conn.execute("DELETE FROM compliance_monitors WHERE id = ?", (monitor_ids[0],))
+    conn.commit()
+
+    # Risk sums are compared rounded, as the triggers add and subtract floats in a different order
+    risk_query = ("SELECT day, assessments, ROUND(risk_score_sum, 6), high_risk_assessments "
+                  "FROM daily_risk_rollup WHERE assessments > 0 ORDER BY day")
+    # alerts_raised is only known to the triggers; a recompute records the current monitor state
+    compliance_query = ("SELECT day, active_monitors, compliant_monitors, warning_monitors, critical_monitors "
+                        "FROM daily_compliance_rollup ORDER BY day")
+    maintained = rows(conn, risk_query), rows(conn, compliance_query)
+    rebuild_daily_rollups(conn)
+    assert maintained == (rows(conn, risk_query), rows(conn, compliance_query))
+
+
+def test_compliance_rollup_carries_the_last_state_into_a_new_day(conn):
+    conn.execute("DELETE FROM daily_compliance_rollup")
+    conn.execute("INSERT INTO daily_compliance_rollup VALUES ('2025-02-01', 5, 3, 1, 1, 2)")
+    conn.execute("INSERT INTO compliance_monitors (name, status, alert_level) VALUES ('New', 'Active', 'Critical')")
+    conn.execute("INSERT INTO compliance_monitors (name, status, alert_level) VALUES ('Unset', NULL, NULL)")
+    conn.commit()
+
+    today = rows(conn, "SELECT active_monitors, compliant_monitors, warning_monitors, critical_monitors, alerts_raised "
+                       "FROM daily_compliance_rollup WHERE day = date('now', 'localtime')")
+    assert today == [(6, 3, 1, 2, 1)]
+    assert rows(conn, "SELECT COUNT(*) FROM daily_compliance_rollup WHERE day = '2025-02-01'") == [(1,)]
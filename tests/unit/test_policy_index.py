@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from database import db_utils_sqlite
+from database.db_init_sqlite import init_db
+from utils.policy_index import MinHasher, find_near_duplicates, index_policy
+
+VOCABULARY = [f"term{i}" for i in range(2000)]
+
+
+@pytest.fixture
+def cursor(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_utils_sqlite, "DB_PATH", str(tmp_path / "governance.db"))
+    init_db()
+    conn = db_utils_sqlite.get_db_connection()
+    cursor = conn.cursor()
+    yield cursor
+    cursor.close()
+    conn.close()
+
+
+def add_policy(cursor, content, hasher):
+    cursor.execute("INSERT INTO policies (title, content, status) VALUES ('Policy', ?, 'Draft')", (content,))
+    index_policy(cursor, cursor.lastrowid, content, hasher)
+    return cursor.lastrowid
+
+
+def test_one_word_edit_is_a_candidate_and_unrelated_policies_are_not(cursor):
+    rng = random.Random(3)
+    hasher = MinHasher(seed=7)
+    words = rng.choices(VOCABULARY, k=200)
+    edited = list(words)
+    edited[100] = "changed"
+
+    original_id = add_policy(cursor, " ".join(words), hasher)
+    edited_id = add_policy(cursor, " ".join(edited), hasher)
+    unrelated_ids = [add_policy(cursor, " ".join(rng.choices(VOCABULARY, k=200)), hasher) for _ in range(20)]
+
+    # A zero threshold returns every LSH candidate with its estimated similarity
+    candidates = find_near_duplicates(cursor, original_id, threshold=0.0, limit=100)
+
+    assert [match["policy_id"] for match in candidates] == [edited_id]
+    assert candidates[0]["similarity"] >= 0.9
+    assert not {match["policy_id"] for match in find_near_duplicates(cursor, unrelated_ids[0], threshold=0.0)} \
+        & {original_id, edited_id}
@@ -0,0 +1,33 @@
+import threading
+from datetime import datetime, timedelta
+
+from app.infrastructure.jobs.queue import JobQueue
+from app.infrastructure.jobs.scheduler import ReportScheduler
+
+
+def test_due_run_is_claimed_by_one_scheduler_only(tmp_path):
+    queue = JobQueue(str(tmp_path / "jobs.db"), num_workers=1)
+    queue.register("report", lambda context: None)
+    schedulers = [ReportScheduler(queue) for _ in range(4)]
+    schedule = schedulers[0].create("Nightly", "compliance", frequency="daily")
+    now = datetime.fromisoformat(schedule['next_run_at']) + timedelta(minutes=1)
+
+    barrier = threading.Barrier(len(schedulers))
+    submitted = []
+
+    def run(scheduler):
+        barrier.wait()
+        submitted.extend(scheduler.run_due(now))
+
+    threads = [threading.Thread(target=run, args=(scheduler,)) for scheduler in schedulers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    try:
+        assert len(submitted) == 1
+        assert len(queue.list(kind="report")) == 1
+        assert schedulers[0].run_due(now) == []
+        assert schedulers[0].get(schedule['id'])['next_run_at'] > now.isoformat()
+    finally:
+        queue.stop()
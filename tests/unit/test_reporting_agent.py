@@ -0,0 +1,75 @@
+import pytest
+
+from app.core.reporting.reporting_agent import ReportingAgent
+from app.core.reporting.sections import build_risk_overview
+from app.infrastructure.database import sqlite_repositories
+from database import db_utils_sqlite
+from database.db_init_sqlite import init_db
+
+COMPREHENSIVE = "Comprehensive Governance Report"
+
+
+@pytest.fixture
+def agent(tmp_path, monkeypatch):
+    path = str(tmp_path / "governance.db")
+    monkeypatch.setattr(db_utils_sqlite, "DB_PATH", path)
+    monkeypatch.setattr(sqlite_repositories, "DB_PATH", path)
+    init_db()
+    return ReportingAgent()
+
+
+def execute(query, params=()):
+    conn = db_utils_sqlite.get_db_connection()
+    try:
+        conn.execute(query, params)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def test_unchanged_database_serves_sections_from_cache(agent):
+    first = agent.generate_report("First", "", COMPREHENSIVE)
+    second = agent.generate_report("Second", "", COMPREHENSIVE)
+
+    assert first["cached_sections"] == []
+    assert second["cached_sections"] == first["sections"]
+    assert set(second["timings"]) == {"snapshot"}
+    assert second["report"].content.split("\n\n", 3)[3] == first["report"].content.split("\n\n", 3)[3]
+
+
+def test_write_invalidates_only_sections_reading_that_table(agent):
+    first = agent.generate_report("First", "", COMPREHENSIVE)
+
+    execute("UPDATE compliance_monitors SET current_value = current_value + 1 WHERE id = "
+            "(SELECT MIN(id) FROM compliance_monitors)")
+    after_monitor_write = agent.generate_report("Second", "", COMPREHENSIVE)
+
+    assert after_monitor_write["cached_sections"] == ["governance_summary", "risk_overview"]
+    assert set(after_monitor_write["timings"]) == {"snapshot", "compliance_status", "insights"}
+
+    execute("INSERT INTO policies (title, category, status) VALUES ('New policy', 'Security', 'Draft')")
+    after_policy_write = agent.generate_report("Third", "", COMPREHENSIVE)
+
+    assert after_policy_write["cached_sections"] == ["risk_overview", "compliance_status"]
+    assert "**Total Policies**: 7" in first["report"].content
+    assert "**Total Policies**: 8" in after_policy_write["report"].content
+
+
+def test_failing_section_does_not_sink_the_report(agent):
+    def broken(snapshot):
+        raise RuntimeError("risk data unavailable")
+
+    agent.section_builders["risk_overview"] = broken
+    generated = agent.generate_report("Partial", "", COMPREHENSIVE)
+
+    content = generated["report"].content
+    assert "## Governance Summary" in content and "## Compliance Status" in content
+    assert "risk data unavailable" in content
+    assert generated["cached_sections"] == []
+
+    # The failed section is not cached, so it is retried on the next report
+    agent.section_builders["risk_overview"] = build_risk_overview
+    retried = agent.generate_report("Retried", "", COMPREHENSIVE)
+
+    assert retried["cached_sections"] == ["governance_summary", "compliance_status", "insights"]
+    assert "## Risk Overview" in retried["report"].content
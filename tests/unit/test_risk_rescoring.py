@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+
+from app.core.risk_assessment.risk_assessment_agent import RiskAssessmentAgent
+from app.domain.models import RiskAssessment
+from app.infrastructure.database import sqlite_repositories
+from app.infrastructure.database.sqlite_repositories import SQLiteRiskAssessmentRepository
+from database import db_utils_sqlite
+from database.db_init_sqlite import init_db
+
+
+@pytest.fixture
+def repository(tmp_path, monkeypatch):
+    path = str(tmp_path / "governance.db")
+    monkeypatch.setattr(db_utils_sqlite, "DB_PATH", path)
+    monkeypatch.setattr(sqlite_repositories, "DB_PATH", path)
+    init_db()
+    return SQLiteRiskAssessmentRepository()
+
+
+def test_rescore_keeps_entered_scores(repository):
+    entered = {a['id']: (a['risk_score'], a['status']) for a in repository.get_all()}
+    agent = RiskAssessmentAgent(repository)
+    assessment = agent.assess_documentation("Engine scored", "model-x", "Personal data and consent under GDPR.")
+    engine_id = repository.create(assessment)
+
+    summary = agent.rescore_all({"Privacy Risk": 10})
+
+    assert summary["updated"] == 1
+    rows = {a['id']: a for a in repository.get_all()}
+    assert all((rows[i]['risk_score'], rows[i]['status']) == entered[i] for i in entered)
+    assert rows[engine_id]['score_source'] == "engine"
+    assert rows[engine_id]['risk_score'] > assessment.risk_score
+
+
+def test_weights_are_saved_and_loaded_by_other_agents(repository):
+    RiskAssessmentAgent(repository).rescore_all({"Bias Risk": 3})
+
+    other = RiskAssessmentAgent(SQLiteRiskAssessmentRepository())
+    weights = other.load_weights()
+
+    assert weights["Bias Risk"] == pytest.approx(3 * weights["Privacy Risk"])
+
+
+def test_manual_assessment_is_not_rescored(repository):
+    manual_id = repository.create(RiskAssessment(title="Entered", model_name="model-y", risk_score=88.0,
+                                                 findings="privacy gdpr consent", status="High Risk"))
+
+    RiskAssessmentAgent(repository).rescore_all({"Privacy Risk": 0.1})
+
+    row = repository.get_by_id(manual_id)
+    assert (row['risk_score'], row['status'], row['score_source']) == (88.0, "High Risk", "manual")
+
+
+def test_assessed_level_matches_the_rounded_score(repository, monkeypatch):
+    agent = RiskAssessmentAgent(repository)
+    monkeypatch.setattr(agent.scoring_engine, "score", lambda evidence: np.array([74.96]))
+
+    assessment = agent.assess_documentation("Boundary", "model-z", "Personal data and consent under GDPR.")
+
+    assert (assessment.risk_score, assessment.status) == (75.0, "High Risk")
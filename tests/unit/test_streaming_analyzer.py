@@ -0,0 +1,53 @@
+import pytest
+
+from app.infrastructure.ai.analysis_engine import AnalysisEngine
+from utils.analysis_cache import AnalysisCache
+from utils.streaming_analyzer import analyze_file, analyze_stream
+
+LABELS = ["Privacy Risk", "Security Risk", "Bias", "Performance", "Données personnelles"]
+
+DOCUMENT = (
+    "Le modèle traite des données personnelles 🔒 under a documented consent flow.\n"
+    "The encryption of personal data is verified by an external audit. "
+    "Accuracy and reliability improved after retraining — résumé: 97 % recall. "
+    "A known vulnerability in the ranking service is a concern for fairness. "
+    "Naïve façade tests pass ✅. Remaining risk is tracked in the register"
+)
+
+
+def _chunks(text, size):
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def _whole_text(text):
+    engine = AnalysisEngine(cache=AnalysisCache(None))
+    label, confidence = engine.classify_text(text, LABELS)
+    sentiment, sentiment_score = engine.analyze_sentiment(text)
+    return {
+        "classification": {"label": label, "confidence": confidence},
+        "labels": engine.multi_label_classify(text, LABELS),
+        "sentiment": {"label": sentiment, "confidence": sentiment_score},
+        "key_points": engine.extract_key_points(text, 3),
+    }
+
+
+@pytest.mark.parametrize("size", [1, 7, len(DOCUMENT) - 1, len(DOCUMENT)])
+def test_chunked_stream_matches_whole_text(size):
+    expected = _whole_text(DOCUMENT)
+    result = analyze_stream(_chunks(DOCUMENT, size), labels=LABELS, num_points=3)
+
+    assert {key: result[key] for key in expected} == expected
+    assert result["chars_processed"] == len(DOCUMENT)
+    assert result["labels"]
+
+
+@pytest.mark.parametrize("size", [1, 7, len(DOCUMENT) - 1])
+def test_file_chunks_split_multibyte_characters(tmp_path, size):
+    path = tmp_path / "model_card.txt"
+    path.write_text(DOCUMENT, encoding="utf-8")
+
+    result = analyze_file(str(path), labels=LABELS, chunk_size=size)
+
+    expected = _whole_text(DOCUMENT)
+    assert {key: result[key] for key in expected} == expected
+    assert result["chars_processed"] == len(DOCUMENT)
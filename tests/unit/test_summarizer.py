@@ -0,0 +1,48 @@
+import pytest
+
+from utils.summarizer import rank_sentences, summarize
+
+pytest.importorskip("numpy")
+
+TOPICS = [
+    ("privacy", "consent", "retention"),
+    ("encryption", "keys", "rotation"),
+    ("fairness", "audit", "demographic"),
+    ("latency", "throughput", "serving"),
+    ("drift", "monitoring", "alerts"),
+]
+
+CORPUS = [
+    "Sentence {} covers {} and {} for model {} with {} controls".format(
+        i, *TOPICS[i % len(TOPICS)][:2], i % 7, TOPICS[(i // len(TOPICS)) % len(TOPICS)][2])
+    for i in range(40)
+] + [
+    "Privacy consent and encryption keys are reviewed in the fairness audit",
+    "Latency alerts and drift monitoring share the serving dashboard",
+]
+
+
+def test_numpy_and_python_paths_rank_identically():
+    numpy_scores = rank_sentences(CORPUS, top_k=4, use_numpy=True)
+    python_scores = rank_sentences(CORPUS, top_k=4, use_numpy=False)
+
+    assert numpy_scores == pytest.approx(python_scores, abs=1e-9)
+    assert sum(numpy_scores) == pytest.approx(1.0)
+    assert len(set(round(score, 9) for score in numpy_scores)) > 1
+    assert summarize(CORPUS, 5, top_k=4, use_numpy=True) == summarize(CORPUS, 5, top_k=4, use_numpy=False)
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_single_sentence(use_numpy):
+    assert rank_sentences(["Only one sentence here"], use_numpy=use_numpy) == pytest.approx([1.0])
+    assert summarize(["Only one sentence here"], 3, use_numpy=use_numpy) == ["Only one sentence here"]
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_identical_sentences_keep_document_order(use_numpy):
+    sentences = ["Model governance review completed"] * 6
+
+    scores = rank_sentences(sentences, use_numpy=use_numpy)
+
+    assert scores == pytest.approx([1 / 6] * 6)
+    assert summarize(sentences, 2, use_numpy=use_numpy) == sentences[:2]
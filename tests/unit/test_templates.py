@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from app.infrastructure.ai import templates
+from app.infrastructure.ai.analysis_engine import GOVERNANCE_TEMPLATES
+from app.infrastructure.ai.templates import CompiledTemplate, TemplateRegistry, TRIE_MIN_KEYS
+
+
+def linear_match(keys, prompt):
+    return next((index for index, key in enumerate(keys) if key in prompt or prompt in key), None)
+
+
+def test_trie_resolution_matches_linear_scan():
+    rng = random.Random(3)
+    alphabet = "abc "
+    keys = list(dict.fromkeys("".join(rng.choice(alphabet) for _ in range(rng.randint(1, 6))) for _ in range(2000)))
+    registry = TemplateRegistry({key: f"text {i}" for i, key in enumerate(keys)})
+    assert len(keys) >= TRIE_MIN_KEYS
+
+    prompts = ["".join(rng.choice(alphabet + "d") for _ in range(rng.randint(0, 12))) for _ in range(2000)]
+    prompts += keys[:50] + [key[1:] for key in keys[:50]]
+    for prompt in prompts:
+        assert registry._resolve(prompt) == linear_match(keys, prompt), prompt
+
+
+def test_trie_and_linear_agree_on_governance_prompts(monkeypatch):
+    prompts = list(GOVERNANCE_TEMPLATES) + ["Describe AI governance policies should include: more", "AI", "no match here"]
+    linear = TemplateRegistry(GOVERNANCE_TEMPLATES)
+    expected = [linear.match_prompt(prompt) for prompt in prompts]
+
+    monkeypatch.setattr(templates, "TRIE_MIN_KEYS", 0)
+    trie = TemplateRegistry(GOVERNANCE_TEMPLATES)
+
+    assert [trie.match_prompt(prompt) for prompt in prompts] == expected
+
+
+def test_earlier_keys_take_priority_and_memo_resets_on_register():
+    registry = TemplateRegistry({"policy": "first", "policy for": "second"})
+    assert registry.match_prompt("a policy for models") == "first"
+
+    registry.register_prompt("a policy", "third")
+    assert registry.match_prompt("a policy for models") == "first"
+    registry.register_prompt("policy", "replaced")
+    assert registry.match_prompt("a policy for models") == "replaced"
+
+
+def test_compiled_template_renders_like_format():
+    source = "# {title}\n\nOwner: {owner}. {title} applies to {system}; braces {{kept}}."
+    fields = {"title": "Data Privacy", "owner": 7, "system": "Model 'X'"}
+
+    assert CompiledTemplate(source).render(**fields) == source.format(**fields)
+    assert CompiledTemplate("no fields").render() == "no fields"
+    with pytest.raises(ValueError):
+        CompiledTemplate("{value:>10}")
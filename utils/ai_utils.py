@@ -1,15 +1,27 @@
-import os
-import random
-import re
-import json
-from typing import List, Dict, Any, Optional, Tuple
-from datetime import datetime, timedelta
+import threading
+from typing import List, Dict, Any, Optional, Tuple, Iterable
+
+from app.infrastructure.ai.analysis_engine import AnalysisEngine, DEFAULT_BATCH_CHUNK_SIZE
+from utils.analysis_cache import get_analysis_cache
+
+_engine = None
+_engine_lock = threading.Lock()
+
+def get_engine() -> AnalysisEngine:
+    """Return the process-wide analysis engine, creating it on first use; the container registers the same one."""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = AnalysisEngine(cache=get_analysis_cache())
+    return _engine
 
 # Utility class for AI-related functions used across the application
 class AiUtils:
     """
     Utility class for AI-related functions used in the AI Governance Dashboard.
     Provides helper methods for text generation, classification, and summarization.
+    All work is delegated to the shared AnalysisEngine, so no state is rebuilt per call.
     """
     
     @staticmethod
@@ -24,7 +36,7 @@ class AiUtils:
             A text generation object
         """
         try:
-            return {"model": model_name, "initialized": True}
+            return get_engine().handle("text-generation", model_name)
         except Exception as e:
             print(f"Error initializing text generation: {str(e)}")
             return None
@@ -41,7 +53,7 @@ class AiUtils:
             A text classification object
         """
         try:
-            return {"model": model_name, "initialized": True}
+            return get_engine().handle("text-classification", model_name)
         except Exception as e:
             print(f"Error initializing text classification: {str(e)}")
             return None
@@ -58,7 +70,7 @@ class AiUtils:
             A zero-shot classification object
         """
         try:
-            return {"model": model_name, "initialized": True}
+            return get_engine().handle("zero-shot-classification", model_name)
         except Exception as e:
             print(f"Error initializing zero-shot classification: {str(e)}")
             return None
@@ -70,45 +82,14 @@ class AiUtils:
         
         Args:
             prompt: The input prompt to generate text from
-            generator: An optional text generation object (will be initialized if None)
+            generator: Unused; kept for compatibility with callers that pass a handle
             fallback: Fallback text to return if generation fails
             
         Returns:
             Generated text
         """
-        if generator is None:
-            generator = AiUtils.initialize_text_generation()
-        
-        if generator is None:
-            return fallback
-        
         try:
-            # Deterministic rule-based text generation using templates
-            governance_templates = {
-                "AI governance policies should include:": 
-                    "Data privacy protection, ethical guidelines, transparency requirements, compliance with regulations, risk assessment protocols, bias mitigation strategies, and regular audit mechanisms.",
-                
-                "Key principles for responsible AI:": 
-                    "Transparency, fairness, accountability, data privacy, human oversight, safety, and societal benefit.",
-                
-                "AI risk assessment framework:": 
-                    "Identify AI systems, assess potential risks, evaluate impact severity, determine likelihood, implement controls, monitor continuously, and review periodically.",
-                
-                "Compliance requirements for AI systems:": 
-                    "Data protection regulations, industry standards, ethical guidelines, transparency requirements, fairness assessments, and security protocols.",
-                
-                "AI monitoring best practices:": 
-                    "Real-time performance tracking, bias detection, explainability verification, data quality assessment, security monitoring, and compliance validation."
-            }
-            
-            # Find the closest template key to the prompt
-            best_match = fallback
-            for template_key, template_text in governance_templates.items():
-                if template_key in prompt or prompt in template_key:
-                    best_match = template_text
-                    break
-            
-            return best_match
+            return get_engine().generate_text(prompt, fallback)
         except Exception as e:
             print(f"Error generating text: {str(e)}")
             return fallback
@@ -121,60 +102,13 @@ class AiUtils:
         Args:
             text: The text to classify
             labels: List of possible labels
-            classifier: An optional classifier object (will be initialized if None)
+            classifier: Unused; kept for compatibility with callers that pass a handle
             
         Returns:
             A tuple of (label, confidence)
         """
-        if classifier is None:
-            classifier = AiUtils.initialize_zero_shot_classification()
-        
-        if classifier is None or not labels:
-            return (labels[0] if labels else "Unknown", 0.0)
-        
         try:
-            # Simple rule-based classification using keyword matching
-            text_lower = text.lower()
-            
-            # Dictionary of keywords associated with common governance categories
-            keyword_map = {
-                "privacy": ["privacy", "personal data", "confidential", "consent", "gdpr", "ccpa", "data protection"],
-                "security": ["security", "breach", "attack", "vulnerability", "threat", "encryption", "safeguard"],
-                "ethics": ["ethics", "moral", "fairness", "bias", "discrimination", "equity", "transparency", "explainable"],
-                "compliance": ["compliance", "regulation", "law", "requirement", "standard", "policy", "governance"],
-                "risk": ["risk", "hazard", "danger", "threat", "vulnerability", "exposure", "impact", "severity"],
-                "performance": ["performance", "accuracy", "precision", "recall", "efficiency", "effectiveness", "reliability"],
-                "transparency": ["transparency", "explainable", "interpretable", "understandable", "black box", "opaque"]
-            }
-            
-            # Count matches for each label
-            scores = []
-            for label in labels:
-                label_lower = label.lower()
-                # Extract the base category from the label
-                category = None
-                for key in keyword_map:
-                    if key in label_lower:
-                        category = key
-                        break
-                
-                if category:
-                    # Count keyword matches
-                    matches = sum(1 for keyword in keyword_map[category] if keyword in text_lower)
-                    # Calculate a confidence score based on matches
-                    confidence = min(0.5 + (matches * 0.1), 0.95)  # Cap at 0.95
-                else:
-                    # For labels without a keyword map, check for direct label appearances
-                    if label_lower in text_lower:
-                        confidence = 0.8
-                    else:
-                        confidence = 0.3
-                
-                scores.append((label, confidence))
-            
-            # Sort by confidence and return the best match
-            scores.sort(key=lambda x: x[1], reverse=True)
-            return scores[0]
+            return get_engine().classify_text(text, labels)
         except Exception as e:
             print(f"Error classifying text: {str(e)}")
             return (labels[0] if labels else "Unknown", 0.0)
@@ -187,64 +121,14 @@ class AiUtils:
         Args:
             text: The text to classify
             labels: List of possible labels
-            classifier: An optional classifier object (will be initialized if None)
+            classifier: Unused; kept for compatibility with callers that pass a handle
             threshold: Confidence threshold for including a label
             
         Returns:
             A list of (label, confidence) tuples for labels above the threshold
         """
-        if classifier is None:
-            classifier = AiUtils.initialize_zero_shot_classification()
-        
-        if classifier is None or not labels:
-            return []
-        
         try:
-            # Apply the same classification logic as classify_text but return multiple results
-            text_lower = text.lower()
-            
-            # Dictionary of keywords associated with common governance categories
-            keyword_map = {
-                "privacy": ["privacy", "personal data", "confidential", "consent", "gdpr", "ccpa", "data protection"],
-                "security": ["security", "breach", "attack", "vulnerability", "threat", "encryption", "safeguard"],
-                "ethics": ["ethics", "moral", "fairness", "bias", "discrimination", "equity", "transparency", "explainable"],
-                "compliance": ["compliance", "regulation", "law", "requirement", "standard", "policy", "governance"],
-                "risk": ["risk", "hazard", "danger", "threat", "vulnerability", "exposure", "impact", "severity"],
-                "performance": ["performance", "accuracy", "precision", "recall", "efficiency", "effectiveness", "reliability"],
-                "transparency": ["transparency", "explainable", "interpretable", "understandable", "black box", "opaque"],
-                "bias": ["bias", "fairness", "discrimination", "equity", "diversity", "inclusion", "representation"]
-            }
-            
-            # Calculate scores for each label
-            scores = []
-            for label in labels:
-                label_lower = label.lower()
-                # Extract the base category from the label
-                category = None
-                for key in keyword_map:
-                    if key in label_lower:
-                        category = key
-                        break
-                
-                if category:
-                    # Count keyword matches
-                    matches = sum(1 for keyword in keyword_map[category] if keyword in text_lower)
-                    # Calculate a confidence score based on matches
-                    confidence = min(0.5 + (matches * 0.1), 0.95)  # Cap at 0.95
-                else:
-                    # For labels without a keyword map, check for direct label appearances
-                    if label_lower in text_lower:
-                        confidence = 0.8
-                    else:
-                        confidence = 0.3
-                
-                scores.append((label, confidence))
-            
-            # Filter by threshold and sort by confidence
-            result = [item for item in scores if item[1] >= threshold]
-            result.sort(key=lambda x: x[1], reverse=True)
-            
-            return result
+            return get_engine().multi_label_classify(text, labels, threshold)
         except Exception as e:
             print(f"Error multi-label classifying text: {str(e)}")
             return []
@@ -252,8 +136,8 @@ class AiUtils:
     @staticmethod
     def extract_key_points(text: str, num_points: int = 3) -> List[str]:
         """
-        Extract key points from text using NLP techniques.
-        This is a simple implementation; a more sophisticated one would use a summarization model.
+        Extract key points from text using graph-based extractive summarization (TextRank).
+        The most central sentences are returned in document order.
         
         Args:
             text: The input text
@@ -262,22 +146,7 @@ class AiUtils:
         Returns:
             List of key points
         """
-        # Simple implementation - split text into sentences and return the first num_points
-        sentences = [s.strip() for s in text.replace('\n', ' ').split('.') if s.strip()]
-        
-        if len(sentences) <= num_points:
-            return sentences
-        
-        # For a simple implementation, return first, middle and last sentences
-        if num_points == 3 and len(sentences) > 4:
-            return [
-                sentences[0],
-                sentences[len(sentences) // 2],
-                sentences[-2]
-            ]
-        
-        # Otherwise return the first num_points sentences
-        return sentences[:num_points]
+        return get_engine().extract_key_points(text, num_points)
     
     @staticmethod
     def analyze_sentiment(text: str, classifier: Optional[Any] = None) -> Tuple[str, float]:
@@ -286,57 +155,78 @@ class AiUtils:
         
         Args:
             text: The text to analyze
-            classifier: An optional classifier object (will be initialized if None)
+            classifier: Unused; kept for compatibility with callers that pass a handle
             
         Returns:
             A tuple of (sentiment, confidence)
         """
-        if classifier is None:
-            classifier = AiUtils.initialize_text_classification()
-        
-        if classifier is None:
+        try:
+            return get_engine().analyze_sentiment(text)
+        except Exception as e:
+            print(f"Error analyzing sentiment: {str(e)}")
             return ("NEUTRAL", 0.5)
+    
+    @staticmethod
+    def get_cache_stats() -> Dict[str, Any]:
+        """
+        Get hit rates of the analysis result cache.
         
-        try:
-            # Simple rule-based sentiment analysis
-            text_lower = text.lower()
-            
-            # Lists of positive and negative keywords for governance context
-            positive_keywords = [
-                "compliant", "secure", "protected", "ethical", "transparent", "responsible", 
-                "trustworthy", "reliable", "fair", "unbiased", "robust", "accountable",
-                "verified", "validated", "safe", "beneficial", "effective", "improved",
-                "enhancement", "success", "strength", "advantage", "opportunity"
-            ]
+        Returns:
+            Dictionary of per-tier hits, misses and overall hit rate
+        """
+        return get_engine().cache_stats()
+    
+    @staticmethod
+    def classify_batch(texts: Iterable[str], labels: List[str], max_workers: Optional[int] = None,
+                       chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE) -> List[Tuple[str, float]]:
+        """
+        Classify many documents into one of the provided labels.
+        
+        Args:
+            texts: Iterable of documents to classify
+            labels: List of possible labels
+            max_workers: Maximum number of worker processes (defaults to the CPU count)
+            chunk_size: Number of documents per worker task
             
-            negative_keywords = [
-                "non-compliant", "insecure", "unprotected", "unethical", "opaque", "irresponsible",
-                "untrustworthy", "unreliable", "unfair", "biased", "weak", "unaccountable",
-                "unverified", "unvalidated", "unsafe", "harmful", "ineffective", "degraded",
-                "violation", "fail", "failure", "risk", "threat", "vulnerability", "issue", "concern"
-            ]
+        Returns:
+            A list of (label, confidence) tuples in input order
+        """
+        return get_engine().map_batch("classify_text", texts, (labels,), max_workers, chunk_size)
+    
+    @staticmethod
+    def multi_label_classify_batch(texts: Iterable[str], labels: List[str], threshold: float = 0.5,
+                                   max_workers: Optional[int] = None,
+                                   chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE) -> List[List[Tuple[str, float]]]:
+        """
+        Classify many documents with multiple possible labels.
+        
+        Args:
+            texts: Iterable of documents to classify
+            labels: List of possible labels
+            threshold: Confidence threshold for including a label
+            max_workers: Maximum number of worker processes (defaults to the CPU count)
+            chunk_size: Number of documents per worker task
             
-            # Count matches
-            positive_count = sum(1 for keyword in positive_keywords if keyword in text_lower)
-            negative_count = sum(1 for keyword in negative_keywords if keyword in text_lower)
+        Returns:
+            A list of (label, confidence) lists in input order
+        """
+        return get_engine().map_batch("multi_label_classify", texts, (labels, threshold), max_workers, chunk_size)
+    
+    @staticmethod
+    def analyze_sentiment_batch(texts: Iterable[str], max_workers: Optional[int] = None,
+                                chunk_size: int = DEFAULT_BATCH_CHUNK_SIZE) -> List[Tuple[str, float]]:
+        """
+        Analyze the sentiment of many documents.
+        
+        Args:
+            texts: Iterable of documents to analyze
+            max_workers: Maximum number of worker processes (defaults to the CPU count)
+            chunk_size: Number of documents per worker task
             
-            # Determine sentiment based on counts
-            if positive_count > negative_count:
-                score = min(0.5 + ((positive_count - negative_count) * 0.05), 0.95)
-                return ("POSITIVE", score)
-            elif negative_count > positive_count:
-                score = min(0.5 + ((negative_count - positive_count) * 0.05), 0.95)
-                return ("NEGATIVE", score)
-            else:
-                # If counts are equal, check for strong negative indicators
-                strong_negatives = ["risk", "violation", "fail", "threat"]
-                if any(neg in text_lower for neg in strong_negatives):
-                    return ("NEGATIVE", 0.6)
-                # Otherwise neutral
-                return ("NEUTRAL", 0.5)
-        except Exception as e:
-            print(f"Error analyzing sentiment: {str(e)}")
-            return ("NEUTRAL", 0.5)
+        Returns:
+            A list of (sentiment, confidence) tuples in input order
+        """
+        return get_engine().map_batch("analyze_sentiment", texts, (), max_workers, chunk_size)
 
 # Example usage
 if __name__ == "__main__":
@@ -0,0 +1,312 @@
+"""
+Content-addressed cache for AI analysis results.
+
+Results are keyed by a SHA-256 digest of the analysis kind, the analyzer version,
+the document text and any labels/parameters, so unchanged documentation never has
+to be analyzed twice. Lookups go to an in-memory LRU tier first and an on-disk
+SQLite tier second; disk hits are promoted back into memory. The memory tier
+keeps its own copies, so callers may modify the results they are given.
+
+The disk tier is pruned when the cache opens and after every PRUNE_EVERY_WRITES
+stored results: rows of other analyzer versions (which can never be looked up
+again), rows older than max_disk_age_days and the oldest rows beyond
+max_disk_entries are deleted.
+
+Inside batch_writes() the results stored by a thread are written to disk in one
+transaction when the block ends instead of one commit each.
+"""
+import os
+import copy
+import json
+import sqlite3
+import hashlib
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# Bump whenever the analysis rules change so stale results are never served
+ANALYZER_VERSION = "rule-based-2"
+
+DEFAULT_CACHE_PATH = os.environ.get('AI_ANALYSIS_CACHE_PATH', 'database/data/analysis_cache.db')
+DEFAULT_MEMORY_ENTRIES = int(os.environ.get('AI_ANALYSIS_CACHE_MEMORY_ENTRIES', 4096))
+DEFAULT_DISK_ENTRIES = int(os.environ.get('AI_ANALYSIS_CACHE_DISK_ENTRIES', 200000))
+DEFAULT_DISK_AGE_DAYS = float(os.environ.get('AI_ANALYSIS_CACHE_MAX_AGE_DAYS', 30))
+
+# Stored results between prunes of the disk tier
+PRUNE_EVERY_WRITES = 1000
+
+_MISSING = object()
+
+class AnalysisCache:
+    """Two-tier (memory LRU + SQLite) cache for analysis results."""
+
+    def __init__(self, db_path: Optional[str] = DEFAULT_CACHE_PATH, max_memory_entries: int = DEFAULT_MEMORY_ENTRIES,
+                 max_disk_entries: int = DEFAULT_DISK_ENTRIES, max_disk_age_days: float = DEFAULT_DISK_AGE_DAYS):
+        """
+        Initialize the cache.
+
+        Args:
+            db_path: Path of the SQLite file for the disk tier (None for memory only)
+            max_memory_entries: Maximum number of results kept in the memory tier
+            max_disk_entries: Maximum number of results kept in the disk tier
+            max_disk_age_days: Age after which results are pruned from the disk tier
+        """
+        self.db_path = db_path
+        self.max_memory_entries = max_memory_entries
+        self.max_disk_entries = max_disk_entries
+        self.max_disk_age = timedelta(days=max_disk_age_days)
+        self._writes_since_prune = 0
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+        # Per-thread list of (key, kind, value) entries awaiting a batched disk write
+        self._local = threading.local()
+
+        if db_path:
+            try:
+                os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+                self._conn = sqlite3.connect(db_path, check_same_thread=False)
+                # WAL keeps concurrent readers (e.g. batch worker processes) from blocking on writers
+                self._conn.execute('PRAGMA journal_mode=WAL')
+                self._conn.execute('PRAGMA synchronous=NORMAL')
+                self._conn.execute('''
+                CREATE TABLE IF NOT EXISTS analysis_cache (
+                    cache_key TEXT PRIMARY KEY,
+                    kind TEXT,
+                    value TEXT,
+                    created_at TEXT
+                )
+                ''')
+                # Caches written before versions were recorded get the column; their rows count as stale
+                columns = {row[1] for row in self._conn.execute('PRAGMA table_info(analysis_cache)')}
+                if 'analyzer_version' not in columns:
+                    self._conn.execute('ALTER TABLE analysis_cache ADD COLUMN analyzer_version TEXT')
+                self._conn.execute('CREATE INDEX IF NOT EXISTS idx_analysis_cache_created_at ON analysis_cache (created_at)')
+                self._conn.commit()
+            except sqlite3.Error as e:
+                print(f"Error opening analysis cache database, using memory only: {str(e)}")
+                self._conn = None
+            self.prune()
+
+    @staticmethod
+    def make_key(kind: str, text: str, labels: Iterable[str] = (), params: Iterable[Any] = ()) -> str:
+        """
+        Build the cache key for an analysis request.
+
+        Args:
+            kind: The analysis kind (e.g. "classify_text")
+            text: The analyzed document
+            labels: Candidate labels, in the order they were supplied
+            params: Any other parameters that influence the result
+
+        Returns:
+            Hex SHA-256 digest
+        """
+        digest = hashlib.sha256()
+        header = json.dumps([ANALYZER_VERSION, kind, list(labels), list(params)])
+        digest.update(header.encode('utf-8'))
+        digest.update(b'\0')
+        digest.update(text.encode('utf-8', 'surrogatepass'))
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Any:
+        """Return the cached value for a key, or None if it is not cached."""
+        value = self._lookup(key)
+        return None if value is _MISSING else value
+
+    def set(self, key: str, value: Any, kind: str = "") -> None:
+        """Store a JSON-serializable value in both tiers (on disk at the end of an enclosing batch_writes)."""
+        self._remember(key, value)
+        pending = getattr(self._local, 'pending', None)
+        if pending is not None:
+            pending.append((key, kind, value))
+        else:
+            self._write([(key, kind, value)])
+
+    def set_many(self, entries: Iterable[Tuple[str, str, Any]]) -> None:
+        """Store (key, kind, value) entries in both tiers, writing them to disk in one transaction."""
+        entries = list(entries)
+        for key, kind, value in entries:
+            self._remember(key, value)
+        self._write(entries)
+
+    @contextmanager
+    def batch_writes(self, write: bool = True) -> Iterator[List[Tuple[str, str, Any]]]:
+        """
+        Defer the disk writes of results stored by this thread until the block ends.
+
+        Args:
+            write: Write the deferred entries when the block ends; with False the caller
+                takes them from the yielded list (e.g. to send them to another process)
+
+        Yields:
+            The list of deferred (key, kind, value) entries
+        """
+        if getattr(self._local, 'pending', None) is not None:
+            # Nested: the outermost block writes everything
+            yield self._local.pending
+            return
+        pending: List[Tuple[str, str, Any]] = []
+        self._local.pending = pending
+        try:
+            yield pending
+        finally:
+            self._local.pending = None
+            if write:
+                self._write(pending)
+
+    def add_stats(self, counters: Dict[str, int]) -> None:
+        """Add hit/miss counters recorded elsewhere, e.g. by batch worker processes."""
+        with self._lock:
+            for name in self._stats:
+                self._stats[name] += counters.get(name, 0)
+
+    def get_or_compute(self, kind: str, text: str, compute: Callable[[], Any], labels: Iterable[str] = (),
+                       params: Iterable[Any] = (), decode: Optional[Callable[[Any], Any]] = None) -> Any:
+        """
+        Return a cached analysis result, computing and storing it on a miss.
+
+        Args:
+            kind: The analysis kind
+            text: The analyzed document
+            compute: Zero-argument callable producing the result
+            labels: Candidate labels
+            params: Other parameters that influence the result
+            decode: Optional converter applied to values read back from the cache
+                (JSON turns tuples into lists)
+
+        Returns:
+            The analysis result
+        """
+        key = self.make_key(kind, text, labels, params)
+        value = self._lookup(key)
+        if value is not _MISSING:
+            return decode(value) if decode else value
+
+        result = compute()
+        self.set(key, result, kind)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss counters for both tiers.
+
+        Returns:
+            Dictionary with per-tier hits, misses, lookups and hit rate
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats["memory_entries"] = len(self._memory)
+        # Lookups made by batch worker processes are included once their batch completes
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["lookups"] = lookups
+        stats["hit_rate"] = round((stats["memory_hits"] + stats["disk_hits"]) / lookups, 4) if lookups else 0.0
+        return stats
+
+    def clear(self) -> None:
+        """Remove all cached results and reset the counters."""
+        with self._lock:
+            self._memory.clear()
+            self._stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+            if self._conn is not None:
+                self._conn.execute('DELETE FROM analysis_cache')
+                self._conn.commit()
+
+    def _lookup(self, key: str) -> Any:
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                self._stats["memory_hits"] += 1
+                return copy.deepcopy(self._memory[key])
+
+            row = None
+            if self._conn is not None:
+                try:
+                    row = self._conn.execute(
+                        'SELECT value FROM analysis_cache WHERE cache_key = ?', (key,)
+                    ).fetchone()
+                except sqlite3.Error as e:
+                    print(f"Error reading analysis cache: {str(e)}")
+
+            if row is None:
+                self._stats["misses"] += 1
+                return _MISSING
+            self._stats["disk_hits"] += 1
+
+        value = json.loads(row[0])
+        self._remember(key, value)
+        return value
+
+    def prune(self) -> int:
+        """
+        Delete stale disk results: other analyzer versions, results older than the
+        maximum age and the oldest results beyond the maximum count.
+
+        Returns:
+            Number of results deleted
+        """
+        if self._conn is None:
+            return 0
+        cutoff = (datetime.now() - self.max_disk_age).isoformat()
+        try:
+            with self._lock:
+                self._writes_since_prune = 0
+                deleted = self._conn.execute(
+                    'DELETE FROM analysis_cache WHERE analyzer_version IS NOT ? OR created_at < ?',
+                    (ANALYZER_VERSION, cutoff)
+                ).rowcount
+                deleted += self._conn.execute(
+                    '''DELETE FROM analysis_cache WHERE rowid IN (
+                        SELECT rowid FROM analysis_cache ORDER BY created_at DESC LIMIT -1 OFFSET ?
+                    )''',
+                    (self.max_disk_entries,)
+                ).rowcount
+                self._conn.commit()
+            return deleted
+        except sqlite3.Error as e:
+            print(f"Error pruning analysis cache: {str(e)}")
+            return 0
+
+    def _write(self, entries: List[Tuple[str, str, Any]]) -> None:
+        if self._conn is None or not entries:
+            return
+        now = datetime.now().isoformat()
+        try:
+            with self._lock:
+                self._conn.executemany(
+                    '''INSERT OR REPLACE INTO analysis_cache (cache_key, kind, value, created_at, analyzer_version)
+                    VALUES (?, ?, ?, ?, ?)''',
+                    [(key, kind, json.dumps(value), now, ANALYZER_VERSION) for key, kind, value in entries]
+                )
+                self._conn.commit()
+                self._writes_since_prune += len(entries)
+                due = self._writes_since_prune >= PRUNE_EVERY_WRITES
+        except sqlite3.Error as e:
+            print(f"Error writing analysis cache: {str(e)}")
+            return
+        if due:
+            self.prune()
+
+    def _remember(self, key: str, value: Any) -> None:
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._memory[key] = value
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+
+def get_analysis_cache() -> AnalysisCache:
+    """Return the process-wide analysis cache, creating it on first use."""
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = AnalysisCache()
+    return _default_cache
@@ -27,7 +27,9 @@ GOVERNANCE_AGENT_CONFIG = {
         "Compliance",
         "Accountability",
         "Human Oversight"
-    ]
+    ],
+    # Policy packs up to this many policies are generated within the request; larger packs run as background jobs
+    "policy_pack_inline_limit": 64
 }
 
 RISK_ASSESSMENT_AGENT_CONFIG = {
@@ -40,6 +42,24 @@ RISK_ASSESSMENT_AGENT_CONFIG = {
         "Robustness Risk",
         "Safety Risk",
         "Compliance Risk"
+    ],
+    # Relative importance of each category in the overall risk score (normalized when scoring)
+    "category_weights": {
+        "Privacy Risk": 1.0,
+        "Bias Risk": 1.0,
+        "Security Risk": 1.0,
+        "Transparency Risk": 1.0,
+        "Accountability Risk": 1.0,
+        "Robustness Risk": 1.0,
+        "Safety Risk": 1.0,
+        "Compliance Risk": 1.0
+    },
+    # Minimum risk score (0-100) for each assessment status, highest first
+    "risk_levels": [
+        ("Critical Risk", 90.0),
+        ("High Risk", 75.0),
+        ("Medium Risk", 40.0),
+        ("Low Risk", 0.0)
     ]
 }
 
@@ -53,9 +73,27 @@ REPORTING_AGENT_CONFIG = {
         "Governance Summary",
         "Risk Assessment Overview",
         "Compliance Status",
-        "Comprehensive Governance Report"
+        "Comprehensive Governance Report",
+        "Compliance Trend Report"
     ],
-    "report_statuses": ["Draft", "Final", "Archived"]
+    "report_statuses": ["Draft", "Final", "Archived"],
+    # Sections built for each report type, in report order
+    "report_sections": {
+        "Governance Summary": ["governance_summary", "insights"],
+        "Risk Assessment Overview": ["risk_overview", "insights"],
+        "Compliance Status": ["compliance_status", "insights"],
+        "Comprehensive Governance Report": ["governance_summary", "risk_overview", "compliance_status", "insights"]
+    },
+    # Built sections kept for reuse while the data versions they were read at are current
+    "section_cache_size": 256,
+    # Sections of report types built from the daily rollups of a date range
+    "period_report_sections": {
+        "Compliance Trend Report": ["compliance_trend", "risk_trend"]
+    },
+    # Days covered by a period report generated on demand
+    "default_period_days": 30,
+    # Report schedule frequencies, in days between runs
+    "schedule_frequencies": {"daily": 1, "weekly": 7}
 }
 
 # UI Colors
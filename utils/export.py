@@ -0,0 +1,109 @@
+"""
+Streaming exports of table rows as CSV, JSON Lines (NDJSON) or Markdown.
+
+Every writer consumes an iterator of row dicts and yields text chunks of at most
+chunk_rows rows, so an export is produced in constant memory however many rows
+the iterator returns. Reports export to Markdown as documents; other tables
+export to Markdown as a table.
+"""
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, List
+
+# Export format -> (media type, file extension)
+EXPORT_FORMATS = {
+    "csv": ("text/csv", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "markdown": ("text/markdown", "md")
+}
+
+# Rows written per yielded chunk
+DEFAULT_CHUNK_ROWS = 200
+
+def stream_csv(columns: List[str], rows: Iterable[Dict[str, Any]], chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[str]:
+    """Yield a CSV document with a header row, chunk_rows rows at a time."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    pending = 0
+    for row in rows:
+        writer.writerow([row.get(column) for column in columns])
+        pending += 1
+        if pending >= chunk_rows:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate(0)
+            pending = 0
+    yield buffer.getvalue()
+
+def stream_ndjson(rows: Iterable[Dict[str, Any]], chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[str]:
+    """Yield one JSON object per line, chunk_rows lines at a time."""
+    lines = []
+    for row in rows:
+        lines.append(json.dumps(row, default=str))
+        if len(lines) >= chunk_rows:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+def _markdown_cell(value: Any) -> str:
+    if value is None:
+        return ""
+    return str(value).replace("|", "\\|").replace("\r", "").replace("\n", "<br>")
+
+def stream_markdown_table(columns: List[str], rows: Iterable[Dict[str, Any]],
+                          chunk_rows: int = DEFAULT_CHUNK_ROWS) -> Iterator[str]:
+    """Yield a Markdown table, chunk_rows rows at a time."""
+    lines = ["| " + " | ".join(columns) + " |", "|" + " --- |" * len(columns)]
+    for row in rows:
+        lines.append("| " + " | ".join(_markdown_cell(row.get(column)) for column in columns) + " |")
+        if len(lines) >= chunk_rows:
+            yield "\n".join(lines) + "\n"
+            lines = []
+    if lines:
+        yield "\n".join(lines) + "\n"
+
+def render_report_markdown(report: Dict[str, Any]) -> str:
+    """Render one report as a Markdown document: title, metadata, content and insights."""
+    content = (report.get("content") or "").strip()
+    # Generated reports start with their own title heading; keep it above the metadata line
+    if content.startswith("# "):
+        heading, _, content = content.partition("\n")
+        content = content.strip()
+    else:
+        heading = f"# {report.get('title') or 'Untitled Report'}"
+    parts = [heading, f"_{report.get('report_type') or 'Report'} · {report.get('status') or 'Draft'} · "
+                      f"created {(report.get('created_at') or '')[:10]}_"]
+    if content:
+        parts.append(content)
+    if report.get("insights"):
+        parts.append(report["insights"].strip())
+    return "\n\n".join(parts) + "\n"
+
+def stream_reports_markdown(rows: Iterable[Dict[str, Any]]) -> Iterator[str]:
+    """Yield each report as a Markdown document, separated by horizontal rules."""
+    for position, report in enumerate(rows):
+        yield ("\n---\n\n" if position else "") + render_report_markdown(report)
+
+def stream_export(table: str, columns: List[str], rows: Iterable[Dict[str, Any]], export_format: str) -> Iterator[str]:
+    """
+    Stream rows of a table in one of EXPORT_FORMATS.
+
+    Args:
+        table: Table the rows come from; reports export to Markdown as documents
+        columns: Column order for CSV and Markdown tables
+        rows: Row dicts, consumed lazily
+        export_format: A key of EXPORT_FORMATS
+
+    Raises:
+        ValueError: If the format is not supported
+    """
+    if export_format == "csv":
+        return stream_csv(columns, rows)
+    if export_format == "ndjson":
+        return stream_ndjson(rows)
+    if export_format == "markdown":
+        return stream_reports_markdown(rows) if table == "reports" else stream_markdown_table(columns, rows)
+    raise ValueError(f"Unsupported export format: {export_format}")
@@ -0,0 +1,228 @@
+"""
+MinHash / LSH index for near-duplicate policy detection.
+
+Each policy's content is reduced to a set of word 3-gram shingles and summarized
+by a MinHash signature, whose per-position agreement estimates the Jaccard
+similarity of two shingle sets. The signature is cut into bands; policies that
+agree on every row of at least one band land in the same bucket. Buckets are
+stored in SQLite with a (band, bucket) primary key, so finding candidates for a
+policy is a handful of index lookups instead of a scan of the whole library, and
+only those candidates have their signatures compared.
+
+The index tables live next to the policies and are updated in the same
+transaction as the policy write (see index_policy).
+"""
+import re
+import zlib
+import hashlib
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+# Signature length and banding: 16 bands x 8 rows puts the LSH threshold near a Jaccard similarity of 0.7
+NUM_PERMUTATIONS = 128
+NUM_BANDS = 16
+
+# Default minimum estimated similarity for a policy to be reported as a near-duplicate
+DEFAULT_SIMILARITY_THRESHOLD = 0.8
+
+_SHIFT = np.uint64(32)
+
+def shingles(text: str, size: int = 3) -> List[int]:
+    """Stable 32-bit hashes of the word n-grams of a text."""
+    tokens = TOKEN_PATTERN.findall(text.lower()) if text else []
+    if len(tokens) < size:
+        grams = [" ".join(tokens)] if tokens else []
+    else:
+        grams = [" ".join(gram) for gram in zip(*(tokens[i:] for i in range(size)))]
+    return list({zlib.crc32(gram.encode('utf-8')) for gram in grams})
+
+class MinHasher:
+    """Computes MinHash signatures and LSH band keys with a fixed set of hash permutations."""
+
+    def __init__(self, num_perm: int = NUM_PERMUTATIONS, num_bands: int = NUM_BANDS, seed: int = 1):
+        """
+        Initialize the hasher.
+
+        Args:
+            num_perm: Signature length
+            num_bands: Number of LSH bands (must divide num_perm)
+            seed: Seed of the permutations; signatures are only comparable for equal seeds
+        """
+        if num_perm % num_bands:
+            raise ValueError("num_perm must be a multiple of num_bands")
+        self.num_perm = num_perm
+        self.num_bands = num_bands
+        self.rows_per_band = num_perm // num_bands
+        rng = np.random.RandomState(seed)
+        # Multiply-shift hashing: h(x) = ((a * x + b) mod 2^64) >> 32 with odd a, one (a, b) per permutation
+        self._a = (rng.randint(1, 1 << 63, size=(num_perm, 1), dtype=np.uint64) << np.uint64(1)) | np.uint64(1)
+        self._b = rng.randint(0, 1 << 63, size=(num_perm, 1), dtype=np.uint64)
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """MinHash signature of a text, or None when it has no tokens."""
+        return self.signatures([text])[0]
+
+    def signatures(self, texts: Sequence[str], batch_shingles: int = 8000) -> List[Optional[np.ndarray]]:
+        """
+        MinHash signatures of many texts, computed over concatenated shingle batches.
+
+        Args:
+            texts: Documents to sign
+            batch_shingles: Approximate number of shingles hashed per NumPy batch
+
+        Returns:
+            One uint32 signature (or None for empty texts) per document
+        """
+        results: List[Optional[np.ndarray]] = [None] * len(texts)
+        batch, owners = [], []
+
+        def flush():
+            if not batch:
+                return
+            lengths = np.array([len(hashes) for hashes in batch])
+            values = np.fromiter((h for hashes in batch for h in hashes), dtype=np.uint64, count=int(lengths.sum()))
+            # Permutations x shingles, so each document's minimum is a contiguous reduction along the rows
+            permuted = self._a * values
+            permuted += self._b
+            permuted >>= _SHIFT
+            starts = np.concatenate(([0], np.cumsum(lengths)[:-1]))
+            minima = np.minimum.reduceat(permuted, starts, axis=1).T.astype(np.uint32)
+            for owner, row in zip(owners, minima):
+                results[owner] = row
+            batch.clear()
+            owners.clear()
+
+        pending = 0
+        for index, text in enumerate(texts):
+            hashes = shingles(text)
+            if not hashes:
+                continue
+            batch.append(hashes)
+            owners.append(index)
+            pending += len(hashes)
+            if pending >= batch_shingles:
+                flush()
+                pending = 0
+        flush()
+        return results
+
+    def band_keys(self, signature: np.ndarray) -> List[Tuple[int, int]]:
+        """(band, bucket) keys of a signature; bucket is a signed 64-bit digest of the band's rows."""
+        keys = []
+        for band in range(self.num_bands):
+            rows = signature[band * self.rows_per_band:(band + 1) * self.rows_per_band]
+            digest = hashlib.blake2b(rows.tobytes(), digest_size=8).digest()
+            keys.append((band, int.from_bytes(digest, 'big', signed=True)))
+        return keys
+
+    @staticmethod
+    def similarity(signature: np.ndarray, others: np.ndarray) -> np.ndarray:
+        """Estimated Jaccard similarity between one signature and each row of others."""
+        return (np.asarray(others) == signature).mean(axis=-1)
+
+
+_default_hasher = None
+
+def get_hasher() -> MinHasher:
+    """Return the shared MinHasher used for the stored policy index."""
+    global _default_hasher
+    if _default_hasher is None:
+        _default_hasher = MinHasher()
+    return _default_hasher
+
+def index_policy(cursor, policy_id: int, content: str, hasher: Optional[MinHasher] = None) -> None:
+    """
+    Store (or replace) a policy's signature and LSH buckets using the caller's cursor,
+    so the index changes commit or roll back together with the policy write.
+    """
+    hasher = hasher or get_hasher()
+    cursor.execute('DELETE FROM policy_lsh_buckets WHERE policy_id = ?', (policy_id,))
+    cursor.execute('DELETE FROM policy_minhash WHERE policy_id = ?', (policy_id,))
+    signature = hasher.signature(content)
+    if signature is None:
+        return
+    cursor.execute('INSERT INTO policy_minhash (policy_id, signature) VALUES (?, ?)', (policy_id, signature.tobytes()))
+    cursor.executemany(
+        'INSERT INTO policy_lsh_buckets (band, bucket, policy_id) VALUES (?, ?, ?)',
+        [(band, bucket, policy_id) for band, bucket in hasher.band_keys(signature)]
+    )
+
+def index_policies(cursor, policies: Sequence[Tuple[int, str]], hasher: Optional[MinHasher] = None) -> int:
+    """
+    Store signatures and buckets for many new policies at once, signing their contents in batches.
+
+    Args:
+        cursor: Cursor of the transaction that inserted the policies
+        policies: (policy_id, content) pairs of policies that are not indexed yet
+
+    Returns:
+        The number of policies indexed (policies without tokens are skipped)
+    """
+    hasher = hasher or get_hasher()
+    signatures = hasher.signatures([content or "" for _, content in policies])
+    indexed = [(policy_id, signature) for (policy_id, _), signature in zip(policies, signatures) if signature is not None]
+    cursor.executemany(
+        'INSERT INTO policy_minhash (policy_id, signature) VALUES (?, ?)',
+        [(policy_id, signature.tobytes()) for policy_id, signature in indexed]
+    )
+    cursor.executemany(
+        'INSERT INTO policy_lsh_buckets (band, bucket, policy_id) VALUES (?, ?, ?)',
+        ((band, bucket, policy_id) for policy_id, signature in indexed for band, bucket in hasher.band_keys(signature))
+    )
+    return len(indexed)
+
+def rebuild_policy_index(conn, hasher: Optional[MinHasher] = None) -> int:
+    """Recompute the signatures and buckets of every policy; returns the number indexed."""
+    cursor = conn.cursor()
+    cursor.execute('SELECT id, content FROM policies')
+    policies = [(row['id'], row['content']) if isinstance(row, dict) else tuple(row) for row in cursor.fetchall()]
+    cursor.execute('DELETE FROM policy_lsh_buckets')
+    cursor.execute('DELETE FROM policy_minhash')
+    indexed = index_policies(cursor, policies, hasher)
+    conn.commit()
+    cursor.close()
+    return indexed
+
+def find_near_duplicates(cursor, policy_id: int, threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+                         limit: int = 20) -> List[Dict[str, Any]]:
+    """
+    Find policies whose estimated content similarity to a policy is at least the threshold.
+
+    Args:
+        cursor: Cursor of a connection whose rows are dictionaries
+        policy_id: The policy to compare against
+        threshold: Minimum estimated Jaccard similarity
+        limit: Maximum number of results
+
+    Returns:
+        [{"policy_id", "similarity"}] ordered by similarity, most similar first
+    """
+    cursor.execute('SELECT signature FROM policy_minhash WHERE policy_id = ?', (policy_id,))
+    row = cursor.fetchone()
+    if row is None:
+        return []
+    signature = np.frombuffer(row['signature'], dtype=np.uint32)
+
+    # Candidates share at least one band bucket; both sides are primary-key/index lookups
+    cursor.execute(
+        '''SELECT DISTINCT other.policy_id, m.signature
+        FROM policy_lsh_buckets own
+        JOIN policy_lsh_buckets other ON other.band = own.band AND other.bucket = own.bucket
+        JOIN policy_minhash m ON m.policy_id = other.policy_id
+        WHERE own.policy_id = ? AND other.policy_id != ?''',
+        (policy_id, policy_id)
+    )
+    candidates = cursor.fetchall()
+    if not candidates:
+        return []
+    signatures = np.frombuffer(b''.join(c['signature'] for c in candidates), dtype=np.uint32).reshape(len(candidates), -1)
+    similarities = MinHasher.similarity(signature, signatures)
+    matches = [
+        {"policy_id": candidate['policy_id'], "similarity": round(float(similarity), 4)}
+        for candidate, similarity in zip(candidates, similarities) if similarity >= threshold
+    ]
+    matches.sort(key=lambda match: (-match["similarity"], match["policy_id"]))
+    return matches[:limit]
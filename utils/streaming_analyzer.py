@@ -0,0 +1,253 @@
+"""
+Streaming analysis for very large model documentation.
+
+StreamingDocumentAnalyzer consumes a document chunk by chunk and produces the
+same classification, sentiment and key-point results as the whole-text AiUtils
+methods, while holding only a bounded amount of text in memory:
+
+- keyword and label matching keeps an overlap of the previous chunk so phrases
+  split across a chunk boundary are still found, and only tracks which phrases
+  have been seen (the rules are presence based);
+- sentence splitting carries the unfinished sentence over to the next chunk;
+- key points are ranked with TextRank over a stride-decimated sample of the
+  sentences (plus the first and last ones); while the document fits in the
+  sample this is exactly the whole-text result.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from app.infrastructure.ai.analysis_engine import (
+    PHRASE_UNIVERSE, CLASSIFICATION_KEYWORDS, MULTI_LABEL_KEYWORDS,
+    score_labels, best_label, labels_above, score_sentiment
+)
+from utils.summarizer import summarize
+
+# Default number of characters read from a file per chunk
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+# An unterminated "sentence" longer than this is cut so a document without
+# full stops cannot grow the carried-over fragment without bound
+DEFAULT_MAX_SENTENCE_CHARS = 10000
+
+# Number of sentences retained for key-point ranking
+DEFAULT_SAMPLE_SIZE = 2048
+
+class _SentenceSample:
+    """Keeps every stride-th sentence, doubling the stride whenever capacity is exceeded."""
+
+    def __init__(self, capacity: int):
+        self.capacity = max(2, capacity)
+        self.stride = 1
+        self.items: List[Tuple[int, str]] = []
+
+    def add(self, index: int, sentence: str) -> None:
+        if index % self.stride:
+            return
+        self.items.append((index, sentence))
+        if len(self.items) > self.capacity:
+            self.stride *= 2
+            self.items = [item for item in self.items if item[0] % self.stride == 0]
+
+
+class StreamingDocumentAnalyzer:
+    """Incremental, memory-bounded counterpart of the AiUtils text analysis methods."""
+
+    def __init__(self, labels: Optional[List[str]] = None, num_points: int = 3,
+                 max_sentence_chars: int = DEFAULT_MAX_SENTENCE_CHARS, sample_size: int = DEFAULT_SAMPLE_SIZE):
+        """
+        Initialize the analyzer.
+
+        Args:
+            labels: Labels to classify the document against
+            num_points: Number of key points to extract
+            max_sentence_chars: Maximum length of a single sentence kept in memory
+            sample_size: Number of sentences sampled for key-point selection
+        """
+        self.labels = list(labels or [])
+        self.num_points = num_points
+        self.max_sentence_chars = max_sentence_chars
+
+        # Every phrase any rule may ask about: category keywords, sentiment keywords and raw labels
+        phrases = set(PHRASE_UNIVERSE)
+        phrases.update(label.lower() for label in self.labels)
+        self._pending_phrases = phrases
+        self._found_phrases = set()
+        self._overlap = max((len(phrase) for phrase in phrases), default=1) - 1
+
+        self._tail = ""
+        self._fragment = ""
+        self._closed = False
+
+        self.chars_processed = 0
+        self.sentence_count = 0
+        self._first_sentences: List[str] = []
+        self._last_sentences: List[Tuple[int, str]] = []
+        self._sample = _SentenceSample(sample_size)
+
+    def feed(self, chunk: str) -> None:
+        """
+        Process the next chunk of the document.
+
+        Args:
+            chunk: Consecutive text of the document (any size)
+        """
+        if self._closed:
+            raise ValueError("Cannot feed a closed StreamingDocumentAnalyzer")
+        if not chunk:
+            return
+        self.chars_processed += len(chunk)
+
+        # Phrase matching over the previous tail plus this chunk catches boundary-spanning phrases
+        lowered = chunk.lower()
+        window = self._tail + lowered
+        if self._pending_phrases:
+            found = {phrase for phrase in self._pending_phrases if phrase in window}
+            self._found_phrases |= found
+            self._pending_phrases -= found
+        self._tail = window[-self._overlap:] if self._overlap else ""
+
+        # Sentence splitting mirrors text.replace('\n', ' ').split('.')
+        pieces = (self._fragment + chunk.replace('\n', ' ')).split('.')
+        self._fragment = pieces.pop()
+        while len(self._fragment) > self.max_sentence_chars:
+            pieces.append(self._fragment[:self.max_sentence_chars])
+            self._fragment = self._fragment[self.max_sentence_chars:]
+        self._add_sentences(pieces)
+
+    def close(self) -> None:
+        """Flush the final unterminated sentence. Further feeds are rejected."""
+        if not self._closed:
+            self._add_sentences([self._fragment])
+            self._fragment = ""
+            self._closed = True
+
+    def contains(self, phrase: str) -> bool:
+        """Whether a lowercase phrase tracked by the analyzer appeared in the document."""
+        return phrase in self._found_phrases
+
+    def classify(self, labels: Optional[List[str]] = None) -> Tuple[str, float]:
+        """Equivalent of AiUtils.classify_text over the streamed document."""
+        labels = self._resolve_labels(labels)
+        if not labels:
+            return ("Unknown", 0.0)
+        return best_label(score_labels(labels, CLASSIFICATION_KEYWORDS, self.contains))
+
+    def multi_label_classify(self, labels: Optional[List[str]] = None, threshold: float = 0.5) -> List[Tuple[str, float]]:
+        """Equivalent of AiUtils.multi_label_classify over the streamed document."""
+        labels = self._resolve_labels(labels)
+        if not labels:
+            return []
+        scores = score_labels(labels, MULTI_LABEL_KEYWORDS, self.contains)
+        return labels_above(scores, threshold)
+
+    def analyze_sentiment(self) -> Tuple[str, float]:
+        """Equivalent of AiUtils.analyze_sentiment over the streamed document."""
+        return score_sentiment(self.contains)
+
+    def extract_key_points(self) -> List[str]:
+        """
+        Key points ranked with the same TextRank summarizer as AiUtils.extract_key_points.
+
+        The result is exact while the document has at most sample_size sentences;
+        beyond that the ranking runs over the sampled sentences.
+        """
+        candidates = dict(enumerate(self._first_sentences))
+        candidates.update(self._sample.items)
+        candidates.update(self._last_sentences)
+        return summarize([candidates[index] for index in sorted(candidates)], self.num_points)
+
+    def result(self, threshold: float = 0.5) -> Dict[str, Any]:
+        """
+        Close the analyzer and collect all results.
+
+        Args:
+            threshold: Confidence threshold for multi-label classification
+
+        Returns:
+            Dictionary with classification, labels, sentiment, key points and counters
+        """
+        self.close()
+        label, confidence = self.classify()
+        sentiment, sentiment_score = self.analyze_sentiment()
+        return {
+            "classification": {"label": label, "confidence": confidence},
+            "labels": self.multi_label_classify(threshold=threshold),
+            "sentiment": {"label": sentiment, "confidence": sentiment_score},
+            "key_points": self.extract_key_points(),
+            "chars_processed": self.chars_processed,
+            "sentence_count": self.sentence_count
+        }
+
+    def _resolve_labels(self, labels: Optional[List[str]]) -> List[str]:
+        if labels is None:
+            return self.labels
+        unknown = [label for label in labels if label.lower() not in self._found_phrases | self._pending_phrases]
+        if unknown:
+            raise ValueError(f"Labels must be passed to the constructor before streaming: {unknown}")
+        return labels
+
+    def _add_sentences(self, pieces: List[str]) -> None:
+        # Only the first, last and sampled sentences are kept, so the rest are just counted
+        sentences = [piece for piece in pieces if piece and not piece.isspace()]
+        if not sentences:
+            return
+        start = self.sentence_count
+        self.sentence_count += len(sentences)
+
+        needed = max(self.num_points, 1) - len(self._first_sentences)
+        if needed > 0:
+            self._first_sentences.extend(sentence.strip() for sentence in sentences[:needed])
+        tail = sentences[-2:]
+        last = [(self.sentence_count - len(tail) + offset, sentence.strip()) for offset, sentence in enumerate(tail)]
+        self._last_sentences = (self._last_sentences + last)[-2:]
+
+        index = start + (-start % self._sample.stride)
+        while index < self.sentence_count:
+            self._sample.add(index, sentences[index - start].strip())
+            index += self._sample.stride - (index % self._sample.stride)
+
+
+def analyze_stream(chunks: Iterable[str], labels: Optional[List[str]] = None, num_points: int = 3,
+                   threshold: float = 0.5) -> Dict[str, Any]:
+    """
+    Analyze a document supplied as an iterable of text chunks.
+
+    Args:
+        chunks: Iterable yielding consecutive pieces of the document
+        labels: Labels to classify the document against
+        num_points: Number of key points to extract
+        threshold: Confidence threshold for multi-label classification
+
+    Returns:
+        Dictionary of analysis results (see StreamingDocumentAnalyzer.result)
+    """
+    analyzer = StreamingDocumentAnalyzer(labels=labels, num_points=num_points)
+    for chunk in chunks:
+        analyzer.feed(chunk)
+    return analyzer.result(threshold=threshold)
+
+def iter_file_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, encoding: str = 'utf-8') -> Iterable[str]:
+    """Yield a text file in chunks of at most chunk_size characters."""
+    with open(path, 'r', encoding=encoding, errors='replace') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+def analyze_file(path: str, labels: Optional[List[str]] = None, num_points: int = 3, threshold: float = 0.5,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE, encoding: str = 'utf-8') -> Dict[str, Any]:
+    """
+    Analyze a documentation file without loading it into memory.
+
+    Args:
+        path: Path of the text file
+        labels: Labels to classify the document against
+        num_points: Number of key points to extract
+        threshold: Confidence threshold for multi-label classification
+        chunk_size: Number of characters read per chunk
+        encoding: File encoding
+
+    Returns:
+        Dictionary of analysis results (see StreamingDocumentAnalyzer.result)
+    """
+    return analyze_stream(iter_file_chunks(path, chunk_size, encoding), labels, num_points, threshold)
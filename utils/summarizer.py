@@ -0,0 +1,225 @@
+"""
+Graph-based extractive summarization (TextRank) for key point extraction.
+
+Sentences are represented as TF-IDF vectors and linked by cosine similarity.
+The similarity graph is built from an inverted index over a pruned vocabulary:
+terms that occur in only one sentence add no edges, and since every term costs
+work quadratic in its document frequency, terms are admitted rarest (highest
+IDF) first until a sentence-pair budget is spent. The graph is then sparsified
+to each sentence's top-k neighbours before the PageRank power iteration.
+NumPy is used when installed; a pure-Python path gives the same ranking
+otherwise.
+"""
+import math
+import re
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy ships with pandas in normal installs
+    np = None
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9\-]+")
+
+STOPWORDS = frozenset("""
+a about above after again all also an and any are as at be because been before being below between both but by
+can could did do does doing down during each few for from further had has have having he her here hers him his
+how i if in into is it its itself just may me might more most must my no nor not now of off on once only or other
+our ours out over own same shall she should so some such than that the their theirs them then there these they
+this those through to too under until up very was we were what when where which while who whom why will with
+would you your yours
+""".split())
+
+# Terms found in more than this share of sentences are dropped from the similarity graph
+DEFAULT_MAX_DF_RATIO = 0.2
+
+# Upper bound on sentence pairs generated from the inverted index
+DEFAULT_MAX_PAIRS = 500000
+
+# Each sentence keeps edges to at most this many most-similar sentences
+DEFAULT_TOP_K = 10
+
+DAMPING = 0.85
+MAX_ITERATIONS = 50
+TOLERANCE = 1e-6
+
+def split_sentences(text: str) -> List[str]:
+    """Split text into sentences the same way the rest of AiUtils does."""
+    return [s.strip() for s in text.replace('\n', ' ').split('.') if s.strip()]
+
+def tokenize(sentence: str) -> List[str]:
+    """Lowercase word tokens of a sentence with stopwords removed."""
+    return [token for token in TOKEN_PATTERN.findall(sentence.lower()) if token not in STOPWORDS]
+
+def _weighted_postings(sentences: Sequence[str], max_df_ratio: float,
+                       max_pairs: int) -> Tuple[Dict[str, List[Tuple[int, float]]], int]:
+    """
+    Build normalized TF-IDF postings for the pruned vocabulary.
+
+    Returns:
+        Mapping of term to [(sentence index, weight)] and the number of sentences
+    """
+    term_counts = [Counter(tokenize(sentence)) for sentence in sentences]
+    n = len(term_counts)
+    document_frequency = Counter()
+    for counts in term_counts:
+        document_frequency.update(counts.keys())
+
+    idf = {term: math.log((1 + n) / (1 + df)) + 1.0 for term, df in document_frequency.items()}
+    max_df = max(2, int(max_df_ratio * n))
+
+    vocabulary = set()
+    pairs = 0
+    for term, df in sorted(document_frequency.items(), key=lambda item: (item[1], item[0])):
+        if df < 2:
+            continue
+        pairs += df * (df - 1) // 2
+        if df > max_df or pairs > max_pairs:
+            break
+        vocabulary.add(term)
+
+    postings = defaultdict(list)
+    for index, counts in enumerate(term_counts):
+        if not counts:
+            continue
+        # Norm over the full vocabulary so pruning does not inflate similarities
+        weights = {term: (1 + math.log(tf)) * idf[term] for term, tf in counts.items()}
+        norm = math.sqrt(sum(w * w for w in weights.values()))
+        for term, weight in weights.items():
+            if term in vocabulary:
+                postings[term].append((index, weight / norm))
+    return postings, n
+
+def _top_k_edges_python(postings, n: int, top_k: int) -> List[Dict[int, float]]:
+    similarity = [defaultdict(float) for _ in range(n)]
+    for entries in postings.values():
+        for a in range(len(entries)):
+            i, wi = entries[a]
+            row = similarity[i]
+            for b in range(a + 1, len(entries)):
+                j, wj = entries[b]
+                row[j] += wi * wj
+
+    # Symmetric top-k: keep an edge if it is among the k best of either endpoint
+    neighbours = [dict() for _ in range(n)]
+    for i, row in enumerate(similarity):
+        for j, weight in row.items():
+            neighbours[i][j] = weight
+            neighbours[j][i] = weight
+    graph = [dict() for _ in range(n)]
+    for i, row in enumerate(neighbours):
+        for j, weight in sorted(row.items(), key=lambda item: (-item[1], item[0]))[:top_k]:
+            graph[i][j] = weight
+            graph[j][i] = weight
+    return graph
+
+def _pagerank_python(graph: List[Dict[int, float]]) -> List[float]:
+    n = len(graph)
+    out_weight = [sum(row.values()) for row in graph]
+    scores = [1.0 / n] * n
+    for _ in range(MAX_ITERATIONS):
+        dangling = sum(scores[i] for i in range(n) if out_weight[i] == 0) / n
+        updated = [(1 - DAMPING) / n + DAMPING * dangling] * n
+        for i, row in enumerate(graph):
+            if out_weight[i] == 0:
+                continue
+            share = DAMPING * scores[i] / out_weight[i]
+            for j, weight in row.items():
+                updated[j] += share * weight
+        delta = sum(abs(a - b) for a, b in zip(updated, scores))
+        scores = updated
+        if delta < TOLERANCE:
+            break
+    return scores
+
+def _rank_numpy(postings, n: int, top_k: int) -> List[float]:
+    # Flatten the postings; every pair of positions inside one term's run is a sentence pair
+    entries = [entry for term_entries in postings.values() if len(term_entries) > 1 for entry in term_entries]
+    run_lengths = np.fromiter((len(e) for e in postings.values() if len(e) > 1), dtype=np.int64)
+    idx = np.fromiter((e[0] for e in entries), dtype=np.int64, count=len(entries))
+    w = np.fromiter((e[1] for e in entries), dtype=np.float64, count=len(entries))
+    run_ends = np.repeat(np.cumsum(run_lengths), run_lengths)
+    positions = np.arange(len(entries))
+    partners = run_ends - positions - 1
+    left = np.repeat(positions, partners)
+    right = left + 1 + np.arange(partners.sum()) - np.repeat(np.cumsum(partners) - partners, partners)
+
+    scores = np.full(n, 1.0 / n)
+    if not len(left):
+        return scores.tolist()
+
+    # Sum contributions per sentence pair, then mirror to get both directions
+    rows, cols = idx[left], idx[right]
+    keys, inverse = np.unique(np.minimum(rows, cols) * n + np.maximum(rows, cols), return_inverse=True)
+    weights = np.bincount(inverse, weights=w[left] * w[right])
+    src = np.concatenate([keys // n, keys % n])
+    dst = np.concatenate([keys % n, keys // n])
+    weights = np.concatenate([weights, weights])
+
+    # Keep each sentence's top-k neighbours (ties broken by neighbour index), then symmetrize
+    order = np.lexsort((dst, -weights, src))
+    src, dst, weights = src[order], dst[order], weights[order]
+    starts = np.searchsorted(src, src, side='left')
+    keep = (np.arange(len(src)) - starts) < top_k
+    src, dst, weights = src[keep], dst[keep], weights[keep]
+    pair_keys, first = np.unique(np.minimum(src, dst) * n + np.maximum(src, dst), return_index=True)
+    low, high, pair_weights = pair_keys // n, pair_keys % n, weights[first]
+    src = np.concatenate([low, high])
+    dst = np.concatenate([high, low])
+    weights = np.concatenate([pair_weights, pair_weights])
+
+    out_weight = np.bincount(src, weights=weights, minlength=n)
+    dangling_mask = out_weight == 0
+    transfer = weights / out_weight[src]
+    for _ in range(MAX_ITERATIONS):
+        dangling = scores[dangling_mask].sum() / n
+        updated = np.bincount(dst, weights=scores[src] * transfer, minlength=n)
+        updated = (1 - DAMPING) / n + DAMPING * (updated + dangling)
+        delta = np.abs(updated - scores).sum()
+        scores = updated
+        if delta < TOLERANCE:
+            break
+    return scores.tolist()
+
+def rank_sentences(sentences: Sequence[str], top_k: int = DEFAULT_TOP_K, max_df_ratio: float = DEFAULT_MAX_DF_RATIO,
+                   max_pairs: int = DEFAULT_MAX_PAIRS, use_numpy: Optional[bool] = None) -> List[float]:
+    """
+    Compute TextRank centrality scores for a list of sentences.
+
+    Args:
+        sentences: The sentences to rank
+        top_k: Maximum number of neighbours kept per sentence
+        max_df_ratio: Terms in more than this share of sentences are ignored
+        max_pairs: Budget of sentence pairs generated while building the graph
+        use_numpy: Force the NumPy (True) or pure-Python (False) path; defaults to NumPy when available
+
+    Returns:
+        One score per sentence, in input order (scores sum to 1)
+    """
+    if not sentences:
+        return []
+    postings, n = _weighted_postings(sentences, max_df_ratio, max_pairs)
+    if use_numpy is None:
+        use_numpy = np is not None
+    if use_numpy:
+        return _rank_numpy(postings, n, top_k)
+    return _pagerank_python(_top_k_edges_python(postings, n, top_k))
+
+def summarize(sentences: Sequence[str], num_points: int = 3, **kwargs) -> List[str]:
+    """
+    Pick the most central sentences, returned in document order.
+
+    Args:
+        sentences: Candidate sentences
+        num_points: Number of sentences to return
+        **kwargs: Passed through to rank_sentences
+
+    Returns:
+        Up to num_points sentences
+    """
+    if len(sentences) <= num_points:
+        return list(sentences)
+    scores = rank_sentences(sentences, **kwargs)
+    best = sorted(range(len(sentences)), key=lambda i: (-round(scores[i], 12), i))[:num_points]
+    return [sentences[i] for i in sorted(best)]